@@ -0,0 +1,352 @@
+"""
+Offline microbenchmarks for Broker/AsyncBroker overhead.
+
+Every request is answered in-process: connector calls replay a cassette recorded from a
+synthetic vendor (see `pyapiary.api_connectors.replay`), and the throughput runs use an
+httpx.MockTransport that adds a fixed server latency. No network or API keys are needed.
+
+Measured:
+    overhead_us      per-call time of Broker.get / AsyncBroker.get vs raw httpx, with
+                     the tenacity wrapper (enable_backoff) and call tracing enabled
+    retry_path_us    a call whose first attempt gets a 503 and is retried at once
+    connectors       per-call time and memory (peak and retained bytes) for each connector
+    throughput_rps   requests/second at several concurrency levels, Broker.map (threads)
+                     vs AsyncBroker.gather_bounded (tasks)
+
+    python benchmarks/broker_overhead.py --quick
+    python benchmarks/broker_overhead.py --output bench.json
+    python benchmarks/broker_overhead.py --compare bench.json --tolerance 0.25   # exit 1 on regression
+
+The JSON report has sorted keys and rounded values so that two runs can be diffed.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import httpx  # noqa: E402
+
+from pyapiary.api_connectors import json_codec  # noqa: E402
+from pyapiary.api_connectors.broker import AsyncBroker, Broker  # noqa: E402
+from pyapiary.api_connectors.flashpoint import AsyncFlashpointConnector, FlashpointConnector  # noqa: E402
+from pyapiary.api_connectors.generic import AsyncGenericConnector, GenericConnector  # noqa: E402
+from pyapiary.api_connectors.ipqs import AsyncIPQSConnector, IPQSConnector  # noqa: E402
+from pyapiary.api_connectors.replay import RecordReplayTransport  # noqa: E402
+from pyapiary.api_connectors.spycloud import AsyncSpycloudConnector, SpycloudConnector  # noqa: E402
+from pyapiary.api_connectors.twilio import AsyncTwilioConnector, TwilioConnector  # noqa: E402
+from pyapiary.api_connectors.urlscan import AsyncURLScanConnector, URLScanConnector  # noqa: E402
+
+SCHEMA = 1
+BASE_URL = "https://vendor.invalid"
+# A typical small JSON answer (~1 KB)
+PAYLOAD = {"results": [{"id": i, "domain": f"host-{i}.example.com", "score": i / 10} for i in range(16)]}
+
+# name -> (sync factory, async factory, call); `call(conn)` returns a response or an awaitable
+CONNECTORS: Dict[str, Tuple[Callable[..., Any], Callable[..., Any], Callable[[Any], Any]]] = {
+    "urlscan": (URLScanConnector, AsyncURLScanConnector, lambda c: c.search("domain:example.com")),
+    "spycloud": (
+        lambda **kw: SpycloudConnector(sip_key="bench", ato_key="bench", inv_key="bench", **kw),
+        lambda **kw: AsyncSpycloudConnector(sip_key="bench", ato_key="bench", inv_key="bench", **kw),
+        lambda c: c.ato_search("ip", "192.0.2.1"),
+    ),
+    "ipqs": (IPQSConnector, AsyncIPQSConnector, lambda c: c.malicious_url("http://example.com")),
+    "twilio": (
+        lambda **kw: TwilioConnector(api_sid="bench", api_secret="bench", **kw),
+        lambda **kw: AsyncTwilioConnector(api_sid="bench", api_secret="bench", **kw),
+        lambda c: c.lookup_phone("+15555550100"),
+    ),
+    "flashpoint": (FlashpointConnector, AsyncFlashpointConnector, lambda c: c.search_fraud("bench")),
+    "generic": (
+        lambda **kw: GenericConnector(base_url=BASE_URL, **kw),
+        lambda **kw: AsyncGenericConnector(base_url=BASE_URL, **kw),
+        lambda c: c.request("GET", "/items"),
+    ),
+}
+
+
+def _origin(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=PAYLOAD)
+
+
+def _key_kwargs(name: str) -> Dict[str, Any]:
+    return {"api_key": "bench"} if name in ("urlscan", "ipqs", "flashpoint") else {}
+
+
+def _median_per_call(run_batch: Callable[[int], None], iterations: int, repeat: int) -> float:
+    """Median over `repeat` batches of the per-call time, in microseconds."""
+    run_batch(max(10, iterations // 10))  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_batch(iterations)
+        samples.append((time.perf_counter() - start) / iterations * 1e6)
+    return statistics.median(samples)
+
+
+def _sync_batch(call: Callable[[], Any]) -> Callable[[int], None]:
+    def run(n: int) -> None:
+        for _ in range(n):
+            call()
+    return run
+
+
+def _async_batch(call: Callable[[], Awaitable[Any]]) -> Callable[[int], None]:
+    loop = asyncio.new_event_loop()
+
+    async def many(n: int) -> None:
+        for _ in range(n):
+            await call()
+
+    def run(n: int) -> None:
+        loop.run_until_complete(many(n))
+    return run
+
+
+def bench_overhead(iterations: int, repeat: int) -> Dict[str, float]:
+    transport = httpx.MockTransport(_origin)
+    results: Dict[str, float] = {}
+
+    client = httpx.Client(transport=transport)
+    results["httpx.Client.get"] = _median_per_call(_sync_batch(lambda: client.get(f"{BASE_URL}/items")), iterations, repeat)
+
+    variants = {
+        "Broker.get": {},
+        "Broker.get+backoff": {"enable_backoff": True},
+        "Broker.get+tracer": {"call_tracer": lambda record: None},
+    }
+    for name, options in variants.items():
+        broker = Broker(base_url=BASE_URL, **options)
+        broker.session = httpx.Client(transport=transport)
+        results[name] = _median_per_call(_sync_batch(lambda: broker.get("/items")), iterations, repeat)
+
+    aclient = httpx.AsyncClient(transport=transport)
+    results["httpx.AsyncClient.get"] = _median_per_call(
+        _async_batch(lambda: aclient.get(f"{BASE_URL}/items")), iterations, repeat
+    )
+    for name, options in variants.items():
+        abroker = AsyncBroker(base_url=BASE_URL, **options)
+        abroker.session = httpx.AsyncClient(transport=transport)
+        results["Async" + name] = _median_per_call(_async_batch(lambda: abroker.get("/items")), iterations, repeat)
+
+    # log_method_call on a decorated connector method, with and without a tracer
+    for name, options in (("URLScanConnector.search", {}), ("URLScanConnector.search+tracer", {"call_tracer": lambda r: None})):
+        conn = URLScanConnector(api_key="bench", **options)
+        conn.session = httpx.Client(transport=transport)
+        results[name] = _median_per_call(_sync_batch(lambda: conn.search("q")), iterations, repeat)
+    return results
+
+
+def bench_retry_path(iterations: int, repeat: int) -> Dict[str, float]:
+    """Cost of one failed attempt plus an immediate retry (no backoff sleep)."""
+    attempts = {"n": 0}
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        attempts["n"] += 1
+        return httpx.Response(503 if attempts["n"] % 2 else 200, json=PAYLOAD)
+
+    transport = httpx.MockTransport(flaky)
+    retry_kwargs = {"wait": lambda state: 0}
+    broker = Broker(base_url=BASE_URL, enable_backoff=True)
+    broker.session = httpx.Client(transport=transport)
+    abroker = AsyncBroker(base_url=BASE_URL, enable_backoff=True)
+    abroker.session = httpx.AsyncClient(transport=transport)
+    return {
+        "Broker": _median_per_call(_sync_batch(lambda: broker.get("/items", retry_kwargs=retry_kwargs)), iterations, repeat),
+        "AsyncBroker": _median_per_call(
+            _async_batch(lambda: abroker.get("/items", retry_kwargs=retry_kwargs)), iterations, repeat
+        ),
+    }
+
+
+def _recorded_cassette() -> RecordReplayTransport:
+    """Record one call per connector from the synthetic origin, then switch to replay."""
+    cassette = RecordReplayTransport(mode="once", transport=httpx.MockTransport(_origin))
+    for name, (sync_factory, _, call) in CONNECTORS.items():
+        conn = sync_factory(**_key_kwargs(name))
+        conn.session = httpx.Client(transport=cassette)
+        call(conn)
+    cassette.mode = "replay"
+    return cassette
+
+
+def _memory(call: Callable[[], Any], samples: int) -> Dict[str, float]:
+    for _ in range(10):
+        call()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(samples):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(samples):
+            call()
+        gc.collect()
+        retained = (tracemalloc.get_traced_memory()[0] - baseline) / samples
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes": statistics.median(peaks), "retained_bytes": max(0.0, retained)}
+
+
+def bench_connectors(iterations: int, repeat: int, memory_samples: int) -> Dict[str, Dict[str, float]]:
+    cassette = _recorded_cassette()
+    results: Dict[str, Dict[str, float]] = {}
+    for name, (sync_factory, async_factory, call) in CONNECTORS.items():
+        conn = sync_factory(**_key_kwargs(name))
+        conn.session = httpx.Client(transport=cassette)
+        aconn = async_factory(**_key_kwargs(name))
+        aconn.session = httpx.AsyncClient(transport=cassette)
+        loop = asyncio.new_event_loop()
+        try:
+            results[name] = {
+                "sync_us": _median_per_call(_sync_batch(lambda: call(conn)), iterations, repeat),
+                "async_us": _median_per_call(_async_batch(lambda: call(aconn)), iterations, repeat),
+                **{f"sync_{k}": v for k, v in _memory(lambda: call(conn), memory_samples).items()},
+                **{
+                    f"async_{k}": v
+                    for k, v in _memory(lambda: loop.run_until_complete(call(aconn)), memory_samples).items()
+                },
+            }
+        finally:
+            loop.close()
+    return results
+
+
+def bench_throughput(requests: int, latency: float, levels: List[int]) -> Dict[str, Dict[str, float]]:
+    def slow(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, json=PAYLOAD)
+
+    async def aslow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json=PAYLOAD)
+
+    results: Dict[str, Dict[str, float]] = {"Broker": {}, "AsyncBroker": {}}
+    paths = [f"/items/{i}" for i in range(requests)]
+    for level in levels:
+        broker = Broker(base_url=BASE_URL)
+        broker.session = httpx.Client(transport=httpx.MockTransport(slow))
+        start = time.perf_counter()
+        for _ in broker.map("get", paths, max_workers=level):
+            pass
+        results["Broker"][str(level)] = requests / (time.perf_counter() - start)
+
+        async def run_async() -> float:
+            abroker = AsyncBroker(base_url=BASE_URL)
+            abroker.session = httpx.AsyncClient(transport=httpx.MockTransport(aslow))
+            begin = time.perf_counter()
+            async for _ in abroker.gather_bounded("get", paths, concurrency=level):
+                pass
+            return requests / (time.perf_counter() - begin)
+
+        results["AsyncBroker"][str(level)] = asyncio.run(run_async())
+    return results
+
+
+def _round(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _round(v) for k, v in value.items()}
+    if isinstance(value, float):
+        return float(f"{value:.4g}")
+    return value
+
+
+def _flatten(report: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for key, value in report.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path + "."))
+        elif isinstance(value, (int, float)):
+            flat[path] = float(value)
+    return flat
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return the metrics that got worse by more than `tolerance` (a fraction)."""
+    old, new = _flatten(baseline["results"]), _flatten(current["results"])
+    regressions = []
+    for metric in sorted(old.keys() & new.keys()):
+        if old[metric] <= 0:
+            continue
+        change = (new[metric] - old[metric]) / old[metric]
+        if metric.startswith("throughput_rps."):
+            change = -change
+        marker = ""
+        if change > tolerance:
+            marker = "  REGRESSION"
+            regressions.append(metric)
+        print(f"{metric:<55} {old[metric]:>12.4g} -> {new[metric]:>12.4g}  {change:+7.1%}{marker}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for CI smoke runs")
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=None)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="simulated server latency for throughput")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before failing --compare")
+    args = parser.parse_args()
+
+    iterations = args.iterations or (200 if args.quick else 2000)
+    repeat = args.repeat or (3 if args.quick else 5)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    requests = 100 if args.quick else 500
+
+    report = {
+        "schema": SCHEMA,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "httpx": httpx.__version__,
+            "json_backend": json_codec.backend,
+            "iterations": iterations,
+            "repeat": repeat,
+            "latency_ms": args.latency_ms,
+        },
+        "results": _round({
+            "overhead_us": bench_overhead(iterations, repeat),
+            "retry_path_us": bench_retry_path(iterations, repeat),
+            "connectors": bench_connectors(iterations, repeat, memory_samples=min(iterations, 200)),
+            "throughput_rps": bench_throughput(requests, args.latency_ms / 1000, levels),
+        }),
+    }
+    encoded = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(encoded + "\n")
+    else:
+        print(encoded)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if baseline.get("schema") != SCHEMA:
+            print(f"Baseline schema {baseline.get('schema')} does not match {SCHEMA}", file=sys.stderr)
+            return 2
+        regressions = compare(baseline, report, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
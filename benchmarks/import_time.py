@@ -0,0 +1,73 @@
+"""
+Import-time benchmark for pyapiary.
+
+Each target is imported in a fresh interpreter several times; the median wall time and
+the heavy third-party modules the import pulled in are reported.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --budget-ms 150   # exit 1 if over budget
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+HEAVY_MODULES = ("httpx", "tenacity", "dotenv", "elasticsearch", "pymongo", "pyodbc")
+
+TARGETS = {
+    "pyapiary": "import pyapiary",
+    "ipqs": "from pyapiary import ipqs",
+    "mongo": "from pyapiary import mongo",
+    "elasticsearch": "from pyapiary import elasticsearch",
+    "splunk": "from pyapiary import splunk",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def measure(statement: str, repeat: int = 5) -> Dict[str, object]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")]))}
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    runs: List[float] = []
+    modules: List[str] = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout)
+        runs.append(result["seconds"])
+        modules = result["modules"]
+    return {"median_ms": statistics.median(runs) * 1000, "heavy_modules": modules}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if `import pyapiary` is slower")
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    args = parser.parse_args()
+
+    report = {name: measure(statement, args.repeat) for name, statement in TARGETS.items()}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, result in report.items():
+            print(f"{name:<15} {result['median_ms']:8.1f} ms   {', '.join(result['heavy_modules']) or '-'}")
+
+    if args.budget_ms is not None and report["pyapiary"]["median_ms"] > args.budget_ms:
+        print(f"import pyapiary exceeded {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Load-test scheduling settings against the bundled vendor simulator.
+
+Each scenario drives one connector through `Broker.map` (threads) or
+`AsyncBroker.gather_bounded` (tasks) against `VendorSimulator`, which injects latency,
+per-key 429s with Retry-After, random 5xx and periodic outages. For every connector and
+scenario the report gives:
+
+    throughput      successful calls per second (wall clock)
+    success_rate    fraction of calls that ended with a usable answer
+    requests        requests the simulated vendor received, including retries
+    wasted          requests answered with a 429/quota error or a 5xx
+
+    python benchmarks/load_test.py                          # all connectors and scenarios
+    python benchmarks/load_test.py --connectors urlscan,ipqs --scenarios backoff,paced --calls 500
+    python benchmarks/load_test.py --json > load.json
+    python benchmarks/load_test.py --serve 8080             # just run the simulator on a local port
+
+The simulator runs `--speed` times faster than real time (latencies, rate windows and
+Retry-After all shrink), so the default run takes a few seconds per scenario. The
+connector's own backoff after a 5xx without Retry-After still sleeps in real time, which
+makes scenarios that retry 5xx look slower than they would against the real vendor.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import httpx  # noqa: E402
+
+from pyapiary.api_connectors.flashpoint import AsyncFlashpointConnector, FlashpointConnector  # noqa: E402
+from pyapiary.api_connectors.ipqs import AsyncIPQSConnector, IPQSConnector, is_quota_exceeded  # noqa: E402
+from pyapiary.api_connectors.rate_limit import RateLimiter  # noqa: E402
+from pyapiary.api_connectors.simulator import VendorProfile, VendorSimulator  # noqa: E402
+from pyapiary.api_connectors.spycloud import AsyncSpycloudConnector, SpycloudConnector  # noqa: E402
+from pyapiary.api_connectors.twilio import AsyncTwilioConnector, TwilioConnector  # noqa: E402
+from pyapiary.api_connectors.urlscan import AsyncURLScanConnector, URLScanConnector  # noqa: E402
+
+# Default profiles with the faults switched on: a slow tail, 2% random 5xx and a short
+# outage every minute, on top of each vendor's per-key rate limit
+LOAD_PROFILES = {
+    "urlscan": VendorProfile(latency=0.3, slow_rate=0.02, slow_latency=3.0, error_rate=0.02,
+                             outage_every=60, outage_duration=3, rate=2, burst=10),
+    "spycloud": VendorProfile(latency=0.15, slow_rate=0.02, slow_latency=2.0, error_rate=0.02,
+                              outage_every=60, outage_duration=3, rate=10, burst=10),
+    "flashpoint": VendorProfile(latency=0.4, slow_rate=0.02, slow_latency=4.0, error_rate=0.02,
+                                outage_every=60, outage_duration=3, rate=5, burst=5),
+    "ipqs": VendorProfile(latency=0.1, error_rate=0.02, outage_every=60, outage_duration=3, rate=20, burst=20),
+    "twilio": VendorProfile(latency=0.08, error_rate=0.02, outage_every=60, outage_duration=3, rate=100, burst=100),
+}
+
+# name -> (sync class, async class, constructor kwargs, method name, query -> args)
+CONNECTORS: Dict[str, Tuple[Any, Any, Dict[str, Any], str, Callable[[int], Tuple[Any, ...]]]] = {
+    "urlscan": (URLScanConnector, AsyncURLScanConnector, {"api_key": "load"}, "search",
+                lambda i: (f"domain:host-{i}.example.com",)),
+    "spycloud": (SpycloudConnector, AsyncSpycloudConnector, {"ato_key": "load"}, "ato_search",
+                 lambda i: ("ip", f"192.0.2.{i % 256}")),
+    "flashpoint": (FlashpointConnector, AsyncFlashpointConnector, {"api_key": "load"}, "search_fraud",
+                   lambda i: (f"query {i}",)),
+    "ipqs": (IPQSConnector, AsyncIPQSConnector, {"api_key": "load"}, "malicious_url",
+             lambda i: (f"http://host-{i}.example.com/",)),
+    "twilio": (TwilioConnector, AsyncTwilioConnector, {"api_sid": "load", "api_secret": "load"}, "lookup_phone",
+               lambda i: (f"+1555{i:07d}",)),
+}
+
+# name -> (async?, connector kwargs given the vendor profile and simulator speed)
+SCENARIOS: Dict[str, Tuple[bool, Callable[[VendorProfile, float], Dict[str, Any]]]] = {
+    "naive": (False, lambda profile, speed: {}),
+    "backoff": (False, lambda profile, speed: {"enable_backoff": True}),
+    "paced": (False, lambda profile, speed: {
+        "enable_backoff": True,
+        "rate_limit": RateLimiter(rate=profile.rate * speed, burst=profile.burst) if profile.rate else None,
+    }),
+    "async_backoff": (True, lambda profile, speed: {"enable_backoff": True}),
+    "async_adaptive": (True, lambda profile, speed: {"enable_backoff": True, "adaptive_concurrency": True}),
+}
+
+
+def _succeeded(result: Any) -> bool:
+    return result.ok and not is_quota_exceeded(result.response)
+
+
+def run_scenario(
+    connector: str,
+    scenario: str,
+    calls: int,
+    concurrency: int,
+    speed: float,
+    seed: int,
+) -> Dict[str, float]:
+    sync_cls, async_cls, init_kwargs, method, args_for = CONNECTORS[connector]
+    profile = LOAD_PROFILES[connector]
+    is_async, options = SCENARIOS[scenario]
+    sim = VendorSimulator(LOAD_PROFILES, speed=speed, seed=seed)
+    kwargs = {**init_kwargs, **options(profile, speed), "timeout": 30}
+    queries = [args_for(i) for i in range(calls)]
+
+    start = time.perf_counter()
+    if is_async:
+        async def drive() -> List[Any]:
+            async with async_cls(transport=sim.async_transport(), **kwargs) as conn:
+                call = getattr(conn, method)
+                return [r async for r in conn.gather_bounded(lambda args: call(*args), queries, concurrency=concurrency)]
+        results = asyncio.run(drive())
+    else:
+        with sync_cls(transport=sim.transport(), **kwargs) as conn:
+            call = getattr(conn, method)
+            results = list(conn.map(lambda args: call(*args), queries, max_workers=concurrency))
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum(1 for r in results if _succeeded(r))
+    served = sim.stats()[connector]
+    return {
+        "calls": calls,
+        "succeeded": succeeded,
+        "success_rate": round(succeeded / calls, 4),
+        "seconds": round(elapsed, 3),
+        "throughput": round(succeeded / elapsed, 2),
+        "requests": served["requests"],
+        "wasted": served["wasted"],
+        "wasted_ratio": round(served["wasted"] / served["requests"], 4) if served["requests"] else 0.0,
+    }
+
+
+def serve(port: int, speed: float) -> int:
+    with VendorSimulator(LOAD_PROFILES, speed=speed).serve(port=port) as server:
+        print(f"Simulator listening on {server.url}; use base_urls=[server_url + '/<vendor host>']")
+        for vendor, base in (("urlscan", "https://urlscan.io"), ("twilio", "https://lookups.twilio.com/v2")):
+            print(f"  e.g. {vendor}: {server.base_url_for(base)}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connectors", default=",".join(CONNECTORS), help="comma-separated connector names")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenario names")
+    parser.add_argument("--calls", type=int, default=200, help="calls per connector and scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--speed", type=float, default=20.0, help="simulated seconds per real second")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print a JSON report instead of a table")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="only run the simulator on a local port")
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        return serve(args.serve, args.speed)
+
+    connectors = [c for c in args.connectors.split(",") if c]
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = (set(connectors) - set(CONNECTORS)) | (set(scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown connector or scenario: {', '.join(sorted(unknown))}")
+
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+    if not args.json:
+        print(f"{'connector':<12}{'scenario':<16}{'calls/s':>9}{'success':>9}{'requests':>10}{'wasted':>8}{'seconds':>9}")
+    for connector in connectors:
+        report[connector] = {}
+        for scenario in scenarios:
+            row = run_scenario(connector, scenario, args.calls, args.concurrency, args.speed, args.seed)
+            report[connector][scenario] = row
+            if not args.json:
+                print(
+                    f"{connector:<12}{scenario:<16}{row['throughput']:>9.1f}{row['success_rate']:>9.1%}"
+                    f"{row['requests']:>10}{row['wasted']:>8}{row['seconds']:>9.2f}"
+                )
+    if args.json:
+        print(json.dumps({
+            "settings": {"calls": args.calls, "concurrency": args.concurrency, "speed": args.speed, "seed": args.seed},
+            "httpx": httpx.__version__,
+            "results": report,
+        }, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,39 @@
-# API connectors
-from pyapiary.api_connectors import (
-    urlscan,
-    spycloud,
-    twilio,
-    flashpoint,
-    ipqs,
-    generic,
-)
-
-# DBMS connectors
-from pyapiary.dbms_connectors import (
-    elasticsearch,
-    mongo,
-    odbc,
-    splunk
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Connector modules are imported on first attribute access (PEP 562), so e.g.
+# `from pyapiary import ipqs` does not pull in elasticsearch or pymongo.
+_SUBMODULES = {
+    # API connectors
+    "urlscan": "pyapiary.api_connectors.urlscan",
+    "spycloud": "pyapiary.api_connectors.spycloud",
+    "twilio": "pyapiary.api_connectors.twilio",
+    "flashpoint": "pyapiary.api_connectors.flashpoint",
+    "ipqs": "pyapiary.api_connectors.ipqs",
+    "generic": "pyapiary.api_connectors.generic",
+    # DBMS connectors
+    "elasticsearch": "pyapiary.dbms_connectors.elasticsearch",
+    "mongo": "pyapiary.dbms_connectors.mongo",
+    "odbc": "pyapiary.dbms_connectors.odbc",
+    "splunk": "pyapiary.dbms_connectors.splunk",
+}
+
+if TYPE_CHECKING:
+    from pyapiary.api_connectors import urlscan, spycloud, twilio, flashpoint, ipqs, generic
+    from pyapiary.dbms_connectors import elasticsearch, mongo, odbc, splunk
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(_SUBMODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
+
 
 # Export the modules and re-exports
 __all__ = [
@@ -28,4 +47,4 @@ __all__ = [
     "spycloud",
     "twilio",
     "urlscan",
-]
\ No newline at end of file
+]
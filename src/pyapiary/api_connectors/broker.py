@@ -1,34 +1,71 @@
+from abc import ABC, abstractmethod
+
 import httpx
 from httpx import Auth
-from typing import Optional, Dict, Any, Union, Iterable, Callable, ParamSpec, TypeVar, Type
-from tenacity import retry, stop_after_attempt, wait_exponential, RetryError, retry_if_exception, AsyncRetrying
-from pyapiary.helpers import setup_logger, combine_env_configs
-from functools import wraps
+from typing import (
+    Optional, Dict, List, Mapping, Any, Union, Iterable, Iterator, AsyncIterator, Awaitable, Callable, Sequence, Tuple,
+    Type,
+)
+from tenacity import retry, stop_after_attempt, RetryError, RetryCallState, retry_if_exception, AsyncRetrying
+from pyapiary.helpers import setup_logger, combine_env_configs, match_endpoint_prefix
+from pyapiary.api_connectors.bulk import BulkResult, aiter_bulk, iter_bulk
+from pyapiary.api_connectors.cache import ResponseCache, request_fingerprint
+from pyapiary.api_connectors.checkpoint import Journal, Shard, arun_resumable, run_resumable
+from pyapiary.api_connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+    is_outage_failure,
+)
+from pyapiary.api_connectors.coalesce import AsyncSingleFlight, SingleFlight
+from pyapiary.api_connectors.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    _use_deadline,
+    current_deadline,
+    earliest,
+    wait_within_deadline,
+)
+from pyapiary.api_connectors.endpoints import EndpointPool, as_endpoint_pool
+from pyapiary.api_connectors.hedging import HedgePolicy, ahedged_call, hedged_call
+from pyapiary.api_connectors.concurrency import AdaptiveConcurrencyLimiter
+from pyapiary.api_connectors import json_codec
+from pyapiary.api_connectors.metrics import AttemptTimer, MetricsRegistry, get_default_registry
+from pyapiary.api_connectors.rate_limit import RateLimitSpec, as_limiters, refund_all, reserve_all
+from pyapiary.api_connectors.retry import wait_retry_after
+from pyapiary.api_connectors.ssl_context import resolve_verify
+from pyapiary.api_connectors.streaming import ChunkSink, DownloadResult, PathOrFile
+from pyapiary.api_connectors.tracing import CallTracer, log_method_call
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager, nullcontext
+import asyncio
+import importlib.util
 import inspect
 import os
+import threading
+import time
 from types import TracebackType
 
 
-P = ParamSpec("P")
-R = TypeVar("R")
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+# Per-scheme/host transports, keyed by URL pattern (e.g. "https://"). Values may also be
+# proxy URL strings, which are turned into the broker's transport type.
+MountsSpec = Dict[str, Union[str, httpx.BaseTransport, httpx.AsyncBaseTransport, None]]
 
-def log_method_call(func: Callable[P, R]) -> Callable[P, R]:
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        caller = func.__name__
-        sig = inspect.signature(func)
-        bound = sig.bind(self, *args, **kwargs)
-        bound.apply_defaults()
-        query_value = bound.arguments.get("query")
-        self._log(f"{caller} called with query: {query_value}")
-        return func(self, *args, **kwargs)
-    return wrapper
+# Failures that mean an attempt ran out of time; once the call's deadline has passed
+# they are reported as DeadlineExceeded
+_TIMEOUTS = (httpx.TimeoutException, asyncio.TimeoutError)
 
 
 def bubble_broker_init_signature(*, exclude: Iterable[str] = ("base_url",)):
     """
     Class decorator that augments a connector subclass' __init__ signature with
-    parameters from Broker.__init__ for better IDE/tab-completion hints.
+    parameters from Broker.__init__ (AsyncBroker.__init__ for async connectors) for
+    better IDE/tab-completion hints.
 
     Usage:
         from pyapiary.api_connectors.broker import Broker, bubble_broker_init_signature
@@ -48,7 +85,7 @@ def bubble_broker_init_signature(*, exclude: Iterable[str] = ("base_url",)):
     """
     def _decorate(cls):
         sub_init = cls.__init__
-        broker_init = Broker.__init__
+        broker_init = AsyncBroker.__init__ if issubclass(cls, AsyncBroker) else Broker.__init__
 
         sub_sig = inspect.signature(sub_init)
         broker_sig = inspect.signature(broker_init)
@@ -90,10 +127,11 @@ def bubble_broker_init_signature(*, exclude: Iterable[str] = ("base_url",)):
     return _decorate
 
 
-class SharedConnectorBase:
+class SharedConnectorBase(ABC):
     """
     Shared base class for Broker and AsyncBroker.
-    Houses reusable logic (constructor, logging, proxy config, retry predicate).
+    Houses reusable logic (constructor, logging, proxy config, retry predicate, rate limiting,
+    response caching, request coalescing, circuit breaking, metrics).
     """
     def __init__(
         self,
@@ -101,11 +139,28 @@ class SharedConnectorBase:
         headers: Optional[Dict[str, str]] = None,
         enable_logging: bool = False,
         enable_backoff: bool = False,
-        timeout: int = 10,
+        timeout: Union[float, httpx.Timeout] = 10,
         load_env_vars: bool = False,
         trust_env: bool = True,
         proxy: Optional[str] = None,
-        mounts: Optional[Dict[str, httpx.HTTPTransport]] = None,
+        mounts: Optional[MountsSpec] = None,
+        rate_limit: Optional[RateLimitSpec] = None,
+        endpoint_rate_limits: Optional[Dict[str, RateLimitSpec]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[Union[bool, CircuitBreaker]] = None,
+        retry_budget: Optional[Union[bool, RetryBudget]] = None,
+        metrics: Optional[Union[bool, MetricsRegistry]] = None,
+        call_tracer: Optional[CallTracer] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        hedging: Optional[Union[bool, float, HedgePolicy]] = None,
+        deadline: Optional[float] = None,
+        base_urls: Optional[Union[Sequence[str], Mapping[str, float], EndpointPool]] = None,
         **client_kwargs,
     ):
         self.base_url = base_url.rstrip('/')
@@ -117,23 +172,429 @@ class SharedConnectorBase:
         self.proxy = proxy
         self.mounts = mounts
         self.env_config = combine_env_configs() if load_env_vars else {}
+        self.rate_limit = as_limiters(rate_limit)
+        self.endpoint_rate_limits = {
+            prefix.lstrip("/"): as_limiters(spec)
+            for prefix, spec in (endpoint_rate_limits or {}).items()
+        }
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        # Alternative base URLs (regions, caching proxies); `base_url` stays the canonical
+        # one for cache keys and coalescing
+        self.endpoint_pool = as_endpoint_pool(base_urls)
+        # With an endpoint pool, circuit_breaker=True gives every base URL its own shared
+        # breaker, so an outage of one endpoint does not block requests to the others
+        self._endpoint_breakers: Dict[str, CircuitBreaker] = {}
+        if circuit_breaker is True and self.endpoint_pool is not None:
+            self._endpoint_breakers = {url: get_circuit_breaker(url) for url in self.endpoint_pool.urls}
+            circuit_breaker = None
+        elif circuit_breaker is True:
+            circuit_breaker = get_circuit_breaker(self.base_url)
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker or None
+        if retry_budget is True:
+            retry_budget = get_retry_budget()
+        self.retry_budget: Optional[RetryBudget] = retry_budget or None
+        if metrics is True:
+            metrics = get_default_registry()
+        self.metrics: Optional[MetricsRegistry] = metrics or None
+        self.call_tracer = call_tracer
+        if http2 and not _h2_available():
+            raise ImportError("http2=True requires the 'h2' package; install it with `pip install httpx[http2]`")
+        self.http2 = http2
+        self.limits = limits
+        self._timeout_overrides = {
+            "connect": connect_timeout,
+            "read": read_timeout,
+            "write": write_timeout,
+            "pool": pool_timeout,
+        }
+        if hedging is True:
+            hedging = HedgePolicy()
+        elif isinstance(hedging, (int, float)) and not isinstance(hedging, bool):
+            hedging = HedgePolicy(delay=float(hedging))
+        self.hedging: Optional[HedgePolicy] = hedging or None
+        self.deadline = deadline
         self._client_kwargs = dict(client_kwargs) if client_kwargs else {}
+        # Used when a request passes no `auth`; connectors with pooled API keys set this
+        self.default_auth: Optional[Auth] = None
+        self._client_args: Dict[str, Any] = {}
+        self._session: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        """
+        The underlying httpx client, built on first use so that connectors which never
+        send a request cost next to nothing to construct.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    @session.setter
+    def session(self, value: Any) -> None:
+        self._session = value
+
+    @abstractmethod
+    def _create_session(self) -> Any:
+        ...
+
+    def _verify(self, http2: bool = False) -> Any:
+        """
+        The `verify` value for clients and proxy transports: a process-wide SSLContext
+        shared by connectors with the same TLS settings, unless the caller supplied
+        their own context or a client certificate.
+        """
+        verify = self._client_kwargs.get("verify", True)
+        if "cert" in self._client_kwargs:
+            return verify
+        return resolve_verify(verify, self.trust_env, http2)
+
+    def _session_args(self) -> Dict[str, Any]:
+        return {**self._client_args, "verify": self._verify(bool(self._client_args.get("http2")))}
+
+    def _httpx_timeout(self) -> Union[float, httpx.Timeout]:
+        """`timeout` with any connect/read/write/pool overrides applied."""
+        overrides = {phase: value for phase, value in self._timeout_overrides.items() if value is not None}
+        if not overrides:
+            return self.timeout
+        base = self.timeout if isinstance(self.timeout, httpx.Timeout) else httpx.Timeout(self.timeout)
+        return httpx.Timeout(**{**base.as_dict(), **overrides})
+
+    def _base_client_args(self) -> Dict[str, Any]:
+        client_options = dict(self._client_kwargs)
+        client_options.pop("timeout", None)
+        client_args = {
+            "timeout": self._httpx_timeout(),
+            "trust_env": self.trust_env,
+            **client_options,
+        }
+        if self.http2:
+            client_args["http2"] = True
+        if self.limits is not None:
+            client_args["limits"] = self.limits
+        return client_args
+
+    def _proxy_transport(self, transport_cls: Type[Any], proxy: str) -> Any:
+        return transport_cls(proxy=proxy, verify=self._verify())
 
     def _log(self, message: str):
         if self.logger:
             self.logger.info(message)
 
-    def _collect_proxy_config(self) -> tuple[Optional[str], Optional[Dict[str, httpx.HTTPTransport]]]:
-        source_env: Optional[Dict[str, str]] = None
-        if isinstance(self.env_config, dict) and len(self.env_config) > 0:
-            source_env = {k: v for k, v in self.env_config.items() if isinstance(k, str) and isinstance(v, str)}
+    def _rate_limit_delay(self, endpoint: str, deadline: Optional[Deadline] = None) -> float:
+        """
+        Reserve a slot on the connector-wide and endpoint-specific rate limiters and
+        return how long the caller must wait before sending the request. If the wait would
+        outlast `deadline`, the slots are given back and DeadlineExceeded is raised.
+        """
+        if not self.rate_limit and not self.endpoint_rate_limits:
+            if deadline is not None:
+                deadline.check()
+            return 0.0
+        limiters = self.rate_limit + (match_endpoint_prefix(self.endpoint_rate_limits, endpoint) or [])
+        delay = reserve_all(limiters)
+        if deadline is not None and deadline.remaining() <= delay:
+            refund_all(limiters)
+            raise deadline.exceeded()
+        if delay > 0:
+            self._log(f"Rate limit reached, delaying request to {endpoint} by {delay:.3f}s")
+        return delay
+
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        if self.cache is None or not self.cache.is_cacheable_request(method):
+            return None
+        return self.cache.make_key(method, url, params, json)
+
+    def _cache_lookup(self, cache_key: Optional[str], url: str) -> Optional[httpx.Response]:
+        """
+        Return a cached response for `cache_key`, if any. Cached 404s are re-raised as
+        httpx.HTTPStatusError so callers see the same behavior as a live request.
+        """
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        self._log(f"Cache hit for {url}")
+        try:
+            cached.raise_for_status()
+        except httpx.HTTPStatusError as he:
+            self._log(f"HTTP error: {he}")
+            raise
+        return cached
+
+    def _cache_store(self, cache_key: Optional[str], endpoint: str, response: Optional[httpx.Response]) -> None:
+        if cache_key is not None and response is not None:
+            self.cache.set(cache_key, endpoint, response)
+
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        if not self.coalesce_requests or method.upper() != "GET":
+            return None
+        return request_fingerprint(method, url, params, json)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of requests that were served by an identical in-flight request."""
+        return self._singleflight.coalesced
+
+    def _call_deadline(self, seconds: Optional[float]) -> Optional[Deadline]:
+        """The earliest of the per-call, per-connector and `with_deadline` deadlines."""
+        return earliest(
+            Deadline(seconds) if seconds is not None else None,
+            Deadline(self.deadline) if self.deadline is not None else None,
+            current_deadline(),
+        )
+
+    def _attempt_kwargs(self, deadline: Optional[Deadline], request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Request kwargs with the attempt's timeout shortened to what is left of `deadline`."""
+        if deadline is None:
+            return request_kwargs
+        timeout = request_kwargs.get("timeout", self._httpx_timeout())
+        return {**request_kwargs, "timeout": deadline.attempt_timeout(timeout)}
+
+    def _pick_base_url(self, tried: Sequence[str] = ()) -> str:
+        if self.endpoint_pool is None:
+            return self.base_url
+        return self.endpoint_pool.choose(exclude=tried)
+
+    def _choose_endpoint(self, tried: List[str]) -> Tuple[str, bool]:
+        """
+        Pick the base URL for the next attempt, skipping endpoints whose circuit breaker is
+        open while untried ones remain. Also returns whether the attempt is a half-open trial.
+        """
+        while True:
+            base = self._pick_base_url(tried)
+            breaker = self._endpoint_breakers.get(base)
+            try:
+                return base, breaker is not None and breaker.before_request()
+            except CircuitOpenError:
+                tried.append(base)
+                if all(url in tried for url in self.endpoint_pool.urls):
+                    raise
+
+    def _release_endpoint(self, base: str, trial: bool) -> None:
+        """Free the endpoint breaker's trial slot for an attempt that ended without an outcome."""
+        if trial:
+            self._endpoint_breakers[base].release_trial()
+
+    def _record_endpoint(self, base: str, start: float, failed: bool, tried: List[str]) -> None:
+        """Update the endpoint's health; a failed endpoint is avoided by later attempts of the same call."""
+        self.endpoint_pool.record(base, time.perf_counter() - start, failed)
+        breaker = self._endpoint_breakers.get(base)
+        if breaker is not None:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if failed:
+            tried.append(base)
+
+    @staticmethod
+    def _merge_tried(tried: List[str], copies: Iterable[List[str]]) -> None:
+        """Fold the endpoints excluded by each copy of a hedged attempt back into the call's list."""
+        for copy_tried in copies:
+            tried.extend(base for base in list(copy_tried) if base not in tried)
+
+    def _can_fail_over(self, exc: BaseException, tried: List[str]) -> bool:
+        """True when the request never reached the server and another endpoint is available."""
+        return isinstance(exc, httpx.ConnectError) and self.endpoint_pool.available(exclude=tried)
+
+    def _routed_send(self, endpoint: str, tried: List[str], send: Callable[[str], httpx.Response]) -> httpx.Response:
+        """Send to the best base URL, failing over immediately when a connection cannot be made."""
+        if self.endpoint_pool is None:
+            return send(f"{self.base_url}/{endpoint.lstrip('/')}")
+        while True:
+            base, trial = self._choose_endpoint(tried)
+            start = time.perf_counter()
+            try:
+                resp = send(f"{base}/{endpoint.lstrip('/')}")
+            except Exception as exc:
+                self._record_endpoint(base, start, is_outage_failure(exc), tried)
+                if self._can_fail_over(exc, tried):
+                    continue
+                raise
+            except BaseException:
+                self._release_endpoint(base, trial)
+                raise
+            self._record_endpoint(base, start, resp.status_code >= 500, tried)
+            return resp
+
+    async def _arouted_send(
+        self,
+        endpoint: str,
+        tried: List[str],
+        send: Callable[[str], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async counterpart of `_routed_send`."""
+        if self.endpoint_pool is None:
+            return await send(f"{self.base_url}/{endpoint.lstrip('/')}")
+        while True:
+            base, trial = self._choose_endpoint(tried)
+            start = time.perf_counter()
+            try:
+                resp = await send(f"{base}/{endpoint.lstrip('/')}")
+            except Exception as exc:
+                self._record_endpoint(base, start, is_outage_failure(exc), tried)
+                if self._can_fail_over(exc, tried):
+                    continue
+                raise
+            except BaseException:
+                self._release_endpoint(base, trial)
+                raise
+            self._record_endpoint(base, start, resp.status_code >= 500, tried)
+            return resp
+
+    def _hedge_policy(self, method: str) -> Optional[HedgePolicy]:
+        if self.hedging is None or not self.hedging.applies_to(method):
+            return None
+        return self.hedging
+
+    def _before_attempt(self) -> bool:
+        """Check the circuit breaker right before sending; True if this attempt is a half-open trial."""
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker.before_request()
+        return False
+
+    def _abandon_attempt(self, trial: bool) -> None:
+        """Free the breaker's trial slot for an attempt that ended without an outcome (e.g. cancelled)."""
+        if trial:
+            self.circuit_breaker.release_trial()
+
+    def _attempt_timer(self) -> Optional[AttemptTimer]:
+        return AttemptTimer() if self.metrics is not None else None
+
+    @staticmethod
+    def _with_trace(timer: Optional[AttemptTimer], request_kwargs: Dict[str, Any], is_async: bool) -> Dict[str, Any]:
+        return request_kwargs if timer is None else timer.inject(request_kwargs, is_async)
+
+    def _after_attempt(
+        self,
+        exc: Optional[BaseException],
+        method: str = "",
+        endpoint: str = "",
+        timer: Optional[AttemptTimer] = None,
+        response: Optional[httpx.Response] = None,
+    ) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(exc)
+        if timer is not None:
+            self.metrics.record_attempt(
+                self.__class__.__name__,
+                method,
+                endpoint,
+                time.perf_counter() - timer.start,
+                response=response,
+                exc=exc,
+                timer=timer,
+            )
+
+    def _record_retry(self, method: str, endpoint: str, retry_state: RetryCallState) -> None:
+        if self.metrics is not None:
+            self.metrics.record_retry(self.__class__.__name__, method, endpoint, retry_state.upcoming_sleep)
+
+    def _budgeted_retry(
+        self,
+        predicate: Callable[[RetryCallState], bool],
+        stop: Callable[[RetryCallState], bool],
+    ) -> Callable[[RetryCallState], bool]:
+        """
+        Wrap a tenacity retry predicate so retries also need room in the retry budget.
+        tenacity asks the predicate before the stop condition, so the final failed
+        attempt is let through uncharged and `stop` ends the call as usual.
+        """
+        budget = self.retry_budget
+        if budget is None:
+            return predicate
+
+        def should_retry(retry_state: RetryCallState) -> bool:
+            if not predicate(retry_state):
+                return False
+            if stop(retry_state):
+                return True
+            if budget.try_retry():
+                return True
+            self._log("Retry budget exhausted, not retrying")
+            return False
+        return should_retry
+
+    @staticmethod
+    def _body_kwargs(json: Optional[Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Build the headers/body arguments for a request. JSON bodies are pre-encoded with
+        the fast codec when one is installed; otherwise httpx encodes them as usual.
+        """
+        if json is None or not json_codec.has_fast_backend():
+            return {"headers": headers, "json": json}
+        if not any(k.lower() == "content-type" for k in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+        return {"headers": headers, "content": json_codec.dumps(json)}
+
+    @staticmethod
+    def response_json(response: httpx.Response) -> Any:
+        """
+        Decode a response body as JSON using orjson/msgspec when available; a faster
+        drop-in replacement for `response.json()`.
+        """
+        return json_codec.response_json(response)
+
+    def _build_mounts(self, mounts: MountsSpec, transport_cls: Type[Any]) -> MountsSpec:
+        """
+        Turn proxy URL strings in `mounts` into `transport_cls` transports; transports and
+        None (which disables a pattern) are kept as given. AsyncBroker passes
+        httpx.AsyncHTTPTransport and rejects sync-only transports, which an
+        httpx.AsyncClient cannot drive.
+        """
+        built: Dict[str, Any] = {}
+        for pattern, value in mounts.items():
+            if isinstance(value, str):
+                value = self._proxy_transport(transport_cls, value)
+            elif (
+                transport_cls is httpx.AsyncHTTPTransport
+                and value is not None
+                and not isinstance(value, httpx.AsyncBaseTransport)
+            ):
+                raise TypeError(
+                    f"Mount for {pattern!r} is a synchronous {type(value).__name__}; "
+                    "AsyncBroker needs httpx.AsyncHTTPTransport (or a proxy URL string)"
+                )
+            built[pattern] = value
+        return built
+
+    def _collect_proxy_config(
+        self,
+        transport_cls: Type[Any] = httpx.HTTPTransport,
+    ) -> tuple[Optional[str], Optional[MountsSpec]]:
+        source_env: Mapping[str, Any]
+        if self.env_config:
+            source_env = self.env_config
         elif self.trust_env:
-            source_env = dict(os.environ)
+            source_env = os.environ
         else:
             return None, None
 
         def _get(key: str) -> Optional[str]:
-            return source_env.get(key) or source_env.get(key.lower())
+            for name in (key, key.lower()):
+                value = source_env.get(name)
+                if isinstance(value, str) and value:
+                    return value
+            return None
 
         all_proxy = _get("ALL_PROXY")
         http_proxy = _get("HTTP_PROXY")
@@ -141,8 +602,8 @@ class SharedConnectorBase:
 
         if http_proxy and https_proxy and http_proxy != https_proxy:
             return None, {
-                "http://": httpx.HTTPTransport(proxy=http_proxy),
-                "https://": httpx.HTTPTransport(proxy=https_proxy),
+                "http://": self._proxy_transport(transport_cls, http_proxy),
+                "https://": self._proxy_transport(transport_cls, https_proxy),
             }
         single = all_proxy or https_proxy or http_proxy
         if single:
@@ -175,11 +636,28 @@ class Broker(SharedConnectorBase):
         headers: Optional[Dict[str, str]] = None,
         enable_logging: bool = False,
         enable_backoff: bool = False,
-        timeout: int = 10,
+        timeout: Union[float, httpx.Timeout] = 10,
         load_env_vars: bool = False,
         trust_env: bool = True,
         proxy: Optional[str] = None,
-        mounts: Optional[Dict[str, httpx.HTTPTransport]] = None,
+        mounts: Optional[MountsSpec] = None,
+        rate_limit: Optional[RateLimitSpec] = None,
+        endpoint_rate_limits: Optional[Dict[str, RateLimitSpec]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[Union[bool, CircuitBreaker]] = None,
+        retry_budget: Optional[Union[bool, RetryBudget]] = None,
+        metrics: Optional[Union[bool, MetricsRegistry]] = None,
+        call_tracer: Optional[CallTracer] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        hedging: Optional[Union[bool, float, HedgePolicy]] = None,
+        deadline: Optional[float] = None,
+        base_urls: Optional[Union[Sequence[str], Mapping[str, float], EndpointPool]] = None,
         **client_kwargs,
     ):
         super().__init__(
@@ -192,24 +670,35 @@ class Broker(SharedConnectorBase):
             trust_env=trust_env,
             proxy=proxy,
             mounts=mounts,
+            rate_limit=rate_limit,
+            endpoint_rate_limits=endpoint_rate_limits,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            metrics=metrics,
+            call_tracer=call_tracer,
+            http2=http2,
+            limits=limits,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            hedging=hedging,
+            deadline=deadline,
+            base_urls=base_urls,
             **client_kwargs,
         )
 
-        client_options = dict(self._client_kwargs)
-        client_options.pop("timeout", None)
-
-        client_args = {
-            "timeout": self.timeout,
-            "trust_env": self.trust_env,
-            **client_options,
-        }
+        client_args = self._base_client_args()
 
         if self.mounts:
+            self.mounts = self._build_mounts(self.mounts, httpx.HTTPTransport)
             client_args["mounts"] = self.mounts
         elif self.proxy:
             client_args["proxy"] = self.proxy
         else:
-            env_proxy, env_mounts = self._collect_proxy_config()
+            env_proxy, env_mounts = self._collect_proxy_config(httpx.HTTPTransport)
             if env_mounts:
                 self.mounts = env_mounts
                 client_args["mounts"] = self.mounts
@@ -219,7 +708,11 @@ class Broker(SharedConnectorBase):
             elif not self.trust_env:
                 client_args["trust_env"] = False
 
-        self.session = httpx.Client(**client_args)
+        self._client_args = client_args
+        self._singleflight = SingleFlight()
+
+    def _create_session(self) -> httpx.Client:
+        return httpx.Client(**self._session_args())
 
     def __enter__(self) -> "Broker":
         return self
@@ -230,7 +723,8 @@ class Broker(SharedConnectorBase):
         exc: Optional[BaseException],
         tb: Optional[TracebackType],
     ) -> None:
-        self.session.close()
+        if self._session is not None:
+            self._session.close()
 
     def _make_request(
         self,
@@ -241,43 +735,111 @@ class Broker(SharedConnectorBase):
         auth: Optional[Union[tuple, Auth]] = None,
         headers: Optional[Dict[str, str]] = None,
         retry_kwargs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
         **request_kwargs,
     ) -> httpx.Response:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
+        cache_key = self._cache_key(method, url, params, json)
+        cached = self._cache_lookup(cache_key, url)
+        if cached is not None:
+            return cached
+
         def do_request() -> httpx.Response:
-            resp = self.session.request(
-                method=method,
-                url=url,
-                headers=headers or self.headers,
-                params=params,
-                json=json,
-                auth=auth,
-                **request_kwargs,
-            )
-            resp.raise_for_status()
+            delay = self._rate_limit_delay(endpoint, call_deadline)
+            if delay > 0:
+                time.sleep(delay)
+            attempt_kwargs = self._attempt_kwargs(call_deadline, request_kwargs)
+            timer = self._attempt_timer()
+            copies: List[List[str]] = []
+
+            def sender(
+                copy_timer: Optional[AttemptTimer],
+            ) -> Callable[[], Tuple[httpx.Response, Optional[AttemptTimer]]]:
+                # A hedged copy runs on another thread: it gets its own endpoint exclusions
+                # and timer, merged back once a winner is known
+                copy_tried = tried if hedge is None else list(tried)
+                copies.append(copy_tried)
+                trace_kwargs = self._with_trace(copy_timer, attempt_kwargs, is_async=False)
+
+                def send() -> Tuple[httpx.Response, Optional[AttemptTimer]]:
+                    return self._routed_send(endpoint, copy_tried, lambda target: self.session.request(
+                        method=method,
+                        url=target,
+                        params=params,
+                        auth=self.default_auth if auth is None else auth,
+                        **body_kwargs,
+                        **trace_kwargs,
+                    )), copy_timer
+                return send
+
+            def send_hedge() -> Tuple[httpx.Response, Optional[AttemptTimer]]:
+                delay = self._rate_limit_delay(endpoint)
+                if delay > 0:
+                    time.sleep(delay)
+                return sender(self._attempt_timer())()
+
+            trial = self._before_attempt()
+            try:
+                send = sender(timer)
+                resp, timer = send() if hedge is None else hedged_call(hedge, endpoint, send, send_hedge)
+                resp.raise_for_status()
+            except Exception as exc:
+                self._after_attempt(exc, method, endpoint, timer)
+                if call_deadline is not None and call_deadline.expired() and isinstance(exc, _TIMEOUTS):
+                    raise call_deadline.exceeded() from exc
+                raise
+            except BaseException:
+                self._abandon_attempt(trial)
+                raise
+            finally:
+                self._merge_tried(tried, copies)
+            self._after_attempt(None, method, endpoint, timer, resp)
             return resp
 
+        body_kwargs = self._body_kwargs(json, headers or self.headers)
+        hedge = self._hedge_policy(method)
+        call_deadline = self._call_deadline(deadline)
+        tried: List[str] = []
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+
         call = do_request
         if self.enable_backoff:
             rk = dict(retry_kwargs or {})
-            if "retry" not in rk:
-                rk["retry"] = retry_if_exception(self._default_retry_exc)
             if "stop" not in rk:
                 rk["stop"] = stop_after_attempt(3)
+            rk["retry"] = self._budgeted_retry(rk.get("retry", retry_if_exception(self._default_retry_exc)), rk["stop"])
             if "wait" not in rk:
-                rk["wait"] = wait_exponential(multiplier=1, min=2, max=10)
+                rk["wait"] = wait_retry_after()
+            if call_deadline is not None:
+                rk["wait"] = wait_within_deadline(rk["wait"], call_deadline, rk["stop"])
+            user_before_sleep = rk.get("before_sleep")
+
+            def before_sleep(retry_state: RetryCallState) -> None:
+                self._record_retry(method, endpoint, retry_state)
+                if user_before_sleep is not None:
+                    user_before_sleep(retry_state)
+            rk["before_sleep"] = before_sleep
             call = retry(reraise=True, **rk)(do_request)
 
+        flight_key = self._coalesce_key(method, url, params, json)
+        if flight_key is not None:
+            send = call
+            call = lambda: self._singleflight.do(flight_key, send)
+
         try:
-            return call()
+            resp = call()
         except RetryError as re:
             last = re.last_attempt.exception()
             self._log(f"Retry failed: {last}")
             raise
         except httpx.HTTPStatusError as he:
+            self._cache_store(cache_key, endpoint, he.response)
             self._log(f"HTTP error: {he}")
             raise
+        self._cache_store(cache_key, endpoint, resp)
+        return resp
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
         return self._make_request("GET", endpoint, params=params, **kwargs)
@@ -285,6 +847,199 @@ class Broker(SharedConnectorBase):
     def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
         return self._make_request("POST", endpoint, json=json, **kwargs)
 
+    def fetch_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        **kwargs,
+    ) -> Any:
+        """
+        Send a request and return its decoded JSON body using the fast JSON codec.
+
+        Args:
+            endpoint (str): The endpoint to request.
+            params (Optional[Dict[str, Any]]): Query string parameters.
+            method (str): HTTP method. Defaults to "GET".
+            **kwargs: Passed through to `_make_request` (e.g. `json=`, `headers=`).
+        """
+        return self.response_json(self._make_request(method, endpoint, params=params, **kwargs))
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        auth: Optional[Union[tuple, Auth]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        **request_kwargs,
+    ) -> Iterator[httpx.Response]:
+        """
+        Send a request and yield the response without buffering its body, for use as
+        `with conn.stream("GET", "/path") as resp: for chunk in resp.iter_bytes(): ...`.
+
+        Rate limits, the circuit breaker, endpoint fail-over and deadlines apply; responses
+        are never cached or retried. `deadline` bounds the time until the response headers
+        arrive; use `download_to` to bound reading the body as well.
+        Raises httpx.HTTPStatusError for 4xx/5xx responses before yielding.
+        """
+        call_deadline = self._call_deadline(deadline)
+        delay = self._rate_limit_delay(endpoint, call_deadline)
+        if delay > 0:
+            time.sleep(delay)
+        request_kwargs = self._attempt_kwargs(call_deadline, request_kwargs)
+        trial = self._before_attempt()
+        timer = self._attempt_timer()
+        body_kwargs = self._body_kwargs(json, headers or self.headers)
+        trace_kwargs = self._with_trace(timer, request_kwargs, is_async=False)
+        with ExitStack() as stack:
+            def open_stream(target: str) -> httpx.Response:
+                return stack.enter_context(self.session.stream(
+                    method=method,
+                    url=target,
+                    params=params,
+                    auth=self.default_auth if auth is None else auth,
+                    **body_kwargs,
+                    **trace_kwargs,
+                ))
+
+            try:
+                resp = self._routed_send(endpoint, [], open_stream)
+                resp.raise_for_status()
+            except Exception as exc:
+                if isinstance(exc, httpx.HTTPStatusError):
+                    exc.response.read()
+                    self._log(f"HTTP error: {exc}")
+                self._after_attempt(exc, method, endpoint, timer)
+                if call_deadline is not None and call_deadline.expired() and isinstance(exc, _TIMEOUTS):
+                    raise call_deadline.exceeded() from exc
+                raise
+            except BaseException:
+                self._abandon_attempt(trial)
+                raise
+            self._after_attempt(None, method, endpoint, timer, resp)
+            yield resp
+
+    def download_to(
+        self,
+        endpoint: str,
+        destination: Optional[PathOrFile] = None,
+        params: Optional[Dict[str, Any]] = None,
+        max_bytes: Optional[int] = None,
+        hash_algorithm: Optional[str] = "sha256",
+        chunk_size: int = 64 * 1024,
+        method: str = "GET",
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> DownloadResult:
+        """
+        Stream a response body straight to disk or a spooled temporary file.
+
+        Args:
+            endpoint (str): The endpoint to download.
+            destination (str | PathLike | IO[bytes] | None): Where to write the body. A path is
+                created/overwritten; a file object is written to as-is; None spools to a
+                temporary file (in memory up to 8 MiB) that is returned rewound.
+            params (Optional[Dict[str, Any]]): Query string parameters.
+            max_bytes (Optional[int]): Abort with ResponseTooLargeError once the body exceeds this size.
+            hash_algorithm (Optional[str]): hashlib algorithm for the on-the-fly digest, or None.
+            chunk_size (int): Size of the chunks read from the network.
+            method (str): HTTP method. Defaults to "GET".
+            deadline (Optional[float]): Seconds the whole download, body included, may take;
+                DeadlineExceeded is raised when it runs out.
+            **kwargs: Passed through to `stream()`.
+
+        Returns:
+            DownloadResult: destination, byte count, digest and content type.
+        """
+        call_deadline = self._call_deadline(deadline)
+        sink = ChunkSink(destination, max_bytes=max_bytes, hash_algorithm=hash_algorithm)
+        try:
+            with _use_deadline(call_deadline), self.stream(method, endpoint, params=params, **kwargs) as resp:
+                sink.check_declared_length(resp)
+                url = str(resp.request.url)
+                for chunk in resp.iter_bytes(chunk_size):
+                    if call_deadline is not None:
+                        call_deadline.check()
+                    sink.write(chunk, url)
+        except BaseException as exc:
+            sink.abort()
+            expired = call_deadline is not None and call_deadline.expired()
+            if expired and isinstance(exc, _TIMEOUTS) and not isinstance(exc, DeadlineExceeded):
+                raise call_deadline.exceeded() from exc
+            raise
+        return sink.finish(resp)
+
+    def map(
+        self,
+        method: Union[str, Callable[..., Any]],
+        queries: Iterable[Any],
+        max_workers: int = 8,
+        ordered: bool = True,
+        **kwargs,
+    ) -> Iterator[BulkResult]:
+        """
+        Call a connector method once per query on a bounded thread pool.
+
+        Args:
+            method (str | Callable): A connector method (e.g. `conn.search`) or its name.
+            queries (Iterable): Inputs passed as the first argument of each call.
+            max_workers (int): Maximum number of calls in flight. Defaults to 8.
+            ordered (bool): Yield results in input order (True) or completion order (False).
+            **kwargs: Extra keyword arguments passed to every call.
+
+        Returns:
+            Iterator[BulkResult]: one result per query; per-item exceptions are captured
+            in `BulkResult.error` instead of aborting the batch.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return iter_bulk(fn, queries, max_workers=max_workers, ordered=ordered, **kwargs)
+
+    def map_resumable(
+        self,
+        method: Union[str, Callable[..., Any]],
+        queries: Iterable[Any],
+        journal: Union[str, Journal],
+        max_workers: int = 8,
+        ordered: bool = True,
+        shard: Shard = (0, 1),
+        store_responses: bool = False,
+        **kwargs,
+    ) -> Iterator[BulkResult]:
+        """
+        `map` with a checkpoint journal: inputs already journaled are skipped, and each
+        completed input is journaled, so a restarted job never repeats finished calls.
+
+        Args:
+            method (str | Callable): A connector method (e.g. `conn.search`) or its name.
+            queries (Iterable): Inputs passed as the first argument of each call.
+            journal (str | Journal): A journal, or a path; `.db`/`.sqlite` paths use SQLite,
+                anything else an append-only JSON-lines file.
+            max_workers (int): Maximum number of calls in flight. Defaults to 8.
+            ordered (bool): Yield results in input order (True) or completion order (False).
+            shard (tuple): `(index, count)` to process only this worker's share of the inputs.
+            store_responses (bool): Also journal each response (status, headers and body).
+            **kwargs: Extra keyword arguments passed to every call (and `record_error`/`key_fn`,
+                see `checkpoint.run_resumable`).
+
+        Returns:
+            Iterator[BulkResult]: one result per input processed in this run.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return run_resumable(
+            fn,
+            queries,
+            journal,
+            max_workers=max_workers,
+            ordered=ordered,
+            shard=shard,
+            store_responses=store_responses,
+            **kwargs,
+        )
+
 
 class AsyncBroker(SharedConnectorBase):
     """
@@ -296,11 +1051,29 @@ class AsyncBroker(SharedConnectorBase):
         headers: Optional[Dict[str, str]] = None,
         enable_logging: bool = False,
         enable_backoff: bool = False,
-        timeout: int = 10,
+        timeout: Union[float, httpx.Timeout] = 10,
         load_env_vars: bool = False,
         trust_env: bool = True,
         proxy: Optional[str] = None,
-        mounts: Optional[Dict[str, httpx.HTTPTransport]] = None,
+        mounts: Optional[MountsSpec] = None,
+        rate_limit: Optional[RateLimitSpec] = None,
+        endpoint_rate_limits: Optional[Dict[str, RateLimitSpec]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[Union[bool, CircuitBreaker]] = None,
+        retry_budget: Optional[Union[bool, RetryBudget]] = None,
+        metrics: Optional[Union[bool, MetricsRegistry]] = None,
+        call_tracer: Optional[CallTracer] = None,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        hedging: Optional[Union[bool, float, HedgePolicy]] = None,
+        deadline: Optional[float] = None,
+        base_urls: Optional[Union[Sequence[str], Mapping[str, float], EndpointPool]] = None,
+        adaptive_concurrency: Optional[Union[bool, AdaptiveConcurrencyLimiter]] = None,
         **client_kwargs,
     ):
         super().__init__(
@@ -313,22 +1086,58 @@ class AsyncBroker(SharedConnectorBase):
             trust_env=trust_env,
             proxy=proxy,
             mounts=mounts,
+            rate_limit=rate_limit,
+            endpoint_rate_limits=endpoint_rate_limits,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            metrics=metrics,
+            call_tracer=call_tracer,
+            http2=http2,
+            limits=limits,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            hedging=hedging,
+            deadline=deadline,
+            base_urls=base_urls,
             **client_kwargs,
         )
 
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AdaptiveConcurrencyLimiter()
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = adaptive_concurrency or None
+
+        client_args = self._base_client_args()
+
         if self.mounts:
-            raise ValueError("The 'mounts' parameter is not supported in AsyncBroker but "
-                             "you can still use 'proxy' or 'trust_env' if 'HTTP_PROXY' or "
-                             "'HTTPS_PROXY' are in your system environment variables ")
+            self.mounts = self._build_mounts(self.mounts, httpx.AsyncHTTPTransport)
+            client_args["mounts"] = self.mounts
+        elif self.proxy:
+            client_args["proxy"] = self.proxy
+        else:
+            env_proxy, env_mounts = self._collect_proxy_config(httpx.AsyncHTTPTransport)
+            if env_mounts:
+                self.mounts = env_mounts
+                client_args["mounts"] = self.mounts
+            elif env_proxy:
+                self.proxy = env_proxy
+                client_args["proxy"] = self.proxy
+            elif not self.trust_env:
+                client_args["trust_env"] = False
 
-        resolved_proxy = self.proxy or self._collect_proxy_config()[0]
+        self._client_args = client_args
+        self._singleflight = AsyncSingleFlight()
 
-        self.session = httpx.AsyncClient(
-            timeout=self.timeout,
-            proxy=resolved_proxy,
-            trust_env=self.trust_env,
-            **self._client_kwargs,
-        )
+    def _concurrency_slot(self) -> Any:
+        if self.concurrency_limiter is None:
+            return nullcontext()
+        return self.concurrency_limiter.slot()
+
+    def _create_session(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self._session_args())
 
     async def __aenter__(self) -> "AsyncBroker":
         return self
@@ -339,7 +1148,8 @@ class AsyncBroker(SharedConnectorBase):
         exc: Optional[BaseException],
         tb: Optional[TracebackType],
     ) -> None:
-        await self.session.aclose()
+        if self._session is not None:
+            await self._session.aclose()
 
     async def _make_request(
         self,
@@ -350,49 +1160,284 @@ class AsyncBroker(SharedConnectorBase):
         auth: Optional[Union[tuple, Auth]] = None,
         headers: Optional[Dict[str, str]] = None,
         retry_kwargs: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
         **request_kwargs,
     ) -> httpx.Response:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
+        cache_key = self._cache_key(method, url, params, json)
+        cached = self._cache_lookup(cache_key, url)
+        if cached is not None:
+            return cached
+
         async def do_request() -> httpx.Response:
-            resp = await self.session.request(
-                method=method,
-                url=url,
-                headers=headers or self.headers,
-                params=params,
-                json=json,
-                auth=auth,
-                **request_kwargs,
-            )
-            resp.raise_for_status()
+            delay = self._rate_limit_delay(endpoint, call_deadline)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with self._concurrency_slot():
+                attempt_kwargs = self._attempt_kwargs(call_deadline, request_kwargs)
+                timer = self._attempt_timer()
+                copies: List[List[str]] = []
+
+                def sender(
+                    copy_timer: Optional[AttemptTimer],
+                ) -> Callable[[], Awaitable[Tuple[httpx.Response, Optional[AttemptTimer]]]]:
+                    # Each copy of a hedged attempt keeps its own endpoint exclusions and
+                    # timer, merged back once a winner is known
+                    copy_tried = tried if hedge is None else list(tried)
+                    copies.append(copy_tried)
+                    trace_kwargs = self._with_trace(copy_timer, attempt_kwargs, is_async=True)
+
+                    async def send() -> Tuple[httpx.Response, Optional[AttemptTimer]]:
+                        return await self._arouted_send(endpoint, copy_tried, lambda target: self.session.request(
+                            method=method,
+                            url=target,
+                            params=params,
+                            auth=self.default_auth if auth is None else auth,
+                            **body_kwargs,
+                            **trace_kwargs,
+                        )), copy_timer
+                    return send
+
+                async def send_hedge() -> Tuple[httpx.Response, Optional[AttemptTimer]]:
+                    delay = self._rate_limit_delay(endpoint)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    return await sender(self._attempt_timer())()
+
+                remaining = call_deadline.check() if call_deadline is not None else None
+                trial = self._before_attempt()
+                try:
+                    send = sender(timer)
+                    sending = send() if hedge is None else ahedged_call(hedge, endpoint, send, send_hedge)
+                    resp, timer = await (sending if remaining is None else asyncio.wait_for(sending, remaining))
+                    resp.raise_for_status()
+                except Exception as exc:
+                    self._after_attempt(exc, method, endpoint, timer)
+                    if call_deadline is not None and call_deadline.expired() and isinstance(exc, _TIMEOUTS):
+                        raise call_deadline.exceeded() from exc
+                    raise
+                except BaseException:
+                    # Cancelled: no outcome to record, but a half-open trial slot must be freed
+                    self._abandon_attempt(trial)
+                    raise
+                finally:
+                    self._merge_tried(tried, copies)
+                self._after_attempt(None, method, endpoint, timer, resp)
             return resp
 
+        body_kwargs = self._body_kwargs(json, headers or self.headers)
+        hedge = self._hedge_policy(method)
+        call_deadline = self._call_deadline(deadline)
+        tried: List[str] = []
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+
         call = do_request
         if self.enable_backoff:
 
             rk = dict(retry_kwargs or {})
-            retry_pred = rk.get("retry", retry_if_exception(self._default_retry_exc))
             stop_cond = rk.get("stop", stop_after_attempt(3))
-            wait_cond = rk.get("wait", wait_exponential(multiplier=1, min=2, max=10))
+            retry_pred = self._budgeted_retry(rk.get("retry", retry_if_exception(self._default_retry_exc)), stop_cond)
+            wait_cond = rk.get("wait", wait_retry_after())
+            if call_deadline is not None:
+                wait_cond = wait_within_deadline(wait_cond, call_deadline, stop_cond)
+            user_before_sleep = rk.get("before_sleep")
+
+            async def before_sleep(retry_state: RetryCallState) -> None:
+                self._record_retry(method, endpoint, retry_state)
+                if user_before_sleep is not None:
+                    result = user_before_sleep(retry_state)
+                    if inspect.isawaitable(result):
+                        await result
 
             async def retry_wrapper():
-                async for attempt in AsyncRetrying(reraise=True, retry=retry_pred, stop=stop_cond, wait=wait_cond):
+                async for attempt in AsyncRetrying(
+                    reraise=True, retry=retry_pred, stop=stop_cond, wait=wait_cond, before_sleep=before_sleep
+                ):
                     with attempt:
                         return await do_request()
             call = retry_wrapper
 
+        flight_key = self._coalesce_key(method, url, params, json)
+        if flight_key is not None:
+            send = call
+            call = lambda: self._singleflight.do(flight_key, send)
+
         try:
-            return await call()
+            resp = await call()
         except RetryError as re:
             last = re.last_attempt.exception()
             self._log(f"Retry failed: {last}")
             raise
         except httpx.HTTPStatusError as he:
+            self._cache_store(cache_key, endpoint, he.response)
             self._log(f"HTTP error: {he}")
             raise
+        self._cache_store(cache_key, endpoint, resp)
+        return resp
 
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
         return await self._make_request("GET", endpoint, params=params, **kwargs)
 
     async def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
         return await self._make_request("POST", endpoint, json=json, **kwargs)
+
+    async def fetch_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        **kwargs,
+    ) -> Any:
+        """
+        Send a request and return its decoded JSON body using the fast JSON codec.
+        """
+        return self.response_json(await self._make_request(method, endpoint, params=params, **kwargs))
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        auth: Optional[Union[tuple, Auth]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        **request_kwargs,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request and yield the response without buffering its body, for use as
+        `async with conn.stream("GET", "/path") as resp: async for chunk in resp.aiter_bytes(): ...`.
+
+        Rate limits, the circuit breaker, endpoint fail-over and deadlines apply; responses
+        are never cached or retried. `deadline` bounds the time until the response headers
+        arrive; use `download_to` to bound reading the body as well.
+        Raises httpx.HTTPStatusError for 4xx/5xx responses before yielding.
+        """
+        call_deadline = self._call_deadline(deadline)
+        delay = self._rate_limit_delay(endpoint, call_deadline)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        request_kwargs = self._attempt_kwargs(call_deadline, request_kwargs)
+        trial = self._before_attempt()
+        timer = self._attempt_timer()
+        body_kwargs = self._body_kwargs(json, headers or self.headers)
+        trace_kwargs = self._with_trace(timer, request_kwargs, is_async=True)
+        async with AsyncExitStack() as stack:
+            def open_stream(target: str) -> Awaitable[httpx.Response]:
+                return stack.enter_async_context(self.session.stream(
+                    method=method,
+                    url=target,
+                    params=params,
+                    auth=self.default_auth if auth is None else auth,
+                    **body_kwargs,
+                    **trace_kwargs,
+                ))
+
+            try:
+                resp = await self._arouted_send(endpoint, [], open_stream)
+                resp.raise_for_status()
+            except Exception as exc:
+                if isinstance(exc, httpx.HTTPStatusError):
+                    await exc.response.aread()
+                    self._log(f"HTTP error: {exc}")
+                self._after_attempt(exc, method, endpoint, timer)
+                if call_deadline is not None and call_deadline.expired() and isinstance(exc, _TIMEOUTS):
+                    raise call_deadline.exceeded() from exc
+                raise
+            except BaseException:
+                self._abandon_attempt(trial)
+                raise
+            self._after_attempt(None, method, endpoint, timer, resp)
+            yield resp
+
+    async def download_to(
+        self,
+        endpoint: str,
+        destination: Optional[PathOrFile] = None,
+        params: Optional[Dict[str, Any]] = None,
+        max_bytes: Optional[int] = None,
+        hash_algorithm: Optional[str] = "sha256",
+        chunk_size: int = 64 * 1024,
+        method: str = "GET",
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> DownloadResult:
+        """
+        Async version of `Broker.download_to`: stream a response body straight to disk
+        or a spooled temporary file while hashing it and enforcing `max_bytes`.
+        """
+        call_deadline = self._call_deadline(deadline)
+        sink = ChunkSink(destination, max_bytes=max_bytes, hash_algorithm=hash_algorithm)
+        try:
+            with _use_deadline(call_deadline):
+                async with self.stream(method, endpoint, params=params, **kwargs) as resp:
+                    sink.check_declared_length(resp)
+                    url = str(resp.request.url)
+                    async for chunk in resp.aiter_bytes(chunk_size):
+                        if call_deadline is not None:
+                            call_deadline.check()
+                        sink.write(chunk, url)
+        except BaseException as exc:
+            sink.abort()
+            expired = call_deadline is not None and call_deadline.expired()
+            if expired and isinstance(exc, _TIMEOUTS) and not isinstance(exc, DeadlineExceeded):
+                raise call_deadline.exceeded() from exc
+            raise
+        return sink.finish(resp)
+
+    def gather_bounded(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        queries: Iterable[Any],
+        concurrency: int = 8,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Await a connector method once per query with bounded concurrency.
+
+        Args:
+            method (str | Callable): An async connector method (e.g. `conn.search`) or its name.
+            queries (Iterable): Inputs passed as the first argument of each call.
+            concurrency (int): Maximum number of calls in flight. Defaults to 8.
+            ordered (bool): Yield results in input order (True) or completion order (False).
+            **kwargs: Extra keyword arguments passed to every call.
+
+        Returns:
+            AsyncIterator[BulkResult]: one result per query; per-item exceptions are
+            captured in `BulkResult.error` instead of aborting the batch.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return aiter_bulk(fn, queries, concurrency=concurrency, ordered=ordered, **kwargs)
+
+    def gather_resumable(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        queries: Iterable[Any],
+        journal: Union[str, Journal],
+        concurrency: int = 8,
+        ordered: bool = True,
+        shard: Shard = (0, 1),
+        store_responses: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        `gather_bounded` with a checkpoint journal; see `Broker.map_resumable`.
+
+        Returns:
+            AsyncIterator[BulkResult]: one result per input processed in this run.
+        """
+        fn = getattr(self, method) if isinstance(method, str) else method
+        return arun_resumable(
+            fn,
+            queries,
+            journal,
+            concurrency=concurrency,
+            ordered=ordered,
+            shard=shard,
+            store_responses=store_responses,
+            **kwargs,
+        )
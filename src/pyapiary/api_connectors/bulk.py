@@ -0,0 +1,163 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one item in a bulk run.
+
+    Attributes:
+        index (int): Position of the query in the input iterable.
+        query (Any): The query that was passed to the connector method.
+        response (Any): The method's return value, or None if it raised.
+        error (Optional[BaseException]): The exception raised for this item, if any.
+    """
+    index: int
+    query: Any
+    response: Any
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_bulk(
+    fn: Callable[..., Any],
+    queries: Iterable[Any],
+    max_workers: int = 8,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> Iterator[BulkResult]:
+    """
+    Run `fn(query, **kwargs)` for every query on a thread pool and stream the results.
+
+    At most `max_workers` calls are in flight at once and queries are pulled from the
+    input lazily, so arbitrarily large (or infinite) iterables are processed in
+    constant memory. Results are yielded in input order when `ordered` is True,
+    otherwise as soon as each call completes.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    items = enumerate(queries)
+
+    def run(query: Any) -> Any:
+        return fn(query, **kwargs)
+
+    def collect(index: int, query: Any, future: "Future[Any]") -> BulkResult:
+        error = future.exception()
+        return BulkResult(index, query, None if error is not None else future.result(), error)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyapiary-bulk")
+    try:
+        if ordered:
+            window: Deque[Tuple[int, Any, "Future[Any]"]] = deque()
+            for index, query in items:
+                window.append((index, query, executor.submit(run, query)))
+                if len(window) >= max_workers:
+                    yield collect(*window.popleft())
+            while window:
+                yield collect(*window.popleft())
+        else:
+            pending: Dict["Future[Any]", Tuple[int, Any]] = {}
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_workers:
+                    nxt = next(items, None)
+                    if nxt is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(run, nxt[1])] = nxt
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, query = pending.pop(future)
+                    yield collect(index, query, future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_bulk(
+    fn: Callable[..., Awaitable[Any]],
+    queries: Iterable[Any],
+    concurrency: int = 8,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[BulkResult]:
+    """
+    Run `await fn(query, **kwargs)` for every query with at most `concurrency` calls
+    in flight, streaming results as an async iterator.
+
+    Tasks are created lazily as slots free up rather than all at once, so large
+    inputs do not create one task per query up front. Results are yielded in input
+    order when `ordered` is True, otherwise in completion order. Outstanding tasks are
+    cancelled if the consumer stops iterating early.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    items = enumerate(queries)
+    pending: Set["asyncio.Task[Any]"] = set()
+    meta: Dict["asyncio.Task[Any]", Tuple[int, Any]] = {}
+
+    def launch() -> Optional["asyncio.Task[Any]"]:
+        nxt = next(items, None)
+        if nxt is None:
+            return None
+        task = asyncio.ensure_future(fn(nxt[1], **kwargs))
+        pending.add(task)
+        meta[task] = nxt
+        return task
+
+    def collect(task: "asyncio.Task[Any]") -> BulkResult:
+        pending.discard(task)
+        index, query = meta.pop(task)
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        return BulkResult(index, query, None if error is not None else task.result(), error)
+
+    try:
+        if ordered:
+            window: Deque["asyncio.Task[Any]"] = deque()
+            while True:
+                while len(window) < concurrency:
+                    task = launch()
+                    if task is None:
+                        break
+                    window.append(task)
+                if not window:
+                    break
+                head = window.popleft()
+                await asyncio.wait({head})
+                yield collect(head)
+        else:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    exhausted = launch() is None
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield collect(task)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
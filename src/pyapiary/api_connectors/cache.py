@@ -0,0 +1,249 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from pyapiary.helpers import match_endpoint_prefix
+
+
+# Headers describing the on-the-wire encoding no longer apply once httpx has decoded
+# the body, and would make httpx try to decode the cached content a second time.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def request_fingerprint(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    json_body: Optional[Any] = None,
+) -> str:
+    """Build a stable key from the parts of a request that identify its response."""
+    parts = [
+        method.upper(),
+        url,
+        json.dumps(params or {}, sort_keys=True, default=str),
+        json.dumps(json_body, sort_keys=True, default=str),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Base class for opt-in response caches used by Broker and AsyncBroker.
+
+    Entries are keyed on the HTTP method, URL, query parameters and JSON body of a
+    request. Successful responses are kept for `ttl` seconds (or the TTL of the longest
+    matching prefix in `endpoint_ttls`); 404 responses are kept for `negative_ttl`
+    seconds when it is set. Hit and miss counters are available via `stats()`.
+
+    Subclasses implement `_load`, `_store` and `clear`.
+    """
+    def __init__(
+        self,
+        ttl: float = 3600,
+        negative_ttl: Optional[float] = None,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        methods: Iterable[str] = ("GET",),
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.methods = {m.upper() for m in methods}
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> str:
+        return request_fingerprint(method, url, params, json_body)
+
+    def is_cacheable_request(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def ttl_for(self, endpoint: str, status_code: int) -> Optional[float]:
+        """Return the TTL for a response, or None if it must not be cached."""
+        if status_code == 404:
+            return self.negative_ttl
+        if not 200 <= status_code < 300:
+            return None
+        override = match_endpoint_prefix(self.endpoint_ttls, endpoint)
+        return override if override is not None else self.ttl
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        entry = self._load(key)
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return self._to_response(entry) if entry is not None else None
+
+    def set(self, key: str, endpoint: str, response: httpx.Response) -> bool:
+        """Store `response` under `key` if its status is cacheable. Returns True when stored."""
+        ttl = self.ttl_for(endpoint, response.status_code)
+        if ttl is None or ttl <= 0:
+            return False
+        entry = {
+            "status_code": response.status_code,
+            "headers": [
+                (k, v) for k, v in response.headers.multi_items()
+                if k.lower() not in _DROPPED_HEADERS
+            ],
+            "content": response.content,
+            "method": response.request.method,
+            "url": str(response.request.url),
+        }
+        self._store(key, entry, self._clock() + ttl)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _to_response(entry: Dict[str, Any]) -> httpx.Response:
+        return httpx.Response(
+            entry["status_code"],
+            headers=entry["headers"],
+            content=entry["content"],
+            request=httpx.Request(entry["method"], entry["url"]),
+        )
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def _store(self, key: str, entry: Dict[str, Any], expires_at: float) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU cache with per-entry expiry. Thread-safe; holds at most `maxsize`
+    entries and evicts the least recently used entry when full.
+    """
+    def __init__(self, maxsize: int = 1024, **kwargs):
+        super().__init__(**kwargs)
+        if maxsize < 1:
+            raise ValueError("MemoryCache 'maxsize' must be at least 1")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, entry: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent cache backed by a SQLite database file, so cached responses survive
+    process restarts and can be shared by workers on the same host.
+    """
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " expires_at REAL NOT NULL,"
+            " status_code INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " content BLOB NOT NULL,"
+            " method TEXT NOT NULL,"
+            " url TEXT NOT NULL)"
+        )
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, status_code, headers, content, method, url"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] <= self._clock():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return {
+            "status_code": row[1],
+            "headers": [tuple(h) for h in json.loads(row[2])],
+            "content": row[3],
+            "method": row[4],
+            "url": row[5],
+        }
+
+    def _store(self, key: str, entry: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, expires_at, status_code, headers, content, method, url)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    expires_at,
+                    entry["status_code"],
+                    json.dumps(entry["headers"]),
+                    entry["content"],
+                    entry["method"],
+                    entry["url"],
+                ),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (self._clock(),))
+            return cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
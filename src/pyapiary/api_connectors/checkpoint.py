@@ -0,0 +1,303 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+import httpx
+
+from pyapiary.api_connectors.bulk import BulkResult, aiter_bulk, iter_bulk
+
+# (shard_index, shard_count); (0, 1) processes every input
+Shard = Tuple[int, int]
+
+
+def input_key(query: Any) -> str:
+    """Stable journal key for a query: the string itself, or its canonical JSON."""
+    if isinstance(query, str):
+        return query
+    return json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def shard_of(key: str, shard_count: int) -> int:
+    """Shard a key belongs to. Unlike hash(), stable across processes and hosts."""
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def response_record(response: Any) -> Any:
+    """JSON-serializable form of a connector return value, for journals that keep responses."""
+    if isinstance(response, httpx.Response):
+        return {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "text": response.text,
+        }
+    return response
+
+
+class Journal(ABC):
+    """
+    Base class for checkpoint journals used by `run_resumable`/`arun_resumable`.
+
+    A journal remembers which inputs have completed, and optionally their responses, so
+    that a restarted job skips them instead of paying for the same API calls again.
+    Subclasses implement `__contains__`, `record` and `__len__`, and usually `close`.
+    """
+    @abstractmethod
+    def __contains__(self, key: object) -> bool:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def record(self, key: str, response: Any = None) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class FileJournal(Journal):
+    """
+    Append-only JSON-lines journal. Every completed input is one line, flushed as soon
+    as it is written; with `fsync=True` it is also forced to disk, which survives power
+    loss at the cost of throughput. A line cut short by a crash is ignored on reload.
+    Completed keys are held in memory.
+
+    Each file must have a single writer process: appends from several processes are not
+    coordinated. Give each shard its own file, or use SQLiteJournal to share one.
+    """
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._keys: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        self._keys.add(json.loads(line)["key"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        self._fh = open(path, "a", encoding="utf-8")
+        if self._fh.tell() and not self._ends_with_newline():
+            # Terminate a line torn by a crash so the next record is not glued onto it
+            self._fh.write("\n")
+            self._fh.flush()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            return fh.read(1) == b"\n"
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def record(self, key: str, response: Any = None) -> None:
+        entry: Dict[str, Any] = {"key": key, "completed_at": time.time()}
+        if response is not None:
+            entry["response"] = response
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()
+            if self.fsync:
+                os.fsync(self._fh.fileno())
+            self._keys.add(key)
+
+    def responses(self) -> Iterator[Tuple[str, Any]]:
+        """Yield `(key, response)` for every journaled input that kept its response."""
+        with self._lock:
+            self._fh.flush()
+        with open(self.path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "response" in entry:
+                    yield entry["key"], entry["response"]
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+
+class SQLiteJournal(Journal):
+    """
+    Journal backed by a SQLite database in WAL mode. Lookups go to the database, so
+    memory stays flat for very large jobs, and several worker processes on one host can
+    share a single file.
+    """
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=busy_timeout)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completed ("
+            " key TEXT PRIMARY KEY,"
+            " completed_at REAL NOT NULL,"
+            " response TEXT)"
+        )
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM completed WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM completed").fetchone()[0]
+
+    def record(self, key: str, response: Any = None) -> None:
+        payload = json.dumps(response, default=str) if response is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completed (key, completed_at, response) VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+
+    def responses(self) -> Iterator[Tuple[str, Any]]:
+        """Yield `(key, response)` for every journaled input that kept its response."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, response FROM completed WHERE response IS NOT NULL ORDER BY completed_at"
+            ).fetchall()
+        for key, payload in rows:
+            yield key, json.loads(payload)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_journal(path: str, **kwargs: Any) -> Journal:
+    """SQLiteJournal for `.db`/`.sqlite`/`.sqlite3` paths, FileJournal otherwise."""
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteJournal(path, **kwargs)
+    return FileJournal(path, **kwargs)
+
+
+def _pending(
+    queries: Iterable[Any],
+    journal: Journal,
+    shard: Shard,
+    key_fn: Callable[[Any], str],
+) -> Iterator[Tuple[int, Any, str]]:
+    shard_index, shard_count = shard
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("shard must be (index, count) with 0 <= index < count")
+    # Keys handed out in this run: the journal only learns of them once they complete
+    scheduled: Set[str] = set()
+    for index, query in enumerate(queries):
+        key = key_fn(query)
+        if shard_count > 1 and shard_of(key, shard_count) != shard_index:
+            continue
+        if key in scheduled or key in journal:
+            continue
+        scheduled.add(key)
+        yield index, query, key
+
+
+def _checkpoint(
+    result: BulkResult,
+    journal: Journal,
+    store_responses: bool,
+    record_error: Optional[Callable[[BaseException], bool]],
+) -> BulkResult:
+    index, query, key = result.query
+    if result.ok:
+        journal.record(key, response_record(result.response) if store_responses else None)
+    elif record_error is not None and record_error(result.error):
+        journal.record(key, {"error": repr(result.error)} if store_responses else None)
+    return BulkResult(index, query, result.response, result.error)
+
+
+def run_resumable(
+    fn: Callable[..., Any],
+    queries: Iterable[Any],
+    journal: Union[str, Journal],
+    max_workers: int = 8,
+    ordered: bool = True,
+    shard: Shard = (0, 1),
+    store_responses: bool = False,
+    record_error: Optional[Callable[[BaseException], bool]] = None,
+    key_fn: Callable[[Any], str] = input_key,
+    **kwargs: Any,
+) -> Iterator[BulkResult]:
+    """
+    Like `iter_bulk`, but skips inputs the journal has already seen and journals every
+    input as it completes, so a job that is killed and restarted resumes where it left off.
+
+    Each input is journaled before its result is yielded. A crash can therefore repeat
+    at most the calls that were in flight. Failed inputs are retried on the next run
+    unless `record_error(exc)` returns True; use that for definitive answers such as a
+    404. With `shard=(i, n)` only the inputs whose key hashes to shard `i` of `n` are
+    processed. Start `n` workers with the same input and shard indexes 0..n-1 to split
+    a job between processes. An input repeated within one run is only called the first
+    time. Result indexes refer to positions in the full input.
+    """
+    owned = isinstance(journal, str)
+    if isinstance(journal, str):
+        journal = open_journal(journal)
+    try:
+        for result in iter_bulk(
+            lambda item, **kw: fn(item[1], **kw),
+            _pending(queries, journal, shard, key_fn),
+            max_workers=max_workers,
+            ordered=ordered,
+            **kwargs,
+        ):
+            yield _checkpoint(result, journal, store_responses, record_error)
+    finally:
+        if owned:
+            journal.close()
+
+
+async def arun_resumable(
+    fn: Callable[..., Awaitable[Any]],
+    queries: Iterable[Any],
+    journal: Union[str, Journal],
+    concurrency: int = 8,
+    ordered: bool = True,
+    shard: Shard = (0, 1),
+    store_responses: bool = False,
+    record_error: Optional[Callable[[BaseException], bool]] = None,
+    key_fn: Callable[[Any], str] = input_key,
+    **kwargs: Any,
+) -> AsyncIterator[BulkResult]:
+    """Async counterpart of `run_resumable`, built on `aiter_bulk`."""
+    owned = isinstance(journal, str)
+    if isinstance(journal, str):
+        journal = open_journal(journal)
+    results = aiter_bulk(
+        lambda item, **kw: fn(item[1], **kw),
+        _pending(queries, journal, shard, key_fn),
+        concurrency=concurrency,
+        ordered=ordered,
+        **kwargs,
+    )
+    try:
+        async for result in results:
+            yield _checkpoint(result, journal, store_responses, record_error)
+    finally:
+        await results.aclose()
+        if owned:
+            journal.close()
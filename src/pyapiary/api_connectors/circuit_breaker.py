@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import httpx
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while a host's circuit breaker is open."""
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit breaker for {name} is open; next trial request in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    A thread-safe closed / open / half-open circuit breaker.
+
+    - closed: requests flow; `failure_threshold` consecutive failures open the circuit.
+    - open: requests fail immediately with CircuitOpenError for `recovery_timeout` seconds.
+    - half-open: up to `half_open_max_calls` trial requests are let through; if
+      `success_threshold` of them succeed the circuit closes, any failure re-opens it.
+
+    Only outage-like failures count: connection errors, timeouts and 5xx responses.
+    Client errors such as 404 or 429 are answers from a healthy server.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._trials = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._trials = 0
+            self._successes = 0
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._failures = 0
+
+    def before_request(self) -> bool:
+        """
+        Raise CircuitOpenError if a request may not be sent right now.
+
+        Returns True when the request is a half-open trial. Its slot is freed by
+        `record`, or by `release_trial` if the request is abandoned before it has an outcome.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.OPEN:
+                raise CircuitOpenError(self.name, self.recovery_timeout - (self._clock() - self._opened_at))
+            if self._state == self.HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trials += 1
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """Give back a trial slot taken by `before_request` without recording an outcome."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._successes += 1
+                self._trials = max(0, self._trials - 1)
+                if self._successes >= self.success_threshold:
+                    self._state = self.CLOSED
+                    self._failures = 0
+            else:
+                self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+            elif self._state == self.CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._open()
+
+    def record(self, exc: Optional[BaseException]) -> None:
+        """Record the outcome of one attempt; `exc` is None for a successful response."""
+        if exc is not None and is_outage_failure(exc):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._successes = 0
+            self._trials = 0
+
+
+def is_outage_failure(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response is not None and exc.response.status_code >= 500
+    # asyncio.TimeoutError: an async attempt cut off by the call's deadline
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent traffic so that an outage cannot multiply load.
+
+    Over a sliding `window` of seconds, retries are allowed while
+    `retries < max(min_retries, ratio * requests)`. Thread-safe and intended to be
+    shared by every connector in a process.
+    """
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.rejected = 0
+
+    def _trim(self, now: float) -> None:
+        horizon = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """Withdraw one retry from the budget. Returns False if the budget is exhausted."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                self.rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+
+_registry_lock = threading.Lock()
+_breakers: Dict[str, CircuitBreaker] = {}
+_retry_budget: Optional[RetryBudget] = None
+
+
+def get_circuit_breaker(name: str, **settings: Any) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for `name` (normally a base_url), creating
+    it with `settings` on first use. Shared by every Broker and AsyncBroker.
+    """
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name=name, **settings)
+        return breaker
+
+
+def get_retry_budget(**settings: Any) -> RetryBudget:
+    """Return the process-wide retry budget, creating it with `settings` on first use."""
+    global _retry_budget
+    with _registry_lock:
+        if _retry_budget is None:
+            _retry_budget = RetryBudget(**settings)
+        return _retry_budget
+
+
+def reset_shared_state() -> List[str]:
+    """Drop all shared breakers and the shared retry budget. Returns the breaker names removed."""
+    global _retry_budget
+    with _registry_lock:
+        names = list(_breakers)
+        _breakers.clear()
+        _retry_budget = None
+        return names
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Type
+
+import httpx
+
+from pyapiary.api_connectors.circuit_breaker import is_outage_failure
+
+
+def is_overload(exc: BaseException) -> bool:
+    """429s, 5xx responses, timeouts and connection errors signal that we are sending too much."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return (exc.response is not None and exc.response.status_code == 429) or is_outage_failure(exc)
+    return isinstance(exc, httpx.TransportError)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive-increase / multiplicative-decrease) limit on in-flight requests.
+
+    Every healthy response raises the limit by `increase / limit`, i.e. by about
+    `increase` per full window of requests. A 429, 5xx, timeout or connection error, or
+    a response slower than `latency_tolerance` times the smoothed baseline latency,
+    multiplies the limit by `decrease`. Only requests started after the previous cut
+    can cut it again, so one burst of failures counts once. The limit stays within
+    `[min_limit, max_limit]`.
+
+    Used by AsyncBroker via `adaptive_concurrency=`; the current limit is exposed as
+    `limit` and, with in-flight and waiting counts, via `stats()`.
+    """
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        smoothing: float = 0.1,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._started = 0
+        self._last_cut = 0
+        self._baseline: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self._baseline,
+            "decreases": self.decreases,
+        }
+
+    async def acquire(self) -> int:
+        """Wait for a free slot. Returns a ticket to pass to `release`."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # We were woken but will not use the slot; pass it on
+                    self._wake()
+                raise
+        self._in_flight += 1
+        self._started += 1
+        return self._started
+
+    def release(self, ticket: int, latency: Optional[float] = None, exc: Optional[BaseException] = None) -> None:
+        """Free a slot and adapt the limit to the request's outcome."""
+        self._in_flight -= 1
+        if exc is not None and is_overload(exc):
+            self._cut(ticket)
+        elif exc is None or isinstance(exc, httpx.HTTPStatusError):
+            # 4xx answers other than 429 still say the server is healthy
+            if latency is not None and self._is_latency_spike(latency):
+                self._cut(ticket)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+        self._wake()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        baseline = self._baseline
+        self._baseline = latency if baseline is None else baseline + self.smoothing * (latency - baseline)
+        return (
+            baseline is not None
+            and self.latency_tolerance is not None
+            and latency > baseline * self.latency_tolerance
+        )
+
+    def _cut(self, ticket: int) -> None:
+        if ticket <= self._last_cut:
+            return
+        self._last_cut = self._started
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self.decreases += 1
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def slot(self) -> "_Slot":
+        """`async with limiter.slot():` around one request; timing and outcome are recorded."""
+        return _Slot(self)
+
+
+class _Slot:
+    __slots__ = ("_limiter", "_ticket", "_start")
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter):
+        self._limiter = limiter
+        self._ticket = 0
+        self._start = 0.0
+
+    async def __aenter__(self) -> "_Slot":
+        self._ticket = await self._limiter.acquire()
+        self._start = self._limiter._clock()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Any,
+    ) -> None:
+        latency = self._limiter._clock() - self._start
+        if isinstance(exc, asyncio.CancelledError):
+            # A cancelled request says nothing about the server
+            self._limiter._in_flight -= 1
+            self._limiter._wake()
+            return
+        self._limiter.release(self._ticket, latency, exc)
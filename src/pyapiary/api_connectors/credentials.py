@@ -0,0 +1,203 @@
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Union
+
+import httpx
+
+from pyapiary.api_connectors import json_codec
+from pyapiary.api_connectors.retry import parse_retry_after
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    return response.status_code == 429
+
+
+class _KeyState:
+    __slots__ = ("key", "requests", "throttled", "parked_until", "last_throttled")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.requests = 0
+        self.throttled = 0
+        self.parked_until = 0.0
+        self.last_throttled = float("-inf")
+
+
+def mask_key(key: str) -> str:
+    return f"...{key[-4:]}" if len(key) > 4 else "..."
+
+
+class CredentialPool:
+    """
+    A thread-safe pool of API keys for one vendor account.
+
+    Keys are handed out round-robin (`strategy="round_robin"`) or, with
+    `strategy="least_recently_throttled"`, preferring the key whose last throttling is
+    furthest in the past. A key that is throttled (HTTP 429 or a vendor quota error) is
+    parked for as long as the response's Retry-After/rate-limit headers ask, or
+    `park_seconds` otherwise, and skipped until it recovers. When every key is parked
+    the one that recovers first is used, so the broker's normal backoff takes over.
+
+    Args:
+        keys (Sequence[str]): the API keys.
+        strategy (str): "round_robin" or "least_recently_throttled".
+        park_seconds (float): how long to park a throttled key without a reset header.
+        max_park_seconds (float): upper bound on a header-provided parking time.
+    """
+    STRATEGIES = ("round_robin", "least_recently_throttled")
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        strategy: str = "round_robin",
+        park_seconds: float = 60.0,
+        max_park_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        keys = [k for k in dict.fromkeys(keys) if k]
+        if not keys:
+            raise ValueError("CredentialPool needs at least one key")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Invalid strategy: {strategy}. Must be one of: {', '.join(self.STRATEGIES)}")
+        self.strategy = strategy
+        self.park_seconds = park_seconds
+        self.max_park_seconds = max_park_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states = [_KeyState(k) for k in keys]
+        self._by_key = {s.key: s for s in self._states}
+        self._cursor = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @property
+    def keys(self) -> List[str]:
+        return [s.key for s in self._states]
+
+    def acquire(self, exclude: Sequence[str] = ()) -> str:
+        """Pick the key for the next request, skipping parked keys and `exclude`."""
+        with self._lock:
+            now = self._clock()
+            candidates = [s for s in self._states if s.key not in exclude] or self._states
+            available = [s for s in candidates if s.parked_until <= now]
+            if not available:
+                chosen = min(candidates, key=lambda s: s.parked_until)
+            elif self.strategy == "round_robin":
+                chosen = available[next(self._cursor) % len(available)]
+            else:
+                chosen = min(available, key=lambda s: (s.last_throttled, s.requests))
+            chosen.requests += 1
+            return chosen.key
+
+    def available(self, exclude: Sequence[str] = ()) -> bool:
+        """True if some key outside `exclude` is not parked."""
+        with self._lock:
+            now = self._clock()
+            return any(s.parked_until <= now for s in self._states if s.key not in exclude)
+
+    def park(self, key: str, seconds: Optional[float] = None) -> None:
+        """Mark `key` as throttled and skip it for `seconds` (default `park_seconds`)."""
+        seconds = self.park_seconds if seconds is None else min(seconds, self.max_park_seconds)
+        with self._lock:
+            state = self._by_key[key]
+            now = self._clock()
+            state.throttled += 1
+            state.last_throttled = now
+            state.parked_until = max(state.parked_until, now + seconds)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-key usage counters; keys are masked to their last four characters."""
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "key": mask_key(s.key),
+                    "requests": s.requests,
+                    "throttled": s.throttled,
+                    "parked_for": max(0.0, s.parked_until - now),
+                }
+                for s in self._states
+            ]
+
+
+def as_credential_pool(value: Union[None, str, Sequence[str], CredentialPool]) -> Optional[CredentialPool]:
+    """
+    Return a CredentialPool when `value` holds several keys (a pool, a sequence, or a
+    comma-separated string such as `URLSCAN_API_KEY=key1,key2`), or None for a single key.
+    """
+    if value is None or isinstance(value, CredentialPool):
+        return value
+    keys = [k.strip() for k in value.split(",")] if isinstance(value, str) else list(value)
+    keys = [k for k in keys if k]
+    return CredentialPool(keys) if len(keys) > 1 else None
+
+
+def single_key(value: Union[None, str, Sequence[str]]) -> Optional[str]:
+    """The one key held by `value` when `as_credential_pool(value)` is None."""
+    if value is None or isinstance(value, str):
+        return value.strip() if value else value
+    return next(iter(value), None)
+
+
+def resolve_api_key(value: Union[None, str, Sequence[str], CredentialPool]) -> Union[None, str, CredentialPool]:
+    """Normalize a connector's key argument to a single key string or a CredentialPool."""
+    return as_credential_pool(value) or single_key(value)
+
+
+class PooledKeyAuth(httpx.Auth):
+    """
+    httpx auth flow that signs each request with a key from a CredentialPool, either as
+    a header or as a field of the JSON body. When the response is throttled the key is
+    parked and the request is re-sent at once with another available key.
+
+    Args:
+        pool (CredentialPool): the keys to draw from.
+        header (str | None): header name that carries the key.
+        json_field (str | None): JSON body field that carries the key.
+        is_throttled (Callable[[httpx.Response], bool]): detects throttling/quota errors.
+            Set `requires_body=True` if it needs to read the response body.
+    """
+    def __init__(
+        self,
+        pool: CredentialPool,
+        header: Optional[str] = None,
+        json_field: Optional[str] = None,
+        is_throttled: Callable[[httpx.Response], bool] = is_rate_limited,
+        requires_body: bool = False,
+    ):
+        if (header is None) == (json_field is None):
+            raise ValueError("Exactly one of 'header' or 'json_field' must be given")
+        self.pool = pool
+        self.header = header
+        self.json_field = json_field
+        self.is_throttled = is_throttled
+        self.requires_response_body = requires_body
+
+    def _sign(self, request: httpx.Request, key: str) -> httpx.Request:
+        if self.header is not None:
+            request.headers[self.header] = key
+            return request
+        body = json_codec.loads(request.content) if request.content else {}
+        body[self.json_field] = key
+        headers = [(k, v) for k, v in request.headers.multi_items() if k.lower() != "content-length"]
+        return httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=json_codec.dumps(body),
+            extensions=request.extensions,
+        )
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        tried: List[str] = []
+        while True:
+            key = self.pool.acquire(exclude=tried)
+            tried.append(key)
+            response = yield self._sign(request, key)
+            if not self.is_throttled(response):
+                return
+            self.pool.park(key, parse_retry_after(response.headers))
+            if len(tried) >= len(self.pool) or not self.pool.available(exclude=tried):
+                return
@@ -0,0 +1,123 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, Union
+
+import httpx
+from tenacity import RetryCallState
+from tenacity.wait import wait_base
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call's total deadline (attempts, retries and waits) runs out."""
+    def __init__(self, budget: float, elapsed: float):
+        super().__init__(f"Deadline of {budget:.3f}s exceeded after {elapsed:.3f}s")
+        self.budget = budget
+        self.elapsed = elapsed
+
+
+class Deadline:
+    """
+    A point in time by which a call must finish, shared by every attempt and backoff
+    sleep made on its behalf.
+    """
+    __slots__ = ("budget", "expires_at", "_clock")
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.budget = seconds
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def exceeded(self) -> DeadlineExceeded:
+        return DeadlineExceeded(self.budget, self.budget - (self.expires_at - self._clock()))
+
+    def check(self, needed: float = 0.0) -> float:
+        """Return the remaining time, or raise DeadlineExceeded if it is not more than `needed`."""
+        remaining = self.remaining()
+        if remaining <= needed:
+            raise self.exceeded()
+        return remaining
+
+    def attempt_timeout(self, timeout: Union[None, float, httpx.Timeout]) -> httpx.Timeout:
+        """`timeout` with every phase shortened to the time left on the deadline."""
+        remaining = self.check()
+        base = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        return httpx.Timeout(**{
+            phase: remaining if value is None else min(value, remaining)
+            for phase, value in base.as_dict().items()
+        })
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("pyapiary_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline set by the innermost enclosing `with_deadline`, if any."""
+    return _current.get()
+
+
+def earliest(*deadlines: Optional[Deadline]) -> Optional[Deadline]:
+    """The deadline that expires first, ignoring None."""
+    present = [d for d in deadlines if d is not None]
+    return min(present, key=lambda d: d.expires_at) if present else None
+
+
+@contextmanager
+def with_deadline(seconds: float) -> Iterator[Deadline]:
+    """
+    Bound every connector request made inside the block, in this thread or task, by one
+    shared deadline. Nested blocks can only shorten an enclosing deadline.
+
+        with with_deadline(2.0):
+            scan = conn.results(uuid)
+            dom = conn.get_dom(uuid)
+    """
+    scoped = earliest(Deadline(seconds), _current.get())
+    with _use_deadline(scoped):
+        yield scoped
+
+
+@contextmanager
+def _use_deadline(deadline: Optional[Deadline]) -> Iterator[None]:
+    """Make `deadline` the current one inside the block; None leaves the current one in place."""
+    if deadline is None:
+        yield
+        return
+    token = _current.set(deadline)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class wait_within_deadline(wait_base):
+    """
+    Wrap a tenacity wait strategy so that a backoff sleep which would outlast the
+    deadline raises DeadlineExceeded at once instead of sleeping.
+
+    tenacity computes the wait before it checks `stop`, so pass the retryer's stop
+    condition: when no further attempt is coming, the wait is returned unchanged and
+    tenacity re-raises the last attempt's real error.
+    """
+    def __init__(self, wait: wait_base, deadline: Deadline, stop: Optional[Callable[[RetryCallState], bool]] = None):
+        self.wait = wait
+        self.deadline = deadline
+        self.stop = stop
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        sleep = self.wait(retry_state)
+        if sleep < self.deadline.remaining():
+            return sleep
+        if self.stop is not None:
+            # tenacity stores the wait here next; set it now so delay-based stops see it
+            retry_state.upcoming_sleep = sleep
+            if self.stop(retry_state):
+                return sleep
+        last = retry_state.outcome.exception() if retry_state.outcome else None
+        raise self.deadline.exceeded() from last
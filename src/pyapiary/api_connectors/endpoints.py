@@ -0,0 +1,144 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+
+class _EndpointState:
+    __slots__ = ("url", "weight", "latency", "error_rate", "failures", "down_until", "requests")
+
+    def __init__(self, url: str, weight: float):
+        self.url = url
+        self.weight = weight
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.down_until = 0.0
+        self.requests = 0
+
+
+class EndpointPool:
+    """
+    A set of interchangeable base URLs for one vendor, such as regional endpoints or
+    caching reverse proxies, with per-endpoint health tracking.
+
+    Each response updates the endpoint's smoothed latency and error rate. Connection
+    errors, timeouts and 5xx responses count as errors. After `failure_threshold`
+    consecutive errors, or once the error rate passes `max_error_rate`, an endpoint is
+    taken out of rotation for `cooldown` seconds and then gets a trial request again.
+
+    Strategies:
+        - "latency": the healthy endpoint with the lowest smoothed latency divided by
+          its weight. With probability `explore` a random healthy endpoint is picked
+          instead, so latencies of the others stay current.
+        - "ordered": the first healthy endpoint, i.e. primary with fallbacks.
+        - "weighted": a random healthy endpoint, in proportion to its weight.
+
+    When every endpoint is down, the one that comes back first is used.
+
+    Args:
+        urls (Sequence[str] | Mapping[str, float]): base URLs in priority order, or a
+            mapping of base URL to weight.
+    """
+    STRATEGIES = ("latency", "ordered", "weighted")
+
+    def __init__(
+        self,
+        urls: Union[Sequence[str], Mapping[str, float]],
+        strategy: str = "latency",
+        failure_threshold: int = 3,
+        max_error_rate: float = 0.5,
+        cooldown: float = 30.0,
+        smoothing: float = 0.2,
+        explore: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        weights = dict(urls) if isinstance(urls, Mapping) else {url: 1.0 for url in urls}
+        if not weights:
+            raise ValueError("EndpointPool needs at least one URL")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Invalid strategy: {strategy}. Must be one of: {', '.join(self.STRATEGIES)}")
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.explore = explore
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._states = [_EndpointState(url.rstrip("/"), float(weight)) for url, weight in weights.items()]
+        self._by_url = {s.url: s for s in self._states}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @property
+    def urls(self) -> List[str]:
+        return [s.url for s in self._states]
+
+    def _healthy(self, exclude: Sequence[str], now: float) -> List[_EndpointState]:
+        return [s for s in self._states if s.url not in exclude and s.down_until <= now]
+
+    def choose(self, exclude: Sequence[str] = ()) -> str:
+        """Pick the base URL for the next attempt, avoiding `exclude` while others remain."""
+        with self._lock:
+            now = self._clock()
+            candidates = [s for s in self._states if s.url not in exclude] or self._states
+            healthy = [s for s in candidates if s.down_until <= now]
+            if not healthy:
+                chosen = min(candidates, key=lambda s: s.down_until)
+            elif self.strategy == "ordered":
+                chosen = healthy[0]
+            elif self.strategy == "weighted" or self._rng.random() < self.explore:
+                chosen = self._rng.choices(healthy, weights=[s.weight for s in healthy])[0]
+            else:
+                # Endpoints without a measurement yet sort first, so each gets tried
+                chosen = min(healthy, key=lambda s: -1.0 if s.latency is None else s.latency / s.weight)
+            chosen.requests += 1
+            return chosen.url
+
+    def available(self, exclude: Sequence[str] = ()) -> bool:
+        """True if some endpoint outside `exclude` is in rotation."""
+        with self._lock:
+            return bool(self._healthy(exclude, self._clock()))
+
+    def record(self, url: str, latency: float, failed: bool) -> None:
+        """Update `url`'s latency and error statistics with the outcome of one attempt."""
+        with self._lock:
+            state = self._by_url.get(url.rstrip("/"))
+            if state is None:
+                return
+            alpha = self.smoothing
+            state.error_rate += alpha * ((1.0 if failed else 0.0) - state.error_rate)
+            if not failed:
+                state.latency = latency if state.latency is None else state.latency + alpha * (latency - state.latency)
+                state.failures = 0
+                return
+            state.failures += 1
+            if state.failures >= self.failure_threshold or state.error_rate > self.max_error_rate:
+                state.down_until = self._clock() + self.cooldown
+                state.failures = 0
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "url": s.url,
+                    "weight": s.weight,
+                    "latency": s.latency,
+                    "error_rate": s.error_rate,
+                    "requests": s.requests,
+                    "down_for": max(0.0, s.down_until - now),
+                }
+                for s in self._states
+            ]
+
+
+def as_endpoint_pool(value: Union[None, Sequence[str], Mapping[str, float], EndpointPool]) -> Optional[EndpointPool]:
+    """Normalize a connector's `base_urls` argument; None means a single fixed base_url."""
+    if value is None or isinstance(value, EndpointPool):
+        return value
+    return EndpointPool(value)
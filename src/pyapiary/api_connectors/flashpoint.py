@@ -1,6 +1,7 @@
 import httpx
 from typing import Optional
 from pyapiary.api_connectors.broker import Broker, AsyncBroker, bubble_broker_init_signature, log_method_call
+from pyapiary.api_connectors.streaming import DownloadResult, PathOrFile
 
 @bubble_broker_init_signature()
 class FlashpointConnector(Broker):
@@ -89,6 +90,37 @@ class FlashpointConnector(Broker):
         safe_headers = {"Authorization": f"Bearer {self.api_key}"}
         return self.get("/sources/v1/media/", headers=safe_headers, params={"asset_id": query})
 
+    @log_method_call
+    def download_media_image(
+        self,
+        query: str,
+        destination: Optional[PathOrFile] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> DownloadResult:
+        """
+        Stream an image asset by storage_uri to disk without buffering it in memory.
+
+        Args:
+            query (str): The storage_uri (asset_id) of the image to download.
+            destination (str | PathLike | IO[bytes] | None): File path or binary file object to
+                write to; None spools to a temporary file.
+            max_bytes (Optional[int]): Abort if the image is larger than this many bytes.
+            **kwargs: Additional request options (e.g. `timeout`), passed to `download_to`.
+
+        Returns:
+            DownloadResult: destination, size, sha256 digest and content type of the image
+        """
+        safe_headers = {"Authorization": f"Bearer {self.api_key}"}
+        return self.download_to(
+            "/sources/v1/media/",
+            destination=destination,
+            params={"asset_id": query},
+            max_bytes=max_bytes,
+            headers=safe_headers,
+            **kwargs,
+        )
+
     @log_method_call
     def search_checks(self, query: str, **kwargs) -> httpx.Response:
         """
@@ -183,6 +215,34 @@ class AsyncFlashpointConnector(AsyncBroker):
         safe_headers = {"Authorization": f"Bearer {self.api_key}"}
         return await self.get("/sources/v1/media/", headers=safe_headers, params={"asset_id": query})
 
+    @log_method_call
+    async def download_media_image(
+        self,
+        query: str,
+        destination: Optional[PathOrFile] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> DownloadResult:
+        """
+        Stream an image asset by storage_uri to disk without buffering it in memory.
+
+        Args:
+            query (str): The storage_uri (asset_id) of the image to download.
+            destination (str | PathLike | IO[bytes] | None): File path or binary file object to
+                write to; None spools to a temporary file.
+            max_bytes (Optional[int]): Abort if the image is larger than this many bytes.
+            **kwargs: Additional request options (e.g. `timeout`), passed to `download_to`.
+        """
+        safe_headers = {"Authorization": f"Bearer {self.api_key}"}
+        return await self.download_to(
+            "/sources/v1/media/",
+            destination=destination,
+            params={"asset_id": query},
+            max_bytes=max_bytes,
+            headers=safe_headers,
+            **kwargs,
+        )
+
     @log_method_call
     async def search_checks(self, query: str, **kwargs) -> httpx.Response:
         """
@@ -0,0 +1,238 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, TypeVar
+
+from pyapiary.api_connectors.metrics import normalize_endpoint
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Decides when a slow idempotent request gets a second, "hedged" copy.
+
+    The hedge fires after a fixed `delay`, or, when `delay` is None, after the observed
+    `percentile` latency of the endpoint (identifier-like path segments are collapsed,
+    so `/result/<uuid>` shares one history). Until an endpoint has `min_samples`
+    latencies no hedges are sent for it. Whichever copy answers first wins.
+
+    Hedges are capped by the same sliding-window budget as retries: over `window`
+    seconds at most `max_ratio * requests` hedges go out. With the default of 0.1,
+    hedging can add at most 10% to the calls made against the vendor's quota.
+
+    Args:
+        delay (float | None): fixed hedge delay in seconds; None to use the percentile.
+        percentile (float): latency percentile used as the adaptive delay.
+        min_delay (float): lower bound for the adaptive delay.
+        min_samples (int): latencies needed before an endpoint is hedged adaptively.
+        history (int): latencies kept per endpoint.
+        max_ratio (float): maximum hedges per request over the window.
+        window (float): seconds covered by the hedge budget.
+        methods (Iterable[str]): HTTP methods that may be hedged; keep these idempotent.
+        max_workers (int): threads used by the sync Broker to run the two copies.
+    """
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        history: int = 200,
+        max_ratio: float = 0.1,
+        window: float = 10.0,
+        methods: Iterable[str] = ("GET",),
+        max_workers: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.history = history
+        self.max_ratio = max_ratio
+        self.window = window
+        self.methods = {m.upper() for m in methods}
+        self.max_workers = max_workers
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._requests: Deque[float] = deque()
+        self._hedges: Deque[float] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+
+    def applies_to(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        key = normalize_endpoint(endpoint)
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.history)
+            samples.append(seconds)
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to `endpoint`, or None to not hedge."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = self._latencies.get(normalize_endpoint(endpoint))
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def _trim(self, now: float) -> None:
+        horizon = now - self.window
+        for events in (self._requests, self._hedges):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_hedge(self) -> bool:
+        """Withdraw one hedge from the budget. Returns False if the budget is exhausted."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            if len(self._hedges) >= self.max_ratio * len(self._requests):
+                self.rejected += 1
+                return False
+            self._hedges.append(now)
+            self.hedged += 1
+            return True
+
+    def _record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = sorted(self._latencies)
+        return {
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "rejected": self.rejected,
+            "delays": {endpoint: self.hedge_delay(endpoint) for endpoint in endpoints},
+        }
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pyapiary-hedge")
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the threads used for sync hedging."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _timed(policy: HedgePolicy, endpoint: str, send: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = send()
+    policy.record_latency(endpoint, time.perf_counter() - start)
+    return result
+
+
+async def _atimed(policy: HedgePolicy, endpoint: str, send: Callable[[], Awaitable[T]]) -> T:
+    start = time.perf_counter()
+    result = await send()
+    policy.record_latency(endpoint, time.perf_counter() - start)
+    return result
+
+
+def hedged_call(
+    policy: HedgePolicy,
+    endpoint: str,
+    send: Callable[[], T],
+    send_hedge: Optional[Callable[[], T]] = None,
+) -> T:
+    """
+    Run `send()` and, if it has not finished `delay` seconds after it started, a second
+    copy (`send_hedge()`, default `send()`). Both copies run on the policy's thread pool
+    in a copy of the caller's context; the delay is counted from when the primary starts
+    running, so time spent queued for a busy pool does not trigger a hedge. Returns the
+    first result that does not raise; if both raise, the first request's exception
+    propagates. A blocking httpx request cannot be aborted, so the losing copy runs to
+    completion in the background and its result is discarded.
+    """
+    policy.record_request()
+    delay = policy.hedge_delay(endpoint)
+    if delay is None:
+        return _timed(policy, endpoint, send)
+    pool = policy._pool()
+    started = threading.Event()
+
+    def run_primary() -> T:
+        started.set()
+        return _timed(policy, endpoint, send)
+
+    primary = pool.submit(contextvars.copy_context().run, run_primary)
+    started.wait()
+    done, _ = wait([primary], timeout=delay)
+    if done or not policy.try_hedge():
+        return primary.result()
+    hedge = pool.submit(contextvars.copy_context().run, _timed, policy, endpoint, send_hedge or send)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in (f for f in (primary, hedge) if f in done):
+            if future.exception() is None:
+                if future is hedge:
+                    policy._record_win()
+                return future.result()
+    return primary.result()
+
+
+async def ahedged_call(
+    policy: HedgePolicy,
+    endpoint: str,
+    send: Callable[[], Awaitable[T]],
+    send_hedge: Optional[Callable[[], Awaitable[T]]] = None,
+) -> T:
+    """
+    Async counterpart of `hedged_call`. Both copies run as tasks on the current loop and
+    the losing copy is cancelled as soon as a winner is known.
+    """
+    policy.record_request()
+    delay = policy.hedge_delay(endpoint)
+    if delay is None:
+        return await _atimed(policy, endpoint, send)
+    primary = asyncio.ensure_future(_atimed(policy, endpoint, send))
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or not policy.try_hedge():
+            return await primary
+        hedge = asyncio.ensure_future(_atimed(policy, endpoint, send_hedge or send))
+        pending.add(hedge)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in (t for t in (primary, hedge) if t in done):
+                if task.exception() is None:
+                    if task is hedge:
+                        policy._record_win()
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -1,7 +1,26 @@
 import httpx
-from typing import Optional
+from typing import Dict, Optional, Sequence, Union
 from urllib.parse import quote
 from pyapiary.api_connectors.broker import Broker, AsyncBroker, bubble_broker_init_signature, log_method_call
+from pyapiary.api_connectors.credentials import CredentialPool, PooledKeyAuth, is_rate_limited, resolve_api_key
+from pyapiary.api_connectors import json_codec
+
+
+def is_quota_exceeded(response: httpx.Response) -> bool:
+    """IPQS reports an exhausted quota as a 200 response with `success: false`."""
+    if is_rate_limited(response):
+        return True
+    if response.status_code != 200:
+        return False
+    try:
+        body = json_codec.response_json(response)
+    except ValueError:
+        return False
+    if not isinstance(body, dict) or body.get("success") is not False:
+        return False
+    message = str(body.get("message", "")).lower()
+    return "quota" in message or "exceeded" in message
+
 
 @bubble_broker_init_signature()
 class IPQSConnector(Broker):
@@ -13,15 +32,25 @@ class IPQSConnector(Broker):
     through the shared Broker infrastructure.
 
     Attributes:
-        api_key (str): The API key used to authenticate with IPQS.
+        api_key (str | CredentialPool): The API key used to authenticate with IPQS, or a
+            pool of keys (also accepted as a list or a comma-separated string).
     """
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
+    def __init__(self, api_key: Optional[Union[str, Sequence[str], CredentialPool]] = None, **kwargs):
         super().__init__(base_url="https://ipqualityscore.com/api/json", **kwargs)
 
-        self.api_key = api_key or self.env_config.get("IPQS_API_KEY")
+        api_key = api_key or self.env_config.get("IPQS_API_KEY")
+        self.api_key = resolve_api_key(api_key)
         if not self.api_key:
             raise ValueError("API key is required for IPQSConnector")
         self.headers.update({"Content-Type": "application/json"})
+        if isinstance(self.api_key, CredentialPool):
+            self.default_auth = PooledKeyAuth(
+                self.api_key, json_field="key", is_throttled=is_quota_exceeded, requires_body=True
+            )
+
+    def _key_field(self) -> Dict[str, str]:
+        # With a key pool, PooledKeyAuth adds the key to each request body instead
+        return {} if isinstance(self.api_key, CredentialPool) else {"key": self.api_key}
 
     @log_method_call
     def malicious_url(self, query: str, **kwargs) -> httpx.Response:
@@ -36,7 +65,7 @@ class IPQSConnector(Broker):
             httpx.Response: the httpx.Response object
         """
         encoded_query: str = quote(query, safe="")
-        return self.post(f"/url/", json={"url": query, "key": self.api_key, **kwargs})
+        return self.post(f"/url/", json={"url": query, **self._key_field(), **kwargs})
 
 
 @bubble_broker_init_signature()
@@ -44,13 +73,21 @@ class AsyncIPQSConnector(AsyncBroker):
     """
     Async version of IPQSConnector using AsyncBroker infrastructure.
     """
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
+    def __init__(self, api_key: Optional[Union[str, Sequence[str], CredentialPool]] = None, **kwargs):
         super().__init__(base_url="https://ipqualityscore.com/api/json", **kwargs)
 
-        self.api_key = api_key or self.env_config.get("IPQS_API_KEY")
+        api_key = api_key or self.env_config.get("IPQS_API_KEY")
+        self.api_key = resolve_api_key(api_key)
         if not self.api_key:
             raise ValueError("API key is required for AsyncIPQSConnector")
         self.headers.update({"Content-Type": "application/json"})
+        if isinstance(self.api_key, CredentialPool):
+            self.default_auth = PooledKeyAuth(
+                self.api_key, json_field="key", is_throttled=is_quota_exceeded, requires_body=True
+            )
+
+    def _key_field(self) -> Dict[str, str]:
+        return {} if isinstance(self.api_key, CredentialPool) else {"key": self.api_key}
 
     @log_method_call
     async def malicious_url(self, query: str, **kwargs) -> httpx.Response:
@@ -65,4 +102,4 @@ class AsyncIPQSConnector(AsyncBroker):
             httpx.Response: the httpx.Response object
         """
         encoded_query: str = quote(query, safe="")
-        return await self.post(f"/url/", json={"url": query, "key": self.api_key, **kwargs})
+        return await self.post(f"/url/", json={"url": query, **self._key_field(), **kwargs})
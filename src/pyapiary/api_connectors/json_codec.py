@@ -0,0 +1,74 @@
+# JSON encoding/decoding used by Broker and AsyncBroker. Uses orjson or msgspec when
+# either is importable and falls back to the standard library otherwise, so installing
+# one of them (`pip install orjson`) speeds up large bodies without code changes.
+import json as _stdlib_json
+from typing import Any, Callable, Optional
+
+import httpx
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Mirrors httpx's own encoding of `json=` bodies
+    return _stdlib_json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    return _stdlib_json.loads(data)
+
+
+_fast_dumps: Optional[Callable[[Any], bytes]] = None
+_fast_loads: Optional[Callable[[bytes], Any]] = None
+_fast_errors: tuple = (TypeError, ValueError)
+
+try:
+    import orjson
+
+    _fast_dumps = orjson.dumps
+    _fast_loads = orjson.loads
+    backend = "orjson"
+except ImportError:
+    try:
+        import msgspec
+
+        _fast_dumps = msgspec.json.encode
+        _fast_loads = msgspec.json.decode
+        _fast_errors = (TypeError, ValueError, msgspec.MsgspecError)
+        backend = "msgspec"
+    except ImportError:
+        backend = "json"
+
+
+def has_fast_backend() -> bool:
+    """True when orjson or msgspec is available."""
+    return _fast_dumps is not None
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode `obj` as UTF-8 JSON bytes, falling back to the stdlib for types the fast codec rejects."""
+    if _fast_dumps is not None:
+        try:
+            return _fast_dumps(obj)
+        except _fast_errors:
+            pass
+    return _stdlib_dumps(obj)
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON bytes with the fastest available codec."""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except _fast_errors:
+            # Let the stdlib produce its usual error (or handle non-UTF-8 input)
+            pass
+    return _stdlib_loads(data)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode an httpx.Response body; a drop-in replacement for `response.json()`."""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(response.content)
+        except _fast_errors:
+            pass
+    return response.json()
@@ -0,0 +1,277 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# Path segments that look like identifiers (UUIDs, hashes, numbers, domains, emails,
+# IPs, phone numbers) are collapsed so that metrics stay low-cardinality.
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F-]{16,}|\d+|\+?[\d\s().-]{7,}|.*[@.:].*|[A-Za-z0-9_-]{32,})$"
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse identifier-like path segments, e.g. "/api/v1/result/<uuid>" -> "/api/v1/result/{id}"."""
+    path = endpoint.split("?", 1)[0]
+    segments = [
+        "{id}" if segment and _ID_SEGMENT.match(segment) else segment
+        for segment in path.lstrip("/").split("/")
+    ]
+    return "/" + "/".join(segments)
+
+
+class AttemptTimer:
+    """
+    Times a single HTTP attempt. Passed to httpcore as the `trace` request extension to
+    capture connection-pool wait, TCP connect, TLS handshake and server time.
+    """
+    __slots__ = ("start", "events")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.events: Dict[str, float] = {}
+
+    def trace(self, name: str, info: Mapping[str, Any]) -> None:
+        # Drop the "connection." / "http11." / "http2." prefix
+        event = name.split(".", 1)[-1]
+        self.events.setdefault(event, time.perf_counter())
+
+    async def atrace(self, name: str, info: Mapping[str, Any]) -> None:
+        self.trace(name, info)
+
+    def inject(self, request_kwargs: Dict[str, Any], is_async: bool) -> Dict[str, Any]:
+        """Return request kwargs with this timer installed as the trace extension."""
+        extensions = dict(request_kwargs.get("extensions") or {})
+        if "trace" in extensions:
+            return request_kwargs
+        extensions["trace"] = self.atrace if is_async else self.trace
+        return {**request_kwargs, "extensions": extensions}
+
+    def _span(self, begin: str, end: str) -> Optional[float]:
+        if begin in self.events and end in self.events:
+            return self.events[end] - self.events[begin]
+        return None
+
+    def phases(self) -> Dict[str, float]:
+        phases: Dict[str, float] = {}
+        first_io = self.events.get("connect_tcp.started", self.events.get("send_request_headers.started"))
+        if first_io is not None:
+            phases["pool_wait"] = first_io - self.start
+        for phase, begin, end in (
+            ("connect", "connect_tcp.started", "connect_tcp.complete"),
+            ("tls", "start_tls.started", "start_tls.complete"),
+            ("server", "send_request_headers.started", "receive_response_headers.complete"),
+        ):
+            span = self._span(begin, end)
+            if span is not None:
+                phases[phase] = span
+        return phases
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    In-process registry of per-connector, per-endpoint request metrics.
+
+    Records, for every HTTP attempt made by a Broker/AsyncBroker with `metrics` set:
+    latency histograms (total, pool wait, connect, TLS, server time), response status
+    counts, retries and retry sleep time, and request/response payload sizes. Dump with
+    `to_prometheus()` or `snapshot()`, or forward every observation to OpenTelemetry
+    with `OpenTelemetryForwarder`.
+
+    Args:
+        buckets (Sequence[float]): histogram bucket upper bounds, in seconds.
+        endpoint_label (Callable[[str], str]): maps an endpoint path to its label value.
+    """
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        endpoint_label: Callable[[str], str] = normalize_endpoint,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.endpoint_label = endpoint_label
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._listeners: List[Callable[[str, str, float, Dict[str, str]], None]] = []
+
+    def add_listener(self, listener: Callable[[str, str, float, Dict[str, str]], None]) -> None:
+        """Register `listener(kind, name, value, labels)`, called for every observation."""
+        self._listeners.append(listener)
+
+    def _observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(self.buckets)
+            hist.observe(value)
+        for listener in self._listeners:
+            listener("histogram", name, value, labels)
+
+    def _inc(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+        for listener in self._listeners:
+            listener("counter", name, value, labels)
+
+    def record_attempt(
+        self,
+        connector: str,
+        method: str,
+        endpoint: str,
+        duration: float,
+        response: Optional[httpx.Response] = None,
+        exc: Optional[BaseException] = None,
+        timer: Optional[AttemptTimer] = None,
+    ) -> None:
+        labels = {"connector": connector, "endpoint": self.endpoint_label(endpoint), "method": method.upper()}
+        self._observe("pyapiary_request_duration_seconds", duration, labels)
+
+        if response is None and isinstance(exc, httpx.HTTPStatusError):
+            response = exc.response
+        status = str(response.status_code) if response is not None else type(exc).__name__
+        self._inc("pyapiary_responses_total", 1, {**labels, "status": status})
+
+        if timer is not None:
+            for phase, seconds in timer.phases().items():
+                self._observe(f"pyapiary_{phase}_seconds", seconds, labels)
+
+        if response is not None:
+            sent = response.request.headers.get("Content-Length")
+            if sent and sent.isdigit():
+                self._inc("pyapiary_request_bytes_total", int(sent), labels)
+            # Zero for streamed responses whose body has not been read yet
+            if response.num_bytes_downloaded:
+                self._inc("pyapiary_response_bytes_total", response.num_bytes_downloaded, labels)
+
+    def record_retry(self, connector: str, method: str, endpoint: str, sleep: float) -> None:
+        labels = {"connector": connector, "endpoint": self.endpoint_label(endpoint), "method": method.upper()}
+        self._inc("pyapiary_retries_total", 1, labels)
+        self._inc("pyapiary_retry_sleep_seconds_total", sleep, labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a plain-dict copy of all series, keyed by metric name."""
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), "count": h.count, "sum": h.sum,
+                         "buckets": dict(zip(list(self.buckets) + [float("inf")], h.counts))}
+                        for key, h in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+        def fmt(labels: Labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+            pairs = tuple(sorted(labels + extra))
+            if not pairs:
+                return ""
+            body = ",".join(
+                '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                for k, v in pairs
+            )
+            return "{" + body + "}"
+
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for key, h in self._histograms[name].items():
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, h.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{fmt(key, (('le', repr(bound)),))} {cumulative}")
+                    lines.append(f"{name}_bucket{fmt(key, (('le', '+Inf'),))} {h.count}")
+                    lines.append(f"{name}_sum{fmt(key)} {h.sum}")
+                    lines.append(f"{name}_count{fmt(key)} {h.count}")
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in self._counters[name].items():
+                    lines.append(f"{name}{fmt(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class OpenTelemetryForwarder:
+    """
+    Forwards registry observations to an OpenTelemetry meter, e.g.
+    `registry.add_listener(OpenTelemetryForwarder(metrics.get_meter("pyapiary")))`.
+    Instruments are created lazily, one per metric name.
+    """
+    def __init__(self, meter: Any):
+        self.meter = meter
+        self._instruments: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _instrument(self, kind: str, name: str) -> Any:
+        with self._lock:
+            instrument = self._instruments.get(name)
+            if instrument is None:
+                unit = "s" if name.endswith("_seconds") or name.endswith("_seconds_total") else (
+                    "By" if "bytes" in name else "1"
+                )
+                if kind == "histogram":
+                    instrument = self.meter.create_histogram(name, unit=unit)
+                else:
+                    instrument = self.meter.create_counter(name, unit=unit)
+                self._instruments[name] = instrument
+            return instrument
+
+    def __call__(self, kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        instrument = self._instrument(kind, name)
+        if kind == "histogram":
+            instrument.record(value, attributes=labels)
+        else:
+            instrument.add(value, attributes=labels)
+
+
+_default_registry: Optional[MetricsRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_default_registry() -> MetricsRegistry:
+    """Return the process-wide registry used by connectors created with `metrics=True`."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = MetricsRegistry()
+        return _default_registry
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by sync and async callers.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens every `per`
+    seconds. Each request reserves one token; when the bucket is empty the reservation
+    goes into debt and the caller is told how long to wait for its slot. Because the
+    reservation is made under a short lock and the wait happens outside of it, the same
+    limiter can safely be shared across threads, event loops and connector instances.
+
+    Usage:
+        # 5 requests per second, no bursting above the sustained rate
+        per_second = RateLimiter(rate=5, per=1.0, burst=1)
+        # 10,000 requests per day
+        per_day = RateLimiter(rate=10_000, per=86_400)
+
+        conn = URLScanConnector(rate_limit=[per_second, per_day])
+    """
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or per <= 0:
+            raise ValueError("RateLimiter requires a positive 'rate' and 'per'")
+        self.rate = rate
+        self.per = per
+        self.capacity = float(burst) if burst is not None else float(rate)
+        if self.capacity < 1:
+            raise ValueError("RateLimiter 'burst' must allow at least one request")
+        self._fill_rate = rate / per
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket and return how many seconds the caller must wait
+        before sending. Returns 0.0 when the request may go out immediately.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._fill_rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._fill_rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Give back `tokens` taken by `reserve` for a request that will not be sent."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block the current thread until `tokens` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Suspend the current task until `tokens` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, per={self.per}, burst={self.capacity})"
+
+
+RateLimitSpec = Union[RateLimiter, Sequence[RateLimiter]]
+
+
+def as_limiters(spec: Optional[RateLimitSpec]) -> List[RateLimiter]:
+    """Normalize a single limiter, a sequence of limiters, or None into a list."""
+    if spec is None:
+        return []
+    if isinstance(spec, RateLimiter):
+        return [spec]
+    return list(spec)
+
+
+def reserve_all(limiters: Iterable[RateLimiter]) -> float:
+    """Reserve a slot on every limiter and return the longest required wait."""
+    delay = 0.0
+    for limiter in limiters:
+        delay = max(delay, limiter.reserve())
+    return delay
+
+
+def refund_all(limiters: Iterable[RateLimiter]) -> None:
+    """Give back the slots taken by `reserve_all`."""
+    for limiter in limiters:
+        limiter.refund()
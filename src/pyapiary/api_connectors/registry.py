@@ -0,0 +1,240 @@
+import asyncio
+import atexit
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar
+
+import httpx
+
+from pyapiary.api_connectors.broker import AsyncBroker, SharedConnectorBase
+
+C = TypeVar("C", bound=SharedConnectorBase)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a connector configuration value into something usable in a registry key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        frozen = tuple(_freeze(v) for v in value)
+        return tuple(sorted(frozen, key=repr)) if isinstance(value, (set, frozenset)) else frozen
+    if isinstance(value, httpx.Limits):
+        return ("limits", value.max_connections, value.max_keepalive_connections, value.keepalive_expiry)
+    try:
+        hash(value)
+    except TypeError:
+        # Unhashable objects are shared by identity
+        return ("id", id(value))
+    return value
+
+
+class _Entry:
+    __slots__ = ("connector", "loop", "last_used")
+
+    def __init__(self, connector: SharedConnectorBase, loop: Optional[asyncio.AbstractEventLoop], now: float):
+        self.connector = connector
+        self.loop = weakref.ref(loop) if loop is not None else None
+        self.last_used = now
+
+    def loop_gone(self) -> bool:
+        if self.loop is None:
+            return False
+        loop = self.loop()
+        return loop is None or loop.is_closed()
+
+
+class ConnectorRegistry:
+    """
+    Hands out long-lived connector instances keyed by connector class and configuration,
+    so that repeated requests to the same vendor reuse one connection pool and keep-alive
+    connections instead of paying a TCP + TLS handshake each time.
+
+    Sync connectors (Broker subclasses) are shared across threads. Async connectors
+    (AsyncBroker subclasses) are bound to the event loop that was running when they were
+    requested, because an httpx.AsyncClient cannot be used from another loop.
+
+    Connectors that have not been requested for `idle_timeout` seconds are closed and
+    dropped by `evict_idle()`/`aevict_idle()`, which `get()` also runs opportunistically.
+    Call `close()` (or `await aclose()`) on shutdown; the process-wide registry from
+    `get_connector_registry()` closes its sync connectors at interpreter exit.
+
+    Do not use registry-provided connectors as context managers; leaving the `with`
+    block would close the shared client.
+
+    Args:
+        max_connections (int): per-connector pool size limit.
+        max_keepalive_connections (int): idle keep-alive connections kept per connector.
+        keepalive_expiry (float): seconds an idle keep-alive connection is kept open.
+        idle_timeout (float | None): seconds after which an unused connector is evicted;
+            None disables eviction.
+    """
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        idle_timeout: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Hashable, ...], _Entry] = {}
+        self._shutdown_hooks: List[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, connector_cls: Type[C], **config: Any) -> C:
+        """
+        Return the shared `connector_cls(**config)` instance, creating it on first use.
+        `limits` defaults to the registry's pool limits unless given in `config`.
+        """
+        loop: Optional[asyncio.AbstractEventLoop] = None
+        if issubclass(connector_cls, AsyncBroker):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        key = (connector_cls, id(loop) if loop is not None else None, _freeze(config))
+
+        stale: List[_Entry] = []
+        with self._lock:
+            entry = self._lookup(key, stale)
+        if entry is None:
+            # Build outside the lock so a slow constructor does not stall every other lookup
+            options = {"limits": self.limits, **config}
+            built = _Entry(connector_cls(**options), loop, self._clock())
+        with self._lock:
+            if entry is None:
+                entry = self._lookup(key, stale)
+                if entry is None:
+                    entry = self._entries[key] = built
+                else:
+                    # Another thread got there first; keep its connector
+                    stale.append(built)
+            now = self._clock()
+            entry.last_used = now
+            connector = entry.connector
+            stale.extend(self._pop_idle(now, keep=key))
+        self._close_entries(stale)
+        return connector
+
+    def _lookup(self, key: Tuple[Hashable, ...], stale: List[_Entry]) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.loop_gone():
+            # id() of a closed loop may be reused by a new one
+            stale.append(self._entries.pop(key))
+            entry = None
+        return entry
+
+    def _pop_idle(self, now: float, keep: Optional[Tuple[Hashable, ...]] = None) -> List[_Entry]:
+        popped = []
+        for key, entry in list(self._entries.items()):
+            if key == keep:
+                continue
+            idle = self.idle_timeout is not None and now - entry.last_used >= self.idle_timeout
+            if idle or entry.loop_gone():
+                popped.append(self._entries.pop(key))
+        return popped
+
+    @staticmethod
+    def _close_entries(entries: List[_Entry]) -> None:
+        for entry in entries:
+            session = entry.connector._session
+            if session is None:
+                continue
+            # Anyone still holding the connector gets a fresh client on next use
+            entry.connector._session = None
+            if isinstance(session, httpx.Client):
+                session.close()
+                continue
+            loop = entry.loop() if entry.loop is not None else None
+            if loop is not None and not loop.is_closed():
+                try:
+                    running = asyncio.get_running_loop()
+                except RuntimeError:
+                    running = None
+                if running is loop:
+                    loop.create_task(session.aclose())
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(session.aclose(), loop)
+            # A client whose loop has closed has already lost its connections
+
+    def evict_idle(self) -> int:
+        """Close and drop connectors idle for longer than `idle_timeout`. Returns how many were dropped."""
+        with self._lock:
+            popped = self._pop_idle(self._clock())
+        self._close_entries(popped)
+        return len(popped)
+
+    async def aevict_idle(self) -> int:
+        """Like `evict_idle`, but awaits the closing of async connectors on the running loop."""
+        with self._lock:
+            popped = self._pop_idle(self._clock())
+        await self._aclose_entries(popped)
+        return len(popped)
+
+    async def _aclose_entries(self, entries: List[_Entry]) -> None:
+        running = asyncio.get_running_loop()
+        deferred = []
+        for entry in entries:
+            session = entry.connector._session
+            bound = entry.loop() if entry.loop is not None else None
+            if isinstance(session, httpx.AsyncClient) and bound in (None, running):
+                entry.connector._session = None
+                await session.aclose()
+            else:
+                deferred.append(entry)
+        self._close_entries(deferred)
+
+    def add_shutdown_hook(self, hook: Callable[[], None]) -> None:
+        """Register `hook()` to run when the registry is closed, after its connectors."""
+        self._shutdown_hooks.append(hook)
+
+    def _drain(self) -> List[_Entry]:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        return entries
+
+    def _run_shutdown_hooks(self) -> None:
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for hook in hooks:
+            hook()
+
+    def close(self) -> None:
+        """Close every sync connector and drop all entries. Async clients are closed where possible."""
+        self._close_entries(self._drain())
+        self._run_shutdown_hooks()
+
+    async def aclose(self) -> None:
+        """Close every connector, awaiting async clients bound to the running loop."""
+        await self._aclose_entries(self._drain())
+        self._run_shutdown_hooks()
+
+
+_registry: Optional[ConnectorRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_connector_registry() -> ConnectorRegistry:
+    """Return the process-wide connector registry, closed automatically at interpreter exit."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ConnectorRegistry()
+            atexit.register(_registry.close)
+        return _registry
+
+
+def get_connector(connector_cls: Type[C], **config: Any) -> C:
+    """Shortcut for `get_connector_registry().get(connector_cls, **config)`."""
+    return get_connector_registry().get(connector_cls, **config)
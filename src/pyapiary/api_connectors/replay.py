@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from pyapiary.api_connectors.cache import _DROPPED_HEADERS
+
+# Query parameters and top-level JSON body fields that carry credentials. They are left
+# out of the match key so that a cassette recorded with one key replays with another.
+DEFAULT_REDACT = ("key", "api_key", "apikey", "token", "access_token")
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode for a request that is not in the cassette."""
+
+
+class RecordReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport, for both Client and AsyncClient, that records real responses to a
+    JSON "cassette" file and replays them offline.
+
+    Modes:
+        - "replay": answer from the cassette only; unknown requests raise CassetteMiss.
+        - "record": forward every request to `transport` and record the response.
+        - "once": replay known requests and record the rest.
+
+    Requests are matched on method, URL (query parameters sorted) and a hash of the body.
+    Credentials named in `redact` are dropped from the query and the JSON body before
+    matching. Request headers are never stored. Responses recorded several times for the
+    same request are replayed in order, and the last one repeats.
+
+    `transport` must match the client: an httpx.BaseTransport (e.g. httpx.HTTPTransport)
+    for a Client, an httpx.AsyncBaseTransport (e.g. httpx.AsyncHTTPTransport) for an
+    AsyncClient. Anything else raises TypeError when the first request is forwarded.
+
+        transport = RecordReplayTransport("urlscan.json", mode="once", transport=httpx.HTTPTransport())
+        conn = URLScanConnector(transport=transport)
+        ...
+        transport.save()
+    """
+    MODES = ("replay", "record", "once")
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        mode: str = "replay",
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+        redact: Iterable[str] = DEFAULT_REDACT,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of: {', '.join(self.MODES)}")
+        if mode != "replay" and transport is None:
+            raise ValueError(f"mode={mode!r} needs a `transport` to forward requests to")
+        if transport is not None and not isinstance(transport, (httpx.BaseTransport, httpx.AsyncBaseTransport)):
+            raise TypeError(f"transport must be an httpx transport, not {type(transport).__name__}")
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.redact = {name.lower() for name in redact}
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._replayed: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                for entry in json.load(fh)["interactions"]:
+                    self._interactions.setdefault(entry["key"], []).append(entry)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._interactions.values())
+
+    def _request_key(self, request: httpx.Request) -> Tuple[str, str]:
+        url = request.url
+        query = sorted((k, v) for k, v in url.params.multi_items() if k.lower() not in self.redact)
+        target = str(url.copy_with(query=None))
+        if query:
+            target += "?" + str(httpx.QueryParams(query))
+        body = request.content
+        if body and request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                decoded = json.loads(body)
+            except ValueError:
+                decoded = None
+            if isinstance(decoded, dict):
+                decoded = {k: v for k, v in decoded.items() if k.lower() not in self.redact}
+                body = json.dumps(decoded, sort_keys=True).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:16] if body else ""
+        described = f"{request.method} {target}"
+        return f"{described} {digest}".rstrip(), described
+
+    def _replay(self, key: str) -> Optional[httpx.Response]:
+        with self._lock:
+            entries = self._interactions.get(key)
+            if not entries:
+                return None
+            position = self._replayed.get(key, 0)
+            self._replayed[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            self.hits += 1
+        response = entry["response"]
+        content = (
+            base64.b64decode(response["base64"]) if "base64" in response else response.get("text", "").encode("utf-8")
+        )
+        return httpx.Response(response["status_code"], headers=response["headers"], content=content)
+
+    def _record(self, key: str, described: str, response: httpx.Response) -> httpx.Response:
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROPPED_HEADERS]
+        stored: Dict[str, Any] = {"status_code": response.status_code, "headers": headers}
+        try:
+            stored["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            stored["base64"] = base64.b64encode(response.content).decode("ascii")
+        with self._lock:
+            self._interactions.setdefault(key, []).append({"key": key, "request": described, "response": stored})
+            self.misses += 1
+        return httpx.Response(response.status_code, headers=headers, content=response.content)
+
+    def _lookup(self, request: httpx.Request) -> Tuple[str, str, Optional[httpx.Response]]:
+        key, described = self._request_key(request)
+        replayed = self._replay(key) if self.mode != "record" else None
+        if replayed is None and self.mode == "replay":
+            with self._lock:
+                self.misses += 1
+            raise CassetteMiss(f"No recorded response for {described}")
+        return key, described, replayed
+
+    def _forward_transport(self, expected: type, client: str) -> Any:
+        if not isinstance(self.transport, expected):
+            raise TypeError(
+                f"RecordReplayTransport used by an httpx.{client} needs an httpx.{expected.__name__} "
+                f"to forward requests to, not {type(self.transport).__name__}"
+            )
+        return self.transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key, described, replayed = self._lookup(request)
+        if replayed is not None:
+            return replayed
+        response = self._forward_transport(httpx.BaseTransport, "Client").handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._record(key, described, response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key, described, replayed = self._lookup(request)
+        if replayed is not None:
+            return replayed
+        response = await self._forward_transport(httpx.AsyncBaseTransport, "AsyncClient").handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(key, described, response)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the cassette to `path` (default: the path it was loaded from)."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("No cassette path given")
+        with self._lock:
+            interactions = [entry for key in sorted(self._interactions) for entry in self._interactions[key]]
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"version": 1, "interactions": interactions}, fh, indent=1, sort_keys=True)
+            fh.write("\n")
+
+    def rewind(self) -> None:
+        """Start replaying every request from its first recorded response again."""
+        with self._lock:
+            self._replayed.clear()
@@ -0,0 +1,110 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+from tenacity import RetryCallState
+from tenacity.wait import wait_base
+
+
+# Headers that carry a delay in seconds
+_DELTA_HEADERS = ("Retry-After", "X-Rate-Limit-Reset-After", "RateLimit-Reset")
+# Headers that carry a reset moment, as an epoch timestamp, an ISO 8601 timestamp or,
+# for some vendors, a delay in seconds
+_RESET_HEADERS = ("X-Rate-Limit-Reset", "X-RateLimit-Reset")
+
+# Numeric reset values above this are treated as epoch timestamps rather than delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _parse_header_value(value: str, now: float, delta_only: bool) -> Optional[float]:
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None:
+        if not delta_only and number > _EPOCH_THRESHOLD:
+            return number - now
+        return number
+    parsed = _parse_timestamp(value)
+    if parsed is None:
+        return None
+    return parsed.timestamp() - now
+
+
+def parse_retry_after(headers: httpx.Headers, now: Optional[float] = None) -> Optional[float]:
+    """
+    Extract how many seconds the server asked us to wait before retrying.
+
+    Understands `Retry-After` in both delta-seconds and HTTP-date forms, the IETF
+    `RateLimit-Reset` header, and the vendor headers `X-Rate-Limit-Reset-After` and
+    `X-Rate-Limit-Reset` (urlscan) / `X-RateLimit-Reset` as delays, epoch timestamps or
+    ISO 8601 timestamps.
+
+    Returns:
+        Optional[float]: a non-negative delay in seconds, or None if no usable header is present
+    """
+    now = time.time() if now is None else now
+    for name in _DELTA_HEADERS + _RESET_HEADERS:
+        raw = headers.get(name)
+        if not raw:
+            continue
+        delay = _parse_header_value(raw, now, delta_only=name == "Retry-After")
+        if delay is not None:
+            return max(0.0, delay)
+    return None
+
+
+class wait_decorrelated_jitter(wait_base):
+    """
+    "Decorrelated jitter" backoff: each wait is drawn uniformly between `base` and three
+    times the previous wait, capped at `cap`. Spreads retries from many workers apart
+    while still growing roughly exponentially.
+    """
+    def __init__(self, base: float = 1.0, cap: float = 10.0, rng: Callable[[float, float], float] = random.uniform):
+        self.base = base
+        self.cap = cap
+        self._rng = rng
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        # tenacity keeps the previous sleep on the retry state until the next one is computed
+        previous = retry_state.upcoming_sleep or self.base
+        return min(self.cap, self._rng(self.base, max(self.base, previous * 3)))
+
+
+class wait_retry_after(wait_base):
+    """
+    Wait exactly as long as the server asks via `Retry-After` or vendor rate-limit reset
+    headers, falling back to `fallback` when the failure carries no such header.
+
+    Args:
+        fallback (wait_base): strategy used when no header is present. Defaults to
+            decorrelated jitter between 1 and 10 seconds.
+        max_wait (float): upper bound on a server-requested wait, in seconds.
+    """
+    def __init__(self, fallback: Optional[wait_base] = None, max_wait: float = 120.0):
+        self.fallback = fallback if fallback is not None else wait_decorrelated_jitter()
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response is not None:
+            delay = parse_retry_after(exc.response.headers)
+            if delay is not None:
+                return min(delay, self.max_wait)
+        return self.fallback(retry_state)
@@ -0,0 +1,574 @@
+import asyncio
+import base64
+import hashlib
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+
+import httpx
+
+from pyapiary.api_connectors import json_codec
+
+# Simulated vendor name -> the host its connector talks to
+VENDOR_HOSTS = {
+    "urlscan": "urlscan.io",
+    "spycloud": "api.spycloud.io",
+    "flashpoint": "api.flashpoint.io",
+    "ipqs": "ipqualityscore.com",
+    "twilio": "lookups.twilio.com",
+}
+_VENDORS_BY_HOST = {host: vendor for vendor, host in VENDOR_HOSTS.items()}
+
+
+class VendorProfile:
+    """
+    How one simulated vendor behaves. Times are in seconds of simulated time (see the
+    simulator's `speed`).
+
+    Args:
+        latency (float): median response time.
+        latency_sigma (float): spread of the log-normal latency distribution; 0 makes
+            every response take exactly `latency`.
+        slow_rate (float): fraction of responses that take `slow_latency` instead, for a
+            heavy tail.
+        error_rate (float): probability that a request fails with a 500, 502 or 503.
+        outage_every (float | None): the last `outage_duration` seconds of every
+            `outage_every` seconds, the vendor answers 503 to everything (a burst of 5xx).
+        rate (float | None): sustained requests per second allowed per API key, with
+            bursts of up to `burst`. Requests over it get a 429 with `Retry-After`.
+        quota (int | None): requests allowed per API key in each `quota_window`.
+        page_size (int): default page size of search endpoints.
+        total_results (int): number of results every search query has.
+    """
+    def __init__(
+        self,
+        latency: float = 0.05,
+        latency_sigma: float = 0.3,
+        slow_rate: float = 0.0,
+        slow_latency: float = 1.0,
+        error_rate: float = 0.0,
+        outage_every: Optional[float] = None,
+        outage_duration: float = 0.0,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        quota: Optional[int] = None,
+        quota_window: float = 60.0,
+        page_size: int = 100,
+        total_results: int = 250,
+    ):
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.outage_every = outage_every
+        self.outage_duration = outage_duration
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.quota = quota
+        self.quota_window = quota_window
+        self.page_size = page_size
+        self.total_results = total_results
+
+
+# Roughly the documented per-key limits and typical latencies of the real services
+DEFAULT_PROFILES: Dict[str, VendorProfile] = {
+    "urlscan": VendorProfile(latency=0.3, rate=2, burst=10),
+    "spycloud": VendorProfile(latency=0.15, rate=10, burst=10),
+    "flashpoint": VendorProfile(latency=0.4, rate=5, burst=5),
+    "ipqs": VendorProfile(latency=0.1, rate=20, burst=20),
+    "twilio": VendorProfile(latency=0.08, rate=100, burst=100),
+}
+
+
+class _SimRequest(NamedTuple):
+    method: str
+    path: str
+    params: Dict[str, str]
+    headers: httpx.Headers
+    body: Any
+    match: "re.Match[str]"
+
+
+class _SimResponse(NamedTuple):
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    delay: float
+
+
+# Handler result: (status, JSON-serializable body or raw bytes, content type)
+_Result = Tuple[int, Any, str]
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+def _page_bounds(profile: VendorProfile, start: int, size: Optional[str]) -> Tuple[int, int]:
+    try:
+        count = int(size) if size else profile.page_size
+    except ValueError:
+        count = profile.page_size
+    start = max(0, start)
+    return start, min(profile.total_results, start + max(1, count))
+
+
+def _urlscan_search(req: _SimRequest, profile: VendorProfile) -> _Result:
+    query = req.params.get("q", "")
+    start = 0
+    if req.params.get("search_after"):
+        start = int(req.params["search_after"].split(",")[0]) + 1
+    start, end = _page_bounds(profile, start, req.params.get("size"))
+    results = []
+    for i in range(start, end):
+        uid = _digest(query, i)[:32]
+        results.append({"_id": uid, "task": {"uuid": uid, "url": f"https://host-{i}.example.com/"}, "sort": [i, uid]})
+    return 200, {"results": results, "total": profile.total_results, "has_more": end < profile.total_results}, ""
+
+
+def _urlscan_scan(req: _SimRequest, profile: VendorProfile) -> _Result:
+    url = (req.body or {}).get("url", "")
+    uid = _digest("scan", url)[:32]
+    return 200, {"message": "Submission successful", "uuid": uid, "result": f"https://urlscan.io/result/{uid}/"}, ""
+
+
+def _urlscan_result(req: _SimRequest, profile: VendorProfile) -> _Result:
+    uid = req.match.group(1)
+    return 200, {"task": {"uuid": uid}, "page": {"url": f"https://{uid[:8]}.example.com/", "status": "200"}}, ""
+
+
+def _urlscan_dom(req: _SimRequest, profile: VendorProfile) -> _Result:
+    return 200, f"<html><body>{req.match.group(1)}</body></html>".encode("utf-8"), "text/html"
+
+
+def _spycloud_breach(req: _SimRequest, profile: VendorProfile) -> _Result:
+    cursor = req.params.get("cursor")
+    start = int(base64.urlsafe_b64decode(cursor.encode("ascii"))) if cursor else 0
+    start, end = _page_bounds(profile, start, req.params.get("limit"))
+    results = [{"document_id": _digest(req.path, i)[:24], "severity": 2 + i % 24} for i in range(start, end)]
+    next_cursor = base64.urlsafe_b64encode(str(end).encode("ascii")).decode("ascii") if end < profile.total_results else ""
+    return 200, {"cursor": next_cursor, "hits": len(results), "results": results}, ""
+
+
+def _flashpoint_search(req: _SimRequest, profile: VendorProfile) -> _Result:
+    body = req.body or {}
+    start, end = _page_bounds(profile, int(body.get("from", 0)), str(body.get("size", "")))
+    hits = [{"_id": _digest(req.path, body.get("query"), i)[:20], "_source": {"rank": i}} for i in range(start, end)]
+    return 200, {"hits": {"total": profile.total_results, "hits": hits}}, ""
+
+
+def _flashpoint_media(req: _SimRequest, profile: VendorProfile) -> _Result:
+    return 200, {"media_id": req.match.group(1), "mime_type": "image/png", "storage_uri": _digest(req.path)[:16]}, ""
+
+
+def _flashpoint_image(req: _SimRequest, profile: VendorProfile) -> _Result:
+    return 200, b"\x89PNG\r\n\x1a\n" + bytes.fromhex(_digest(req.params.get("asset_id"))), "image/png"
+
+
+def _ipqs_url(req: _SimRequest, profile: VendorProfile) -> _Result:
+    url = (req.body or {}).get("url", "")
+    score = int(_digest(url)[:4], 16) % 101
+    return 200, {"success": True, "url": url, "risk_score": score, "unsafe": score > 85, "message": "Success."}, ""
+
+
+def _twilio_lookup(req: _SimRequest, profile: VendorProfile) -> _Result:
+    number = req.match.group(1)
+    fields = [f for f in req.params.get("Fields", "").split(",") if f]
+    return 200, {
+        "phone_number": number,
+        "valid": True,
+        "country_code": "US",
+        "calling_country_code": "1",
+        **{field: {"error_code": None} for field in fields},
+    }, ""
+
+
+# vendor -> [(method, path pattern, handler)]
+_ROUTES: Dict[str, List[Tuple[str, "re.Pattern[str]", Callable[[_SimRequest, VendorProfile], _Result]]]] = {
+    "urlscan": [
+        ("GET", re.compile(r"/api/v1/search/?"), _urlscan_search),
+        ("POST", re.compile(r"/api/v1/scan/?"), _urlscan_scan),
+        ("GET", re.compile(r"/api/v1/result/([^/]+)/?"), _urlscan_result),
+        ("GET", re.compile(r"/api/v1/pro/result/([^/]+)/similar/?"), _urlscan_search),
+        ("GET", re.compile(r"/dom/([^/]+)/?"), _urlscan_dom),
+    ],
+    "spycloud": [
+        ("GET", re.compile(r"/(?:sip-v1|sp-v2|investigations-v2)/breach/(?:catalog|data/[^/]+/[^/]+)"), _spycloud_breach),
+    ],
+    "flashpoint": [
+        ("POST", re.compile(r"/sources/v2/(?:communities|fraud|markets|media|fraud/checks)"), _flashpoint_search),
+        ("GET", re.compile(r"/sources/v2/media/([^/]+)"), _flashpoint_media),
+        ("GET", re.compile(r"/sources/v1/media/?"), _flashpoint_image),
+    ],
+    "ipqs": [
+        ("POST", re.compile(r"/api/json/url/?"), _ipqs_url),
+    ],
+    "twilio": [
+        ("GET", re.compile(r"/v2/PhoneNumbers/([^/]+)"), _twilio_lookup),
+    ],
+}
+
+
+def _api_key(vendor: str, headers: httpx.Headers, params: Mapping[str, str], body: Any) -> Optional[str]:
+    """The credential a request authenticates with, the way each vendor expects it."""
+    if vendor == "urlscan":
+        return headers.get("api-key")
+    if vendor == "spycloud":
+        return headers.get("x-api-key")
+    if vendor == "ipqs":
+        return (body or {}).get("key") if isinstance(body, dict) else params.get("key")
+    authorization = headers.get("authorization", "")
+    if vendor == "flashpoint" and authorization.lower().startswith("bearer "):
+        return authorization[7:].strip() or None
+    if vendor == "twilio" and authorization.lower().startswith("basic "):
+        try:
+            return base64.b64decode(authorization[6:]).decode("utf-8").split(":", 1)[0] or None
+        except ValueError:
+            return None
+    return None
+
+
+class _KeyState:
+    __slots__ = ("tokens", "updated", "window", "used")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.window = -1
+        self.used = 0
+
+
+class VendorSimulator:
+    """
+    An offline stand-in for the urlscan, SpyCloud, Flashpoint, IPQS and Twilio APIs, for
+    load-testing concurrency, rate-limiting and retry settings without touching the real
+    services.
+
+    Each vendor answers its connector's endpoints with synthetic data, paginates search
+    results the way the real API does, and injects latency, per-key 429s with
+    `Retry-After` (IPQS: its 200 "exceeded your request quota" error), random 5xx and
+    periodic outages according to its `VendorProfile`.
+
+    The simulator is an ASGI application and can be reached three ways:
+
+        sim = VendorSimulator(speed=10)
+        conn = URLScanConnector(api_key="k", transport=sim.transport())              # sync, in-process
+        aconn = AsyncURLScanConnector(api_key="k", transport=httpx.ASGITransport(app=sim))
+        with sim.serve() as server:                                                  # a local port
+            conn = URLScanConnector(api_key="k", base_urls=[server.base_url_for("https://urlscan.io")])
+
+    Requests are routed by Host header, or by a leading `/<vendor host>` path segment.
+
+    Args:
+        profiles (Mapping[str, VendorProfile] | None): per-vendor behaviour; vendors not
+            given use `DEFAULT_PROFILES`.
+        speed (float): how much faster than real time to run. Latencies, rate windows,
+            outages and `Retry-After` values are all divided by it.
+        seed (int | None): seed for latencies and injected errors.
+    """
+    def __init__(
+        self,
+        profiles: Optional[Mapping[str, VendorProfile]] = None,
+        speed: float = 1.0,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        unknown = set(profiles or {}) - set(VENDOR_HOSTS)
+        if unknown:
+            raise ValueError(f"Unknown vendors: {', '.join(sorted(unknown))}. Must be among: {', '.join(VENDOR_HOSTS)}")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.speed = speed
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._keys: Dict[Tuple[str, str], _KeyState] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.reset()
+
+    def _now(self) -> float:
+        """Simulated seconds since the simulator started."""
+        return (self._clock() - self._started) * self.speed
+
+    def reset(self) -> None:
+        """Clear counters and per-key quotas."""
+        with self._lock:
+            self._keys.clear()
+            self._stats = {
+                vendor: {"requests": 0, "ok": 0, "throttled": 0, "errors": 0, "rejected": 0}
+                for vendor in VENDOR_HOSTS
+            }
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-vendor counters. `throttled` and `errors` (5xx) are requests that did no useful
+        work, `rejected` counts 401/404s; `wasted` is throttled + errors.
+        """
+        with self._lock:
+            return {
+                vendor: {**counts, "wasted": counts["throttled"] + counts["errors"]}
+                for vendor, counts in self._stats.items()
+            }
+
+    def _sample_latency(self, profile: VendorProfile) -> float:
+        if profile.slow_rate and self._rng.random() < profile.slow_rate:
+            return profile.slow_latency
+        if profile.latency_sigma <= 0:
+            return profile.latency
+        return profile.latency * math.exp(self._rng.gauss(0.0, profile.latency_sigma))
+
+    def _throttle(self, vendor: str, key: str, profile: VendorProfile, now: float) -> Optional[float]:
+        """Charge one request to `key`; return the simulated wait if it is over its limits."""
+        state = self._keys.get((vendor, key))
+        if state is None:
+            state = self._keys[(vendor, key)] = _KeyState(profile.burst or 0.0, now)
+        if profile.quota is not None:
+            window = int(now // profile.quota_window)
+            if window != state.window:
+                state.window, state.used = window, 0
+            if state.used >= profile.quota:
+                return (window + 1) * profile.quota_window - now
+        if profile.rate is not None:
+            state.tokens = min(profile.burst, state.tokens + (now - state.updated) * profile.rate)
+            state.updated = now
+            if state.tokens < 1:
+                return (1 - state.tokens) / profile.rate
+            state.tokens -= 1
+        state.used += 1
+        return None
+
+    def _retry_after(self, wait: float) -> str:
+        seconds = wait / self.speed
+        return str(max(1, math.ceil(seconds))) if self.speed == 1 else f"{seconds:.3f}"
+
+    def handle(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        query: str = "",
+        headers: Union[None, Mapping[str, str], List[Tuple[str, str]], httpx.Headers] = None,
+        body: bytes = b"",
+    ) -> _SimResponse:
+        """
+        Produce the response to one request, and how long (in real seconds) to hold it
+        back before answering. The transports and the server all go through here.
+        """
+        headers = httpx.Headers(headers)
+        segments = path.split("/", 2)
+        if len(segments) > 1 and segments[1] in _VENDORS_BY_HOST:
+            host, path = segments[1], "/" + (segments[2] if len(segments) > 2 else "")
+        vendor = _VENDORS_BY_HOST.get(host.split(":")[0].lower())
+        if vendor is None:
+            return self._reply(None, 404, {"message": f"No simulated vendor for host {host!r}"})
+        method = method.upper()
+        route = next(
+            ((handler, match) for m, pattern, handler in _ROUTES[vendor]
+             if m == method and (match := pattern.fullmatch(path))),
+            None,
+        )
+        if route is None:
+            return self._reply(vendor, 404, {"message": "Not Found"})
+        params = dict(parse_qsl(query, keep_blank_values=True))
+        payload: Any = None
+        if body:
+            try:
+                payload = json_codec.loads(body)
+            except ValueError:
+                return self._reply(vendor, 400, {"message": "Malformed JSON body"})
+        key = _api_key(vendor, headers, params, payload)
+        if not key:
+            return self._reply(vendor, 401, {"message": "Unauthorized"})
+
+        profile = self.profiles[vendor]
+        wait: Optional[float] = None
+        error: Optional[int] = None
+        with self._lock:
+            now = self._now()
+            latency = self._sample_latency(profile)
+            in_outage = (
+                bool(profile.outage_every)
+                and now % profile.outage_every >= profile.outage_every - profile.outage_duration
+            )
+            if not in_outage:
+                wait = self._throttle(vendor, key, profile, now)
+                if wait is None and profile.error_rate and self._rng.random() < profile.error_rate:
+                    error = self._rng.choice((500, 502, 503))
+        # Outages and throttling are answered quickly, like a gateway would
+        if in_outage:
+            return self._reply(vendor, 503, {"message": "Service Unavailable"}, latency * 0.1)
+        if wait is not None:
+            return self._throttled(vendor, wait, latency * 0.1)
+        if error is not None:
+            return self._reply(vendor, error, {"message": "Internal Server Error"}, latency)
+        handler, match = route
+        status, content, content_type = handler(
+            _SimRequest(method, path, params, headers, payload, match), profile
+        )
+        return self._reply(vendor, status, content, latency, content_type=content_type)
+
+    def _throttled(self, vendor: str, wait: float, latency: float) -> _SimResponse:
+        if vendor == "ipqs":
+            # IPQS reports an exhausted quota as a successful request
+            message = "You have exceeded your request quota. Please upgrade or wait for the quota to reset."
+            return self._reply(vendor, 200, {"success": False, "message": message}, latency, category="throttled")
+        return self._reply(
+            vendor, 429, {"message": "Rate limit exceeded"}, latency, extra=[("Retry-After", self._retry_after(wait))]
+        )
+
+    def _reply(
+        self,
+        vendor: Optional[str],
+        status: int,
+        content: Any,
+        simulated_latency: float = 0.0,
+        content_type: str = "",
+        extra: Optional[List[Tuple[str, str]]] = None,
+        category: Optional[str] = None,
+    ) -> _SimResponse:
+        if isinstance(content, bytes):
+            body, content_type = content, content_type or "application/octet-stream"
+        else:
+            body, content_type = json_codec.dumps(content), "application/json"
+        if vendor is not None:
+            if category is None:
+                category = (
+                    "ok" if status < 400 else "throttled" if status == 429 else "errors" if status >= 500 else "rejected"
+                )
+            with self._lock:
+                counts = self._stats[vendor]
+                counts["requests"] += 1
+                counts[category] += 1
+        headers = [("content-type", content_type), ("content-length", str(len(body))), *(extra or [])]
+        return _SimResponse(status, headers, body, simulated_latency / self.speed)
+
+    # ASGI
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        chunks = []
+        more = True
+        while more:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more = message.get("more_body", False)
+        headers = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in scope.get("headers", [])]
+        host = next((v for k, v in headers if k.lower() == "host"), "")
+        response = self.handle(
+            scope["method"], host, scope["path"], scope.get("query_string", b"").decode("latin-1"), headers, b"".join(chunks)
+        )
+        if response.delay > 0:
+            await asyncio.sleep(response.delay)
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in response.headers],
+        })
+        await send({"type": "http.response.body", "body": response.content})
+
+    def transport(self) -> "SimulatorTransport":
+        """A synchronous httpx transport backed by this simulator (httpx has no sync ASGI transport)."""
+        return SimulatorTransport(self)
+
+    def async_transport(self) -> httpx.ASGITransport:
+        """httpx's ASGI transport pointed at this simulator, for async connectors."""
+        return httpx.ASGITransport(app=self)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> "SimulatorServer":
+        """Start serving on a local port (0 picks a free one) in a background thread."""
+        return SimulatorServer(self, host, port)
+
+
+class SimulatorTransport(httpx.BaseTransport):
+    """Sends a sync client's requests to a `VendorSimulator`, sleeping for its latency."""
+    def __init__(self, simulator: VendorSimulator):
+        self.simulator = simulator
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        response = self.simulator.handle(
+            request.method, url.netloc.decode("ascii"), url.path, url.query.decode("ascii"), request.headers, request.read()
+        )
+        if response.delay > 0:
+            time.sleep(response.delay)
+        return httpx.Response(response.status_code, headers=response.headers, content=response.content, request=request)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path, _, query = self.path.partition("?")
+        response = self.server.simulator.handle(
+            self.command, self.headers.get("Host", ""), path, query, list(self.headers.items()), body
+        )
+        if response.delay > 0:
+            time.sleep(response.delay)
+        self.send_response(response.status_code)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    simulator: VendorSimulator
+
+
+class SimulatorServer:
+    """A `VendorSimulator` listening on a local port; use as a context manager or call `close()`."""
+    def __init__(self, simulator: VendorSimulator, host: str = "127.0.0.1", port: int = 0):
+        self.simulator = simulator
+        self._server = _HTTPServer((host, port), _Handler)
+        self._server.simulator = simulator
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=f"pyapiary-simulator-{self.port}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def base_url_for(self, base_url: str) -> str:
+        """The local URL that stands in for a connector's real `base_url`."""
+        url = httpx.URL(base_url)
+        return f"{self.url}/{url.host}{url.path}".rstrip("/")
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "SimulatorServer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,6 +1,17 @@
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Union
 from pyapiary.api_connectors.broker import AsyncBroker, Broker, bubble_broker_init_signature, log_method_call
+from pyapiary.api_connectors.credentials import CredentialPool, PooledKeyAuth, resolve_api_key
+
+ApiKey = Union[str, Sequence[str], CredentialPool]
+
+
+def _key_kwargs(key: Union[str, CredentialPool]) -> Dict[str, Any]:
+    """Request kwargs that authenticate with `key`, rotating through it if it is a pool."""
+    headers = {"accept": "application/json"}
+    if isinstance(key, CredentialPool):
+        return {"headers": headers, "auth": PooledKeyAuth(key, header="x-api-key")}
+    return {"headers": {**headers, "x-api-key": key}}
 
 
 @bubble_broker_init_signature()
@@ -13,12 +24,12 @@ class SpycloudConnector(Broker):
     - Investigations Search
     """
 
-    def __init__(self, sip_key: Optional[str] = None, ato_key: Optional[str] = None,
-                 inv_key: Optional[str] = None, **kwargs):
+    def __init__(self, sip_key: Optional[ApiKey] = None, ato_key: Optional[ApiKey] = None,
+                 inv_key: Optional[ApiKey] = None, **kwargs):
         super().__init__(base_url="https://api.spycloud.io", **kwargs)
-        self.sip_key = sip_key or self.env_config.get("SPYCLOUD_API_SIP_KEY")
-        self.ato_key = ato_key or self.env_config.get("SPYCLOUD_API_ATO_KEY")
-        self.inv_key = inv_key or self.env_config.get("SPYCLOUD_API_INV_KEY")
+        self.sip_key = resolve_api_key(sip_key or self.env_config.get("SPYCLOUD_API_SIP_KEY"))
+        self.ato_key = resolve_api_key(ato_key or self.env_config.get("SPYCLOUD_API_ATO_KEY"))
+        self.inv_key = resolve_api_key(inv_key or self.env_config.get("SPYCLOUD_API_INV_KEY"))
 
     @log_method_call
     def sip_cookie_domains(self, cookie_domains: str, **kwargs) -> httpx.Response:
@@ -26,11 +37,7 @@ class SpycloudConnector(Broker):
         if not self.sip_key:
             raise ValueError("SPYCLOUD_API_SIP_KEY is required for this request.")
         endpoint = f"/sip-v1/breach/data/cookie-domains/{cookie_domains}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.sip_key
-        }
-        return self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
+        return self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.sip_key))
 
     @log_method_call
     def ato_breach_catalog(self, query: str, **kwargs) -> httpx.Response:
@@ -38,12 +45,8 @@ class SpycloudConnector(Broker):
         if not self.ato_key:
             raise ValueError("SPYCLOUD_API_ATO_KEY is required for this request.")
         endpoint = "/sp-v2/breach/catalog"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.ato_key
-        }
         params = {"query": query, **kwargs}
-        return self._make_request("get", endpoint=endpoint, headers=headers, params=params)
+        return self._make_request("get", endpoint=endpoint, params=params, **_key_kwargs(self.ato_key))
 
     @log_method_call
     def ato_search(self, search_type: str, query: str, **kwargs) -> httpx.Response:
@@ -64,11 +67,7 @@ class SpycloudConnector(Broker):
             raise ValueError(f'Invalid search_type: {search_type}. Must be one of: {", ".join(endpoints.keys())}')
 
         endpoint = f"{base_url}/{endpoints[search_type]}/{query}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.ato_key
-        }
-        return self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
+        return self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.ato_key))
 
     @log_method_call
     def investigations_search(self, search_type: str, query: str, **kwargs) -> httpx.Response:
@@ -100,11 +99,7 @@ class SpycloudConnector(Broker):
             raise ValueError(f'Invalid search_type: {search_type}. Must be one of: {", ".join(endpoints.keys())}')
 
         endpoint = f"{base_url}/{endpoints[search_type]}/{query}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.inv_key
-        }
-        return self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
+        return self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.inv_key))
 
 
 @bubble_broker_init_signature()
@@ -113,12 +108,12 @@ class AsyncSpycloudConnector(AsyncBroker):
     Async version of SpycloudConnector.
     """
 
-    def __init__(self, sip_key: Optional[str] = None, ato_key: Optional[str] = None,
-                 inv_key: Optional[str] = None, **kwargs):
+    def __init__(self, sip_key: Optional[ApiKey] = None, ato_key: Optional[ApiKey] = None,
+                 inv_key: Optional[ApiKey] = None, **kwargs):
         super().__init__(base_url="https://api.spycloud.io", **kwargs)
-        self.sip_key = sip_key or self.env_config.get("SPYCLOUD_API_SIP_KEY")
-        self.ato_key = ato_key or self.env_config.get("SPYCLOUD_API_ATO_KEY")
-        self.inv_key = inv_key or self.env_config.get("SPYCLOUD_API_INV_KEY")
+        self.sip_key = resolve_api_key(sip_key or self.env_config.get("SPYCLOUD_API_SIP_KEY"))
+        self.ato_key = resolve_api_key(ato_key or self.env_config.get("SPYCLOUD_API_ATO_KEY"))
+        self.inv_key = resolve_api_key(inv_key or self.env_config.get("SPYCLOUD_API_INV_KEY"))
 
     @log_method_call
     async def sip_cookie_domains(self, cookie_domains: str, **kwargs) -> httpx.Response:
@@ -126,11 +121,7 @@ class AsyncSpycloudConnector(AsyncBroker):
         if not self.sip_key:
             raise ValueError("SPYCLOUD_API_SIP_KEY is required for this request.")
         endpoint = f"/sip-v1/breach/data/cookie-domains/{cookie_domains}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.sip_key
-        }
-        return await self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
+        return await self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.sip_key))
 
     @log_method_call
     async def ato_breach_catalog(self, query: str, **kwargs) -> httpx.Response:
@@ -138,12 +129,8 @@ class AsyncSpycloudConnector(AsyncBroker):
         if not self.ato_key:
             raise ValueError("SPYCLOUD_API_ATO_KEY is required for this request.")
         endpoint = "/sp-v2/breach/catalog"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.ato_key
-        }
         params = {"query": query, **kwargs}
-        return await self._make_request("get", endpoint=endpoint, headers=headers, params=params)
+        return await self._make_request("get", endpoint=endpoint, params=params, **_key_kwargs(self.ato_key))
 
     @log_method_call
     async def ato_search(self, search_type: str, query: str, **kwargs) -> httpx.Response:
@@ -164,11 +151,7 @@ class AsyncSpycloudConnector(AsyncBroker):
             raise ValueError(f'Invalid search_type: {search_type}. Must be one of: {", ".join(endpoints.keys())}')
 
         endpoint = f"{base_url}/{endpoints[search_type]}/{query}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.ato_key
-        }
-        return await self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
+        return await self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.ato_key))
 
     @log_method_call
     async def investigations_search(self, search_type: str, query: str, **kwargs) -> httpx.Response:
@@ -200,8 +183,4 @@ class AsyncSpycloudConnector(AsyncBroker):
             raise ValueError(f'Invalid search_type: {search_type}. Must be one of: {", ".join(endpoints.keys())}')
 
         endpoint = f"{base_url}/{endpoints[search_type]}/{query}"
-        headers = {
-            "accept": "application/json",
-            "x-api-key": self.inv_key
-        }
-        return await self._make_request("get", endpoint=endpoint, headers=headers, params=kwargs)
\ No newline at end of file
+        return await self._make_request("get", endpoint=endpoint, params=kwargs, **_key_kwargs(self.inv_key))
\ No newline at end of file
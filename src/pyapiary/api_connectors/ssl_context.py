@@ -0,0 +1,42 @@
+import ssl
+import threading
+from typing import Dict, Tuple, Union
+
+import httpx
+
+VerifyTypes = Union[bool, str, ssl.SSLContext]
+
+_lock = threading.Lock()
+_contexts: Dict[Tuple[Union[bool, str], bool, bool], ssl.SSLContext] = {}
+
+
+def get_shared_ssl_context(verify: Union[bool, str] = True, trust_env: bool = True, http2: bool = False) -> ssl.SSLContext:
+    """
+    Return a process-wide SSLContext for the given TLS settings, creating it on first use.
+
+    Building an SSLContext loads the whole CA bundle, which costs a few milliseconds and
+    noticeable memory; connectors with the same settings reuse one context instead.
+    `http2` is part of the key because httpcore sets the ALPN protocols on the context
+    it connects with, so HTTP/1.1-only and HTTP/2 clients must not share one.
+    """
+    key = (verify, trust_env, http2)
+    with _lock:
+        context = _contexts.get(key)
+        if context is None:
+            context = _contexts[key] = httpx.create_ssl_context(verify=verify, trust_env=trust_env)
+        return context
+
+
+def resolve_verify(verify: VerifyTypes = True, trust_env: bool = True, http2: bool = False) -> VerifyTypes:
+    """Map an httpx `verify` value onto a shared SSLContext; caller-built contexts pass through."""
+    if isinstance(verify, ssl.SSLContext):
+        return verify
+    return get_shared_ssl_context(verify, trust_env, http2)
+
+
+def clear_shared_ssl_contexts() -> int:
+    """Drop all shared contexts (e.g. after rotating CA bundles). Returns how many were dropped."""
+    with _lock:
+        dropped = len(_contexts)
+        _contexts.clear()
+        return dropped
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import tempfile
+from typing import IO, NamedTuple, Optional, Union
+
+import httpx
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Bodies below this size stay in memory when no destination is given
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a streamed response exceeds the caller's `max_bytes` cap."""
+    def __init__(self, url: str, max_bytes: int):
+        super().__init__(f"Response from {url} exceeds max_bytes={max_bytes}")
+        self.url = url
+        self.max_bytes = max_bytes
+
+
+class DownloadResult(NamedTuple):
+    """
+    Outcome of a streamed download.
+
+    Attributes:
+        destination (str | IO[bytes]): The path written to, or the file object holding the
+            payload (rewound to the start when it was created by the broker).
+        bytes_written (int): Number of decoded body bytes written.
+        digest (str | None): Hex digest of the body, or None if hashing was disabled.
+        content_type (str | None): The response's Content-Type header.
+        status_code (int): HTTP status code of the response.
+    """
+    destination: Union[str, IO[bytes]]
+    bytes_written: int
+    digest: Optional[str]
+    content_type: Optional[str]
+    status_code: int
+
+
+class ChunkSink:
+    """
+    Writes streamed chunks to a path, a caller-provided file object, or a spooled
+    temporary file, hashing them on the fly and enforcing an optional size cap.
+    """
+    def __init__(
+        self,
+        destination: Optional[PathOrFile],
+        max_bytes: Optional[int] = None,
+        hash_algorithm: Optional[str] = "sha256",
+    ):
+        self.max_bytes = max_bytes
+        self.bytes_written = 0
+        self._hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self._path: Optional[str] = None
+        self._owns_file = False
+        self._spooled = destination is None
+        if destination is None:
+            self._file: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        elif isinstance(destination, (str, os.PathLike)):
+            self._path = os.fspath(destination)
+            self._file = open(self._path, "wb")
+            self._owns_file = True
+        else:
+            self._file = destination
+
+    def check_declared_length(self, response: httpx.Response) -> None:
+        declared = response.headers.get("Content-Length")
+        if (
+            self.max_bytes is not None
+            and declared is not None
+            and declared.isdigit()
+            and "Content-Encoding" not in response.headers
+            and int(declared) > self.max_bytes
+        ):
+            raise ResponseTooLargeError(str(response.request.url), self.max_bytes)
+
+    def write(self, chunk: bytes, url: str) -> None:
+        self.bytes_written += len(chunk)
+        if self.max_bytes is not None and self.bytes_written > self.max_bytes:
+            raise ResponseTooLargeError(url, self.max_bytes)
+        if self._hasher is not None:
+            self._hasher.update(chunk)
+        self._file.write(chunk)
+
+    def finish(self, response: httpx.Response) -> DownloadResult:
+        if self._owns_file:
+            self._file.close()
+            destination: Union[str, IO[bytes]] = self._path
+        else:
+            self._file.flush()
+            if self._spooled:
+                self._file.seek(0)
+            destination = self._file
+        return DownloadResult(
+            destination=destination,
+            bytes_written=self.bytes_written,
+            digest=self._hasher.hexdigest() if self._hasher is not None else None,
+            content_type=response.headers.get("Content-Type"),
+            status_code=response.status_code,
+        )
+
+    def abort(self) -> None:
+        """Close and remove anything this sink created after a failed download."""
+        if self._owns_file:
+            self._file.close()
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+        elif self._spooled:
+            self._file.close()
+
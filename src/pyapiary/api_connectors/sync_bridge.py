@@ -0,0 +1,184 @@
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import Future
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+from pyapiary.api_connectors.broker import AsyncBroker
+from pyapiary.api_connectors.bulk import BulkResult
+
+A = TypeVar("A", bound=AsyncBroker)
+
+
+class SyncBridge:
+    """
+    Drive an AsyncBroker connector from synchronous code.
+
+    The connector runs on a private event loop in a daemon thread. Sync callers submit
+    calls and get `concurrent.futures.Future`s back, or stream a whole batch through
+    `map()`. Many requests are in flight at once without any async code at the call
+    site. Any connector method can also be called directly on the bridge and blocks
+    until the result is ready, so `bridge.search("domain:example.com")` behaves like
+    the sync connector.
+
+    The connector must not have sent a request on another event loop; its httpx client
+    is created lazily on the bridge's loop. Close the bridge (or use it as a context
+    manager) to close the client and stop the thread.
+
+    Args:
+        connector (AsyncBroker): the async connector to drive.
+        concurrency (int): maximum number of `submit()`ted calls running at once;
+            further calls queue on the loop. Defaults to 16.
+    """
+    def __init__(self, connector: A, concurrency: int = 16):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.connector = connector
+        self.concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name=f"pyapiary-bridge-{type(connector).__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _check_caller(self) -> None:
+        if self._closed:
+            raise RuntimeError("SyncBridge is closed")
+        if threading.get_ident() == self._thread.ident:
+            raise RuntimeError("Blocking on a SyncBridge from its own event loop would deadlock")
+
+    def _resolve(self, method: Union[str, Callable[..., Awaitable[Any]]]) -> Callable[..., Awaitable[Any]]:
+        return getattr(self.connector, method) if isinstance(method, str) else method
+
+    async def _bounded(self, fn: Callable[..., Awaitable[Any]], args: Any, kwargs: Any) -> Any:
+        if self._semaphore is None:
+            # Created on the loop thread, the only thread that touches it
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await fn(*args, **kwargs)
+
+    def submit(self, method: Union[str, Callable[..., Awaitable[Any]]], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """
+        Schedule `await method(*args, **kwargs)` on the bridge's loop and return a Future
+        for its result. `method` is a connector method or its name.
+        """
+        if self._closed:
+            raise RuntimeError("SyncBridge is closed")
+        fn = self._resolve(method)
+        return asyncio.run_coroutine_threadsafe(self._bounded(fn, args, kwargs), self._loop)
+
+    def submit_many(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        queries: Iterable[Any],
+        **kwargs: Any,
+    ) -> List["Future[Any]"]:
+        """Submit `method(query, **kwargs)` for every query; futures are returned in input order."""
+        return [self.submit(method, query, **kwargs) for query in queries]
+
+    def call(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run one call on the bridge's loop and block until it finishes (or `timeout` passes)."""
+        self._check_caller()
+        return self.submit(method, *args, **kwargs).result(timeout)
+
+    def map(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        queries: Iterable[Any],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[BulkResult]:
+        """
+        Synchronous counterpart of `AsyncBroker.gather_bounded`.
+
+        Queries are pulled lazily and at most `concurrency` calls (the bridge's own
+        limit by default) are in flight. Calls keep running on the background loop
+        while the caller processes earlier results.
+
+        Returns:
+            Iterator[BulkResult]: one result per query; per-item exceptions are captured
+            in `BulkResult.error`. Stopping early cancels the outstanding calls.
+        """
+        self._check_caller()
+        results = self.connector.gather_bounded(
+            self._resolve(method),
+            queries,
+            concurrency=concurrency or self.concurrency,
+            ordered=ordered,
+            **kwargs,
+        )
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(results.__anext__(), self._loop).result()
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                asyncio.run_coroutine_threadsafe(results.aclose(), self._loop).result()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.connector, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            return self.call(attr, *args, **kwargs)
+
+        return blocking
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.connector._session is not None:
+            await self.connector._session.aclose()
+        # Finalize `map()` generators and executor threads while the loop still runs
+        await self._loop.shutdown_asyncgens()
+        await self._loop.shutdown_default_executor()
+
+    def close(self) -> None:
+        """Cancel outstanding calls, close the connector's client and stop the loop thread."""
+        if self._closed:
+            return
+        self._check_caller()
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> "SyncBridge":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
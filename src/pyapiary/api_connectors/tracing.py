@@ -0,0 +1,131 @@
+import inspect
+import logging
+import time
+from functools import wraps
+from typing import Any, Callable, NamedTuple, Optional, ParamSpec, Tuple, TypeVar, cast
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CallTrace(NamedTuple):
+    """
+    Structured record of one connector method call, emitted by `log_method_call`.
+
+    Attributes:
+        connector (str): Class name of the connector, e.g. "URLScanConnector".
+        method (str): Name of the called method, e.g. "search".
+        query (Any): The call's `query` argument (or its first argument if it has none).
+        duration (float): Wall-clock time spent in the call, in seconds.
+        outcome (str): "ok", or the name of the exception the call raised.
+        status_code (int | None): Status code when the call returned an httpx.Response.
+    """
+    connector: str
+    method: str
+    query: Any
+    duration: float
+    outcome: str
+    status_code: Optional[int]
+
+
+CallTracer = Callable[[CallTrace], None]
+
+_MISSING = object()
+
+
+def _query_locator(func: Callable[..., Any]) -> Tuple[str, int, Any]:
+    """
+    Resolve, once, where a method's query lives: its parameter name, its index in
+    `args` (excluding self), and its default value.
+    """
+    params = list(inspect.signature(func).parameters.values())[1:]
+    positional = [
+        p for p in params
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    target = next((p for p in params if p.name == "query"), None)
+    if target is None and positional:
+        target = positional[0]
+    if target is None:
+        return "", -1, None
+    index = positional.index(target) if target in positional else -1
+    default = None if target.default is inspect.Parameter.empty else target.default
+    return target.name, index, default
+
+
+def _emit(self: Any, name: str, query: Any, started: float, result: Any, exc: Optional[BaseException]) -> None:
+    status_code = getattr(result, "status_code", None) if exc is None else None
+    record = CallTrace(
+        connector=type(self).__name__,
+        method=name,
+        query=query,
+        duration=time.perf_counter() - started,
+        outcome="ok" if exc is None else type(exc).__name__,
+        status_code=status_code if isinstance(status_code, int) else None,
+    )
+    tracer = getattr(self, "call_tracer", None)
+    if tracer is not None:
+        tracer(record)
+    logger = getattr(self, "logger", None)
+    if logger is not None:
+        logger.info(
+            "%s called with query: %s (%s in %.3fs)",
+            record.method, record.query, record.outcome, record.duration,
+            extra={"call_trace": record},
+        )
+
+
+def log_method_call(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Trace calls to a connector method.
+
+    The method signature is inspected once, here, rather than on every call. When the
+    connector has neither a logger (`enable_logging=True`) nor a `call_tracer`, the
+    wrapper calls straight through. Otherwise each call produces a CallTrace that is
+    passed to `call_tracer` and logged with the record attached as `call_trace`.
+    Coroutine functions get an async wrapper so the duration covers the awaited call.
+    """
+    name = func.__name__
+    param, index, default = _query_locator(func)
+
+    def _is_traced(self: Any) -> bool:
+        logger = getattr(self, "logger", None)
+        return getattr(self, "call_tracer", None) is not None or (
+            logger is not None and logger.isEnabledFor(logging.INFO)
+        )
+
+    def _query(args: tuple, kwargs: dict) -> Any:
+        if 0 <= index < len(args):
+            return args[index]
+        value = kwargs.get(param, _MISSING) if param else _MISSING
+        return default if value is _MISSING else value
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _is_traced(self):
+                return await func(self, *args, **kwargs)
+            started = time.perf_counter()
+            try:
+                result = await func(self, *args, **kwargs)
+            except BaseException as exc:
+                _emit(self, name, _query(args, kwargs), started, None, exc)
+                raise
+            _emit(self, name, _query(args, kwargs), started, result, None)
+            return result
+        return cast(Callable[P, R], async_wrapper)
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _is_traced(self):
+            return func(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException as exc:
+            _emit(self, name, _query(args, kwargs), started, None, exc)
+            raise
+        _emit(self, name, _query(args, kwargs), started, result, None)
+        return result
+    return cast(Callable[P, R], wrapper)
@@ -1,6 +1,8 @@
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Union
 from pyapiary.api_connectors.broker import AsyncBroker, Broker, bubble_broker_init_signature, log_method_call
+from pyapiary.api_connectors.credentials import CredentialPool, PooledKeyAuth, resolve_api_key
+from pyapiary.api_connectors.streaming import DownloadResult, PathOrFile
 
 @bubble_broker_init_signature()
 class URLScanConnector(Broker):
@@ -11,19 +13,23 @@ class URLScanConnector(Broker):
     and retrieving detailed scan results and metadata.
 
     Attributes:
-        api_key (str): The API key used to authenticate with urlscan.io.
+        api_key (str | CredentialPool): The API key used to authenticate with urlscan.io,
+            or a pool of keys (also accepted as a list or a comma-separated string) that
+            requests are spread across.
     """
 
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
+    def __init__(self, api_key: Optional[Union[str, Sequence[str], CredentialPool]] = None, **kwargs):
         super().__init__(base_url="https://urlscan.io", **kwargs)
 
-        self.api_key = api_key or self.env_config.get("URLSCAN_API_KEY")
+        api_key = api_key or self.env_config.get("URLSCAN_API_KEY")
+        self.api_key = resolve_api_key(api_key)
         if not self.api_key:
             raise ValueError("API key is required for URLScanConnector")
-        self.headers.update({
-            "accept": "application/json",
-            "API-Key": self.api_key
-        })
+        self.headers.update({"accept": "application/json"})
+        if isinstance(self.api_key, CredentialPool):
+            self.default_auth = PooledKeyAuth(self.api_key, header="API-Key")
+        else:
+            self.headers["API-Key"] = self.api_key
 
     @log_method_call
     def search(self, query: str, **kwargs: Dict[str, Any]) -> httpx.Response:
@@ -81,6 +87,28 @@ class URLScanConnector(Broker):
         """
         return self.get(f"/dom/{query}", params=kwargs)
 
+    @log_method_call
+    def download_dom(
+        self,
+        query: str,
+        destination: Optional[PathOrFile] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> DownloadResult:
+        """
+        Stream the DOM snapshot for a given scan UUID to disk without buffering it.
+
+        Args:
+            query (str): The UUID of the scan.
+            destination (str | PathLike | IO[bytes] | None): File path or binary file object to
+                write to; None spools to a temporary file.
+            max_bytes (Optional[int]): Abort if the snapshot is larger than this many bytes.
+
+        Returns:
+            DownloadResult: destination, size and sha256 digest of the snapshot
+        """
+        return self.download_to(f"/dom/{query}", destination=destination, params=kwargs, max_bytes=max_bytes)
+
     @log_method_call
     def structure_search(self, query: str, **kwargs: Dict[str, Any]) -> httpx.Response:
         """
@@ -99,16 +127,18 @@ class AsyncURLScanConnector(AsyncBroker):
     An async connector for interacting with the urlscan.io API.
     """
 
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
+    def __init__(self, api_key: Optional[Union[str, Sequence[str], CredentialPool]] = None, **kwargs):
         super().__init__(base_url="https://urlscan.io", **kwargs)
 
-        self.api_key = api_key or self.env_config.get("URLSCAN_API_KEY")
+        api_key = api_key or self.env_config.get("URLSCAN_API_KEY")
+        self.api_key = resolve_api_key(api_key)
         if not self.api_key:
             raise ValueError("API key is required for AsyncURLScanConnector")
-        self.headers.update({
-            "accept": "application/json",
-            "API-Key": self.api_key
-        })
+        self.headers.update({"accept": "application/json"})
+        if isinstance(self.api_key, CredentialPool):
+            self.default_auth = PooledKeyAuth(self.api_key, header="API-Key")
+        else:
+            self.headers["API-Key"] = self.api_key
 
     @log_method_call
     async def search(self, query: str, **kwargs: Dict[str, Any]) -> httpx.Response:
@@ -140,6 +170,19 @@ class AsyncURLScanConnector(AsyncBroker):
         """
         return await self.get(f"/dom/{query}", params=kwargs)
 
+    @log_method_call
+    async def download_dom(
+        self,
+        query: str,
+        destination: Optional[PathOrFile] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> DownloadResult:
+        """
+        Async stream the DOM snapshot for a given scan UUID to disk without buffering it.
+        """
+        return await self.download_to(f"/dom/{query}", destination=destination, params=kwargs, max_bytes=max_bytes)
+
     @log_method_call
     async def structure_search(self, query: str, **kwargs: Dict[str, Any]) -> httpx.Response:
         """
@@ -1,5 +1,11 @@
-from elasticsearch import Elasticsearch, helpers
 from typing import List, Dict, Generator, Any, Optional, Union
+from pyapiary.helpers import lazy_imports
+
+# The elasticsearch client is imported when a connector is first created
+__getattr__, _lazy = lazy_imports(globals(), {
+    "Elasticsearch": ("elasticsearch", "Elasticsearch"),
+    "helpers": ("elasticsearch.helpers", None),
+})
 
 
 try:
@@ -39,7 +45,7 @@ class ElasticsearchConnector:
             password (Optional[str]): Password for basic authentication. Defaults to None.
             logger (Optional[Any]): Optional logger instance. If not provided, a default logger is used.
         """
-        self.client = Elasticsearch(hosts, basic_auth=(username, password))
+        self.client = _lazy("Elasticsearch")(hosts, basic_auth=(username, password))
         self.logger = logger if logger is not None else _default_logger
 
     def _log(self, msg: str, level: str = "info"):
@@ -135,7 +141,7 @@ class ElasticsearchConnector:
                 "_source": doc
             } for doc in data
         ]
-        success, errors = helpers.bulk(self.client, actions)
+        success, errors = _lazy("helpers").bulk(self.client, actions)
         if errors:
             self._log(f"Bulk insert encountered errors: {errors}", "error")
         else:
@@ -1,14 +1,12 @@
-from pymongo import MongoClient, UpdateOne
-from pymongo.errors import (
-    OperationFailure,
-    ServerSelectionTimeoutError,
-    AutoReconnect,
-    ConnectionFailure,
-)
-from tenacity import Retrying, stop_after_attempt, wait_fixed, retry_if_exception_type
 from typing import List, Dict, Any, Optional, Generator, Type, Union
 from types import TracebackType
-from pyapiary.helpers import setup_logger
+from pyapiary.helpers import lazy_imports, setup_logger
+
+# pymongo is imported when a connector is first created
+__getattr__, _lazy = lazy_imports(globals(), {
+    "MongoClient": ("pymongo", "MongoClient"),
+    "UpdateOne": ("pymongo", "UpdateOne"),
+})
 
 
 _DEFAULT_LOGGER = object()
@@ -57,7 +55,7 @@ class MongoConnector:
             auth_retry_wait (float): Seconds to wait between auth attempts. Defaults to 1.0.
         """
         # Initialize MongoClient with authSource, authMechanism, and ssl options
-        self.client = MongoClient(
+        self.client = _lazy("MongoClient")(
             uri,
             username=username,
             password=password,
@@ -112,6 +110,9 @@ class MongoConnector:
 
     def _ping_with_retry(self) -> None:
         """Ping the server to validate connection/auth, with retry."""
+        from pymongo.errors import AutoReconnect, ConnectionFailure, OperationFailure, ServerSelectionTimeoutError
+        from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+
         for attempt in Retrying(
             stop=stop_after_attempt(self.auth_retry_attempts),
             wait=wait_fixed(self.auth_retry_wait),
@@ -300,7 +301,7 @@ class MongoConnector:
                         continue
                 else:
                     raise ValueError("unique_key must be either a string or a list of strings")
-                operations.append(UpdateOne(filter_doc, {"$set": doc}, upsert=True))
+                operations.append(_lazy("UpdateOne")(filter_doc, {"$set": doc}, upsert=True))
             if operations:
                 result = col.bulk_write(operations, ordered=ordered)
                 results.append(result)
@@ -2,15 +2,12 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, AsyncIterator, Type, Union
 from types import TracebackType
 import inspect
-from pymongo import UpdateOne
-from pymongo.errors import (
-    OperationFailure,
-    ServerSelectionTimeoutError,
-    AutoReconnect,
-    ConnectionFailure,
-)
-from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed, retry_if_exception_type
-from pyapiary.helpers import setup_logger
+from pyapiary.helpers import lazy_imports, setup_logger
+
+# pymongo is imported when a connector is first created
+__getattr__, _lazy = lazy_imports(globals(), {
+    "UpdateOne": ("pymongo", "UpdateOne"),
+})
 
 
 _DEFAULT_LOGGER = object()
@@ -113,6 +110,9 @@ class AsyncMongoConnector:
 
     async def _ping_with_retry(self) -> None:
         """Async ping to validate connection/auth, with retry."""
+        from pymongo.errors import AutoReconnect, ConnectionFailure, OperationFailure, ServerSelectionTimeoutError
+        from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(self.auth_retry_attempts),
             wait=wait_fixed(self.auth_retry_wait),
@@ -261,7 +261,7 @@ class AsyncMongoConnector:
                     filter_doc = {k: doc[k] for k in unique_key if k in doc}
                     if len(filter_doc) != len(unique_key):
                         continue
-                operations.append(UpdateOne(filter_doc, {"$set": doc}, upsert=True))
+                operations.append(_lazy("UpdateOne")(filter_doc, {"$set": doc}, upsert=True))
             if operations:
                 result = await col.bulk_write(operations, ordered=ordered)
                 results.append(result)
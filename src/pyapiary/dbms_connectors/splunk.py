@@ -1,6 +1,8 @@
-import httpx
 from typing import Generator, Dict, Any, Optional
-from pyapiary.helpers import setup_logger
+from pyapiary.helpers import lazy_imports, setup_logger
+
+# httpx is imported on first use
+__getattr__, _lazy = lazy_imports(globals(), {"httpx": ("httpx", None)})
 
 
 class SplunkConnector:
@@ -82,7 +84,7 @@ class SplunkConnector:
         if latest_time:
             data["latest_time"] = latest_time
 
-        create_resp = httpx.post(
+        create_resp = _lazy("httpx").post(
             f"{self.base_url}/services/search/jobs",
             auth=self.auth,
             data=data,
@@ -95,7 +97,7 @@ class SplunkConnector:
         # 2️⃣ Poll until ready
         while True:
             self._log(f"Polling job {sid} status...")
-            status_resp = httpx.get(
+            status_resp = _lazy("httpx").get(
                 f"{self.base_url}/services/search/jobs/{sid}",
                 auth=self.auth,
                 params={"output_mode": "json"},
@@ -111,7 +113,7 @@ class SplunkConnector:
         offset = 0
         while True:
             self._log(f"Fetching results batch starting at offset {offset}")
-            results_resp = httpx.get(
+            results_resp = _lazy("httpx").get(
                 f"{self.base_url}/services/search/jobs/{sid}/results",
                 auth=self.auth,
                 params={
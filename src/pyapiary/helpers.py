@@ -1,9 +1,15 @@
 from datetime import datetime
-from dotenv import dotenv_values, find_dotenv
+from importlib import import_module
 import logging
 import os
 import sys
-from typing import Dict, Set, List, Any, Optional
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Set, List, Any, Optional, Mapping, Callable, Iterator, Tuple, TypeVar
+
+
+T = TypeVar("T")
 
 
 def check_required_env_vars(config: Dict[str, str], required_vars: List[str]) -> None:
@@ -26,20 +32,96 @@ def check_required_env_vars(config: Dict[str, str], required_vars: List[str]) ->
         sys.exit(1)
 
 
-def combine_env_configs() -> Dict[str, Any]:
+class EnvConfig(Mapping[str, Any]):
+    """Read-only view of `.env` values overlaid by the live system environment.
+
+    Lookups go to `os.environ` first and fall back to the parsed `.env` file, so the
+    view reflects later changes to the environment without copying it.
+    """
+    __slots__ = ("_dotenv",)
+
+    def __init__(self, dotenv: Mapping[str, Any]):
+        self._dotenv = MappingProxyType(dict(dotenv))
+
+    def __getitem__(self, key: str) -> Any:
+        if isinstance(key, str):
+            value = os.environ.get(key)
+            if value is not None:
+                return value
+        return self._dotenv[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from os.environ
+        yield from (key for key in self._dotenv if key not in os.environ)
+
+    def __len__(self) -> int:
+        return len(os.environ) + sum(1 for key in self._dotenv if key not in os.environ)
+
+    def __bool__(self) -> bool:
+        return bool(os.environ) or bool(self._dotenv)
+
+    def __repr__(self) -> str:
+        return f"EnvConfig(dotenv_keys={sorted(self._dotenv)!r})"
+
+
+# Seconds between checks of the .env file's mtime
+ENV_RECHECK_INTERVAL = 1.0
+
+_env_lock = threading.Lock()
+_env_paths: Dict[str, str] = {}
+_env_state: Dict[str, Tuple[Optional[int], float, EnvConfig]] = {}
+
+
+def _dotenv_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def combine_env_configs() -> Mapping[str, Any]:
     """Find a .env file if it exists, and combine it with system environment
-        variables to form a "combined_config" dictionary of environment variables
+        variables to form a "combined_config" mapping of environment variables
+
+    The .env file is searched for from the working directory upwards. It is located and
+    parsed once per process (per working directory) and re-parsed only when its
+    modification time changes, which is checked at most every `ENV_RECHECK_INTERVAL`
+    seconds. Every caller shares the same immutable mapping.
 
     Returns:
-        Dict: a dictionary containing the output of a .env file (if found), and
-        system environment variables
+        Mapping: a read-only mapping containing the output of a .env file (if found),
+        overlaid by system environment variables
     """
+    cwd = os.getcwd()
+    now = time.monotonic()
+    with _env_lock:
+        path = _env_paths.get(cwd)
+        if path is None:
+            from dotenv import find_dotenv
+            # Search from the working directory so the lookup matches the cache key
+            path = _env_paths[cwd] = find_dotenv(usecwd=True)
+
+        cached = _env_state.get(path)
+        if cached is not None and now - cached[1] < ENV_RECHECK_INTERVAL:
+            return cached[2]
 
-    env_config: Dict[str, Any] = dict(dotenv_values(find_dotenv()))
+        mtime = _dotenv_mtime(path) if path else None
+        if cached is not None and cached[0] == mtime:
+            _env_state[path] = (mtime, now, cached[2])
+            return cached[2]
 
-    combined_config: Dict[str, Any] = {**env_config, **dict(os.environ)}
+        from dotenv import dotenv_values
 
-    return combined_config
+        config = EnvConfig(dotenv_values(path) if path else {})
+        _env_state[path] = (mtime, now, config)
+        return config
+
+
+def clear_env_config_cache() -> None:
+    """Forget located and parsed .env files, e.g. after creating a new .env at runtime."""
+    with _env_lock:
+        _env_paths.clear()
+        _env_state.clear()
 
 
 def validate_date_string(date_str: str) -> bool:
@@ -58,6 +140,67 @@ def validate_date_string(date_str: str) -> bool:
         return False
 
 
+def match_endpoint_prefix(mapping: Mapping[str, T], endpoint: str) -> Optional[T]:
+    """Look up the value registered for the longest prefix of an endpoint path.
+
+    Keys and the endpoint are compared without their leading slash, so "/api/v1"
+    and "api/v1" are equivalent.
+
+    Args:
+        mapping (Mapping[str, T]): endpoint prefixes mapped to arbitrary values
+        endpoint (str): the endpoint path being requested
+
+    Returns:
+        Optional[T]: the value for the longest matching prefix, or None if nothing matches
+    """
+    path = endpoint.lstrip("/")
+    best: Optional[str] = None
+    for prefix in mapping:
+        candidate = prefix.lstrip("/")
+        if path.startswith(candidate) and (best is None or len(candidate) > len(best.lstrip("/"))):
+            best = prefix
+    return mapping[best] if best is not None else None
+
+
+def lazy_imports(
+    module_globals: Dict[str, Any],
+    imports: Mapping[str, Tuple[str, Optional[str]]],
+) -> Tuple[Callable[[str], Any], Callable[[str], Any]]:
+    """Defer a module's heavy third-party imports until first use (PEP 562).
+
+    Each entry of `imports` maps a global name to `(module, attribute)`; an attribute of
+    None binds the module itself. Usage at the top of a module:
+
+        __getattr__, _lazy = lazy_imports(globals(), {"MongoClient": ("pymongo", "MongoClient")})
+
+    Code inside the module calls `_lazy("MongoClient")` instead of naming the global, so
+    the import happens on first call and values patched onto the module (e.g. in tests)
+    are honoured.
+
+    Args:
+        module_globals (Dict[str, Any]): the calling module's globals()
+        imports (Mapping[str, Tuple[str, Optional[str]]]): names to import lazily
+
+    Returns:
+        Tuple: the module-level `__getattr__` and a `load(name)` function
+    """
+    def load(name: str) -> Any:
+        if name in module_globals:
+            return module_globals[name]
+        module_name, attribute = imports[name]
+        module = import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+        module_globals[name] = value
+        return value
+
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            return load(name)
+        raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+
+    return __getattr__, load
+
+
 def setup_logger(
     name: str = __name__,
     level: int = logging.INFO,
@@ -1,6 +1,8 @@
+import httpx
 import pytest
 import vcr
 from pathlib import Path
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
 
 AUTH_PARAM_REDACT = [
     # List of substrings that, if present in a key, will cause redaction (case-insensitive)
@@ -44,4 +46,41 @@ def vcr_cassette(request):
         "before_record": redact_sensitive
     }
 
-    return vcr.VCR(**config)
\ No newline at end of file
+    return vcr.VCR(**config)
+
+
+class FakeClock:
+    """A clock for `clock=` arguments that only moves when a test sets `now`."""
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provides a FakeClock starting at 0."""
+    return FakeClock()
+
+
+@pytest.fixture
+def counting_handler():
+    """Provides a factory for MockTransport handlers that append each request to `calls`."""
+    def make(calls, status=200):
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(status, json={"path": request.url.path, "n": len(calls)})
+        return handler
+    return make
+
+
+@pytest.fixture
+def make_broker():
+    """Provides a factory for a Broker (or AsyncBroker) on https://testserver whose client uses `handler`."""
+    def make(handler, broker_cls=Broker, **kwargs):
+        broker = broker_cls(base_url="https://testserver", **kwargs)
+        client_cls = httpx.AsyncClient if issubclass(broker_cls, AsyncBroker) else httpx.Client
+        broker.session = client_cls(transport=httpx.MockTransport(handler))
+        return broker
+    return make
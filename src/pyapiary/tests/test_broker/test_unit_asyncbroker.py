@@ -3,15 +3,56 @@ import httpx
 from pyapiary.api_connectors.broker import AsyncBroker
 
 
-def test_asyncbroker_rejects_mounts():
-    """Ensure that AsyncBroker raises an error if 'mounts' is passed."""
-    with pytest.raises(ValueError, match="mounts.*not supported"):
-        AsyncBroker(base_url="https://example.com", mounts={"http://": object()})
+def test_asyncbroker_accepts_async_mounts(mocker):
+    """Ensure that per-scheme async transports are passed through to the AsyncClient."""
+    client_mock = mocker.patch("httpx.AsyncClient")
+    mounts = {"http://": httpx.AsyncHTTPTransport(), "https://": httpx.AsyncHTTPTransport()}
+    broker = AsyncBroker(base_url="https://example.com", mounts=mounts, proxy="http://ignored:1111")
+    broker.session
+    assert broker.mounts == mounts
+    assert client_mock.call_args.kwargs["mounts"] == mounts
+    assert "proxy" not in client_mock.call_args.kwargs
+
+
+def test_asyncbroker_builds_mounts_from_proxy_urls():
+    """Ensure that proxy URL strings in 'mounts' become async transports."""
+    broker = AsyncBroker(
+        base_url="https://example.com",
+        mounts={"http://": "http://proxy-a:8080", "https://": "http://proxy-b:8080"},
+    )
+    assert all(isinstance(t, httpx.AsyncHTTPTransport) for t in broker.mounts.values())
+
+
+def test_asyncbroker_rejects_sync_transport_mounts():
+    """Ensure that a synchronous transport mount fails early with a clear error."""
+    with pytest.raises(TypeError, match="AsyncHTTPTransport"):
+        AsyncBroker(base_url="https://example.com", mounts={"http://": httpx.HTTPTransport()})
+
+
+
+@pytest.mark.asyncio
+async def test_asyncbroker_accepts_dual_mode_transport_mounts():
+    """Ensure that transports usable by both client kinds, like MockTransport, are accepted."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"mounted": True}))
+    async with AsyncBroker(base_url="https://example.com", mounts={"https://": transport}) as broker:
+        assert (await broker.get("/ping")).json() == {"mounted": True}
+
+def test_asyncbroker_env_per_scheme_mounts(monkeypatch):
+    """Ensure that split HTTP_PROXY/HTTPS_PROXY settings become async per-scheme mounts."""
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy-a:8080")
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy-b:8080")
+    monkeypatch.delenv("ALL_PROXY", raising=False)
+    broker = AsyncBroker(base_url="https://example.com")
+    assert broker.proxy is None
+    assert set(broker.mounts) == {"http://", "https://"}
+    assert all(isinstance(t, httpx.AsyncHTTPTransport) for t in broker.mounts.values())
 
 
 def test_asyncbroker_explicit_proxy_used(mocker):
     """Ensure that an explicitly provided proxy is passed to the AsyncClient."""
     client_mock = mocker.patch("httpx.AsyncClient")
-    AsyncBroker(base_url="https://example.com", proxy="http://explicit:1234")
+    broker = AsyncBroker(base_url="https://example.com", proxy="http://explicit:1234")
+    client_mock.assert_not_called()
+    broker.session
     client_mock.assert_called_once()
     assert client_mock.call_args.kwargs["proxy"] == "http://explicit:1234"
\ No newline at end of file
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.urlscan import AsyncURLScanConnector, URLScanConnector
+
+
+def test_broker_map_preserves_input_order_and_captures_errors():
+    def handler(request):
+        q = request.url.params["q"]
+        if q == "bad":
+            return httpx.Response(500)
+        time.sleep(0.01 * (5 - int(q)))
+        return httpx.Response(200, json={"q": q})
+
+    conn = URLScanConnector(api_key="k")
+    conn.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    results = list(conn.map(conn.search, ["1", "2", "bad", "3", "4"], max_workers=3))
+
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert [r.query for r in results] == ["1", "2", "bad", "3", "4"]
+    assert not results[2].ok
+    assert isinstance(results[2].error, httpx.HTTPStatusError)
+    assert results[4].response.json() == {"q": "4"}
+
+
+def test_broker_map_bounds_concurrency_and_accepts_method_name():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(request):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return httpx.Response(200)
+
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    results = list(broker.map("get", (f"/item/{i}" for i in range(20)), max_workers=4, ordered=False))
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert all(r.ok for r in results)
+    assert state["peak"] <= 4
+
+
+def test_broker_map_forwards_kwargs():
+    seen = []
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: seen.append(dict(r.url.params)) or httpx.Response(200)
+    ))
+    list(broker.map(broker.get, ["/a", "/b"], params={"size": "10"}))
+    assert seen == [{"size": "10"}, {"size": "10"}]
+
+
+def test_broker_map_rejects_invalid_workers():
+    broker = Broker(base_url="https://testserver")
+    with pytest.raises(ValueError):
+        list(broker.map(broker.get, ["/a"], max_workers=0))
+
+
+@pytest.mark.asyncio
+async def test_async_gather_bounded_completion_order_and_limit():
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        delay = float(request.url.params["q"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        return httpx.Response(200, json={"q": request.url.params["q"]})
+
+    conn = AsyncURLScanConnector(api_key="k")
+    conn.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    queries = ["0.03", "0.01", "0.02", "0.0"]
+    results = [r async for r in conn.gather_bounded("search", queries, concurrency=2, ordered=False)]
+
+    assert sorted(r.index for r in results) == [0, 1, 2, 3]
+    assert results[0].query == "0.01"
+    assert state["peak"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_gather_bounded_ordered_with_errors():
+    async def handler(request):
+        if request.url.path.endswith("bad"):
+            return httpx.Response(404)
+        return httpx.Response(200)
+
+    broker = AsyncBroker(base_url="https://testserver")
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    results = [r async for r in broker.gather_bounded(broker.get, ["/a", "/bad", "/c"], concurrency=2)]
+
+    assert [r.query for r in results] == ["/a", "/bad", "/c"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_async_gather_bounded_cancels_pending_on_early_exit():
+    started = []
+
+    async def slow(query):
+        started.append(query)
+        await asyncio.sleep(0 if query == 0 else 10)
+        return query
+
+    broker = AsyncBroker(base_url="https://testserver")
+    stream = broker.gather_bounded(slow, range(100), concurrency=3, ordered=False)
+    async for result in stream:
+        assert result.response == 0
+        break
+    await stream.aclose()
+
+    assert len(started) <= 4
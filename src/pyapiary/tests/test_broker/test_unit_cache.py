@@ -0,0 +1,152 @@
+import gzip
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.cache import MemoryCache, SQLiteCache
+
+
+def test_memory_cache_serves_repeated_get(make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache()
+    broker = make_broker(counting_handler(calls), cache=cache)
+
+    first = broker.get("/api/v1/result/abc", params={"x": 1})
+    second = broker.get("/api/v1/result/abc", params={"x": 1})
+
+    assert len(calls) == 1
+    assert second.json() == first.json()
+    assert second.request.url == first.request.url
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_cache_key_includes_params_and_body(make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache(methods=("GET", "POST"))
+    broker = make_broker(counting_handler(calls), cache=cache)
+
+    broker.get("/a", params={"q": "one"})
+    broker.get("/a", params={"q": "two"})
+    broker.post("/b", json={"url": "x", "opts": {"a": 1, "b": 2}})
+    broker.post("/b", json={"opts": {"b": 2, "a": 1}, "url": "x"})
+
+    assert len(calls) == 3
+
+
+def test_post_not_cached_by_default(make_broker, counting_handler):
+    calls = []
+    broker = make_broker(counting_handler(calls), cache=MemoryCache())
+    broker.post("/scan", json={"url": "x"})
+    broker.post("/scan", json={"url": "x"})
+    assert len(calls) == 2
+
+
+def test_entries_expire_and_endpoint_ttl_overrides(clock, make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache(ttl=10, endpoint_ttls={"/api/v1/result": 100}, clock=clock)
+    broker = make_broker(counting_handler(calls), cache=cache)
+
+    broker.get("/api/v1/search/")
+    broker.get("/api/v1/result/abc")
+    clock.now += 50
+    broker.get("/api/v1/search/")
+    broker.get("/api/v1/result/abc")
+
+    assert [c.url.path for c in calls] == ["/api/v1/search/", "/api/v1/result/abc", "/api/v1/search/"]
+
+
+def test_lru_eviction(make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache(maxsize=2)
+    broker = make_broker(counting_handler(calls), cache=cache)
+
+    broker.get("/a")
+    broker.get("/b")
+    broker.get("/a")
+    broker.get("/c")  # evicts /b, the least recently used
+    broker.get("/a")
+    broker.get("/b")
+
+    assert [c.url.path for c in calls] == ["/a", "/b", "/c", "/b"]
+    assert len(cache) == 2
+
+
+def test_negative_caching_of_404(clock, make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache(ttl=3600, negative_ttl=60, clock=clock)
+    broker = make_broker(counting_handler(calls, 404), cache=cache)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            broker.get("/missing")
+    assert len(calls) == 1
+
+    clock.now += 61
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/missing")
+    assert len(calls) == 2
+
+
+def test_404_not_cached_without_negative_ttl(make_broker, counting_handler):
+    calls = []
+    broker = make_broker(counting_handler(calls, 404), cache=MemoryCache())
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            broker.get("/missing")
+    assert len(calls) == 2
+
+
+def test_server_errors_are_never_cached(make_broker, counting_handler):
+    calls = []
+    broker = make_broker(counting_handler(calls, 500), cache=MemoryCache(negative_ttl=60))
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            broker.get("/boom")
+    assert len(calls) == 2
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path, make_broker, counting_handler):
+    path = str(tmp_path / "cache.db")
+    calls = []
+    make_broker(counting_handler(calls), cache=SQLiteCache(path)).get("/api/v1/result/abc")
+
+    reopened = SQLiteCache(path)
+    response = make_broker(counting_handler(calls), cache=reopened).get("/api/v1/result/abc")
+
+    assert len(calls) == 1
+    assert response.json() == {"path": "/api/v1/result/abc", "n": 1}
+    assert reopened.stats() == {"hits": 1, "misses": 0}
+
+
+def test_sqlite_cache_expiry(tmp_path, clock, make_broker, counting_handler):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=5, clock=clock)
+    calls = []
+    broker = make_broker(counting_handler(calls), cache=cache)
+    broker.get("/a")
+    clock.now += 6
+    assert cache.purge_expired() == 1
+    broker.get("/a")
+    assert len(calls) == 2
+
+
+def test_cached_compressed_response_is_not_decoded_twice():
+    body = gzip.compress(b'{"ok": true}')
+    broker = Broker(base_url="https://testserver", cache=MemoryCache())
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+    ))
+    broker.get("/gz")
+    assert broker.get("/gz").json() == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_async_broker_uses_cache(make_broker, counting_handler):
+    calls = []
+    cache = MemoryCache()
+    broker = make_broker(counting_handler(calls), broker_cls=AsyncBroker, cache=cache)
+
+    await broker.get("/api/v1/result/abc")
+    response = await broker.get("/api/v1/result/abc")
+
+    assert len(calls) == 1
+    assert response.status_code == 200
+    assert cache.hits == 1
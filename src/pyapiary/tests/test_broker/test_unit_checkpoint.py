@@ -0,0 +1,139 @@
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.checkpoint import FileJournal, SQLiteJournal, open_journal, run_resumable, shard_of
+
+
+def counting_broker(calls, fail=()):
+    def handler(request):
+        q = request.url.params["q"]
+        calls.append(q)
+        if q in fail:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"q": q})
+
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+    return broker
+
+
+def search(broker):
+    return lambda q: broker.get("/search", params={"q": q})
+
+
+@pytest.mark.parametrize("name", ["journal.jsonl", "journal.db"])
+def test_resume_skips_completed_inputs_and_retries_failures(tmp_path, name):
+    path = str(tmp_path / name)
+    calls = []
+    broker = counting_broker(calls, fail={"c"})
+
+    first = list(broker.map_resumable(search(broker), ["a", "b", "c", "d"], path, max_workers=2))
+    assert [r.index for r in first] == [0, 1, 2, 3]
+    assert not first[2].ok
+
+    calls.clear()
+    broker = counting_broker(calls)
+    second = list(broker.map_resumable(search(broker), ["a", "b", "c", "d", "e"], path))
+
+    assert calls == ["c", "e"]
+    assert [(r.index, r.query) for r in second] == [(2, "c"), (4, "e")]
+    with open_journal(path) as journal:
+        assert len(journal) == 5
+
+
+def test_interrupted_run_journals_only_what_was_yielded(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    calls = []
+    broker = counting_broker(calls)
+    results = broker.map_resumable(search(broker), [str(i) for i in range(10)], path, max_workers=1)
+    next(results)
+    next(results)
+    results.close()
+
+    calls.clear()
+    list(broker.map_resumable(search(broker), [str(i) for i in range(10)], path, max_workers=1))
+    assert "0" not in calls and "1" not in calls
+    assert "9" in calls
+
+
+
+def test_repeated_input_runs_once_per_run(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    calls = []
+    broker = counting_broker(calls)
+    results = list(broker.map_resumable(search(broker), ["a", "b", "a", "a"], path, max_workers=4))
+
+    assert calls.count("a") == 1
+    assert [r.index for r in results] == [0, 1]
+    with open_journal(path) as journal:
+        assert len(journal) == 2
+
+
+def test_file_journal_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"key": "a", "completed_at": 1}\n{"key": "b", "comp')
+    journal = FileJournal(str(path))
+    assert "a" in journal and "b" not in journal
+    journal.record("c")
+    journal.close()
+
+    reopened = FileJournal(str(path))
+    assert "c" in reopened and len(reopened) == 2  # not glued onto the torn fragment
+    reopened.close()
+
+
+def test_stored_responses_and_record_error(tmp_path):
+    journal = SQLiteJournal(str(tmp_path / "journal.db"))
+    calls = []
+    broker = counting_broker(calls, fail={"gone"})
+    list(run_resumable(
+        search(broker),
+        ["a", "gone"],
+        journal,
+        store_responses=True,
+        record_error=lambda exc: isinstance(exc, httpx.HTTPStatusError),
+    ))
+
+    stored = dict(journal.responses())
+    assert stored["a"]["status_code"] == 200
+    assert '"q":"a"' in stored["a"]["text"].replace(" ", "")
+    assert "HTTPStatusError" in stored["gone"]["error"]
+    assert "gone" in journal
+    journal.close()
+
+
+def test_shards_partition_the_input(tmp_path):
+    queries = [f"ioc-{i}" for i in range(50)]
+    seen = []
+    for index in range(3):
+        journal = FileJournal(str(tmp_path / f"shard-{index}.jsonl"))
+        results = list(run_resumable(lambda q: q, queries, journal, shard=(index, 3)))
+        assert all(shard_of(r.query, 3) == index for r in results)
+        seen.extend(r.query for r in results)
+        journal.close()
+    assert sorted(seen) == sorted(queries)
+
+    with pytest.raises(ValueError):
+        list(run_resumable(lambda q: q, queries, str(tmp_path / "x.jsonl"), shard=(3, 3)))
+
+
+@pytest.mark.asyncio
+async def test_async_gather_resumable(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["q"])
+        return httpx.Response(200)
+
+    broker = AsyncBroker(base_url="https://testserver")
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def lookup(q):
+        return await broker.get("/search", params={"q": q})
+
+    results = [r async for r in broker.gather_resumable(lookup, [{"ip": "1.1.1.1"}, {"ip": "8.8.8.8"}], path)]
+    assert all(r.ok for r in results)
+    again = [r async for r in broker.gather_resumable(lookup, [{"ip": "8.8.8.8"}, {"ip": "9.9.9.9"}], path)]
+    assert [r.query for r in again] == [{"ip": "9.9.9.9"}]
+    assert len(calls) == 3
@@ -0,0 +1,191 @@
+import asyncio
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+    reset_shared_state,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_shared_state()
+    yield
+    reset_shared_state()
+
+
+def test_breaker_opens_after_threshold_and_recovers(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+    outage = httpx.ConnectError("down")
+
+    breaker.record(outage)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record(outage)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # only one trial in flight
+    breaker.record(None)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_reopens_on_failed_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_client_errors_do_not_trip_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    request = httpx.Request("GET", "https://x")
+    for status in (404, 429):
+        response = httpx.Response(status, request=request)
+        breaker.record(httpx.HTTPStatusError("e", request=request, response=response))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_budget_caps_retries_to_ratio_of_requests(clock):
+    budget = RetryBudget(ratio=0.5, min_retries=1, window=10, clock=clock)
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+    assert budget.rejected == 1
+
+    clock.now = 11
+    assert budget.try_retry() is True  # old traffic left the window; min_retries applies
+
+
+def test_shared_breaker_is_per_base_url_across_sync_and_async():
+    sync = Broker(base_url="https://api.flashpoint.io", circuit_breaker=True)
+    other = AsyncBroker(base_url="https://api.flashpoint.io/", circuit_breaker=True)
+    unrelated = Broker(base_url="https://urlscan.io", circuit_breaker=True)
+
+    assert sync.circuit_breaker is other.circuit_breaker
+    assert sync.circuit_breaker is not unrelated.circuit_breaker
+    assert sync.circuit_breaker is get_circuit_breaker("https://api.flashpoint.io")
+
+
+def test_broker_fails_fast_when_circuit_open():
+    calls = []
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    broker = Broker(base_url="https://testserver", circuit_breaker=breaker)
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: calls.append(r) or httpx.Response(503)
+    ))
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            broker.get("/x")
+    with pytest.raises(CircuitOpenError):
+        broker.get("/x")
+    assert len(calls) == 2
+
+
+def test_open_circuit_is_not_retried():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    slept = []
+    broker = Broker(base_url="https://testserver", enable_backoff=True, circuit_breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        broker.get("/x", retry_kwargs={"sleep": slept.append})
+    assert slept == []
+
+
+def test_retry_budget_stops_retries():
+    calls = []
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    broker = Broker(base_url="https://testserver", enable_backoff=True, retry_budget=budget)
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: calls.append(r) or httpx.Response(500)
+    ))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/x", retry_kwargs={"sleep": lambda s: None})
+
+    assert len(calls) == 2  # first attempt plus the single retry the budget allows
+    assert budget.rejected == 1
+
+
+def test_final_failed_attempt_is_not_charged_to_retry_budget():
+    calls = []
+    budget = RetryBudget(ratio=0.0, min_retries=2)
+    broker = Broker(base_url="https://testserver", enable_backoff=True, retry_budget=budget)
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: calls.append(r) or httpx.Response(500)
+    ))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/x", retry_kwargs={"sleep": lambda s: None})
+
+    assert len(calls) == 3  # stop_after_attempt(3): two retries, both within budget
+    assert budget.rejected == 0
+    assert budget.try_retry() is False  # exactly two tokens were spent
+
+
+def test_retry_budget_shared_flag():
+    a = Broker(base_url="https://a", retry_budget=True)
+    b = AsyncBroker(base_url="https://b", retry_budget=True)
+    assert a.retry_budget is b.retry_budget is get_retry_budget()
+
+
+@pytest.mark.asyncio
+async def test_async_broker_records_breaker_outcomes():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    broker = AsyncBroker(base_url="https://testserver", circuit_breaker=breaker)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda r: (_ for _ in ()).throw(httpx.ConnectError("down", request=r))
+    ))
+
+    with pytest.raises(httpx.ConnectError):
+        await broker.get("/x")
+    with pytest.raises(CircuitOpenError):
+        await broker.get("/x")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_frees_its_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+    started = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path == "/slow":
+            started.set()
+            await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    broker = AsyncBroker(base_url="https://testserver", circuit_breaker=breaker)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    task = asyncio.create_task(broker.get("/slow"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert (await broker.get("/fast")).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_release_trial_only_affects_half_open_state(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+    assert breaker.before_request() is False
+    breaker.record_failure()
+    clock.now = 5
+    assert breaker.before_request() is True
+    breaker.release_trial()
+    assert breaker.before_request() is True
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+def test_broker_coalesces_concurrent_identical_gets():
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request)
+        release.wait(2)
+        return httpx.Response(200, json={"ok": True})
+
+    broker = Broker(base_url="https://testserver", coalesce_requests=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(broker.get("/same", params={"q": 1})))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    wait_for(lambda: broker.coalesced_requests == 4)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(r.json() == {"ok": True} for r in results)
+
+
+def test_broker_coalesced_callers_share_exceptions():
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(2)
+        return httpx.Response(500)
+
+    broker = Broker(base_url="https://testserver", coalesce_requests=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    errors = []
+
+    def worker():
+        try:
+            broker.get("/boom")
+        except httpx.HTTPStatusError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    wait_for(lambda: broker.coalesced_requests == 2)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+
+
+def test_broker_does_not_coalesce_sequential_or_disabled_calls():
+    calls = []
+    transport = httpx.MockTransport(lambda r: calls.append(r) or httpx.Response(200))
+
+    enabled = Broker(base_url="https://testserver", coalesce_requests=True)
+    enabled.session = httpx.Client(transport=transport)
+    enabled.get("/a")
+    enabled.get("/a")
+    enabled.post("/a", json={})
+
+    assert len(calls) == 3
+    assert enabled.coalesced_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_async_broker_coalesces_concurrent_identical_gets():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    broker = AsyncBroker(base_url="https://testserver", coalesce_requests=True)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    results = await asyncio.gather(
+        *[broker.get("/same") for _ in range(10)],
+        broker.get("/other"),
+    )
+
+    assert len(calls) == 2
+    assert broker.coalesced_requests == 9
+    assert [r.json()["path"] for r in results] == ["/same"] * 10 + ["/other"]
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_request_survives_leader_cancellation():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    broker = AsyncBroker(base_url="https://testserver", coalesce_requests=True)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    leader = asyncio.create_task(broker.get("/same"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(broker.get("/same"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    response = await follower
+    assert response.json() == {"ok": True}
+    assert broker.coalesced_requests == 1
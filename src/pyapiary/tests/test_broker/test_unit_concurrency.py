@@ -0,0 +1,92 @@
+import asyncio
+import inspect
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker
+from pyapiary.api_connectors.concurrency import AdaptiveConcurrencyLimiter
+
+
+def status_error(code):
+    request = httpx.Request("GET", "https://example.com")
+    return httpx.HTTPStatusError("boom", request=request, response=httpx.Response(code, request=request))
+
+
+@pytest.mark.asyncio
+async def test_additive_increase_on_healthy_responses():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6, latency_tolerance=None)
+    for _ in range(4):
+        ticket = await limiter.acquire()
+        limiter.release(ticket, latency=0.1)
+    assert limiter.limit == 4  # 4 + 1/4 + ... stays below 5 until a full window completes
+    for _ in range(40):
+        ticket = await limiter.acquire()
+        limiter.release(ticket, latency=0.1)
+    assert limiter.limit == 6
+
+
+@pytest.mark.asyncio
+async def test_multiplicative_decrease_counts_a_burst_once():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2)
+    tickets = [await limiter.acquire() for _ in range(8)]
+    for ticket in tickets:
+        limiter.release(ticket, latency=0.1, exc=status_error(429))
+    assert limiter.limit == 8
+    assert limiter.decreases == 1
+
+    for code in (503, 502, 500):
+        limiter.release(await limiter.acquire(), latency=0.1, exc=status_error(code))
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_cut_and_latency_spikes_do():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2.0)
+    limiter.release(await limiter.acquire(), latency=0.1, exc=status_error(404))
+    assert limiter.limit == 10
+    limiter.release(await limiter.acquire(), latency=1.0)
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_a_free_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    first = await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limiter.stats()["waiting"] == 1
+
+    limiter.release(first, latency=0.01)
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_asyncbroker_caps_in_flight_requests_and_adapts():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2, latency_tolerance=None)
+    peak = 0
+    active = 0
+
+    async def handler(request):
+        nonlocal peak, active
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(429 if request.url.path == "/busy" else 200)
+
+    broker = AsyncBroker(base_url="https://testserver", adaptive_concurrency=limiter)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await asyncio.gather(*(broker.get("/ok") for _ in range(6)))
+    assert peak == 2
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await broker.get("/busy")
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_option_in_async_connector_signature():
+    assert "adaptive_concurrency" in inspect.signature(AsyncBroker.__init__).parameters
+    assert AsyncBroker(base_url="https://example.com", adaptive_concurrency=True).concurrency_limiter is not None
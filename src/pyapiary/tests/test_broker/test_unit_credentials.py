@@ -0,0 +1,109 @@
+import json
+import httpx
+import pytest
+from pyapiary.api_connectors.credentials import CredentialPool, as_credential_pool
+from pyapiary.api_connectors.ipqs import AsyncIPQSConnector, IPQSConnector
+from pyapiary.api_connectors.spycloud import SpycloudConnector
+from pyapiary.api_connectors.urlscan import URLScanConnector
+
+
+def test_round_robin_skips_parked_keys(clock):
+    pool = CredentialPool(["k1", "k2", "k3"], clock=clock)
+    assert [pool.acquire() for _ in range(3)] == ["k1", "k2", "k3"]
+
+    pool.park("k2", 30)
+    assert {pool.acquire() for _ in range(4)} == {"k1", "k3"}
+
+    clock.now = 31
+    assert "k2" in {pool.acquire() for _ in range(3)}
+
+
+def test_least_recently_throttled_prefers_healthy_keys(clock):
+    pool = CredentialPool(["k1", "k2"], strategy="least_recently_throttled", clock=clock)
+    pool.park("k1", 1)
+    clock.now = 5
+    assert pool.acquire() == "k2"
+
+
+def test_all_parked_uses_first_to_recover(clock):
+    pool = CredentialPool(["k1", "k2"], clock=clock)
+    pool.park("k1", 50)
+    pool.park("k2", 10)
+    assert pool.acquire() == "k2"
+    assert [s["throttled"] for s in pool.stats()] == [1, 1]
+    assert pool.stats()[0]["key"] == "..."
+
+
+def test_as_credential_pool_parses_env_style_lists():
+    assert as_credential_pool("only-one") is None
+    assert as_credential_pool("key-one, key-two").keys == ["key-one", "key-two"]
+    assert as_credential_pool(["a"]) is None
+
+
+def test_urlscan_rotates_to_next_key_on_429():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["API-Key"])
+        if request.headers["API-Key"] == "key-one":
+            return httpx.Response(429, headers={"Retry-After": "120"})
+        return httpx.Response(200, json={"results": []})
+
+    conn = URLScanConnector(api_key=["key-one", "key-two"])
+    conn.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert conn.search("domain:example.com").status_code == 200
+    assert conn.search("domain:example.com").status_code == 200
+    assert seen == ["key-one", "key-two", "key-two"]
+    assert conn.api_key.stats()[0]["parked_for"] == pytest.approx(120, abs=1)
+    assert "API-Key" not in conn.headers
+
+
+def test_urlscan_single_key_unchanged():
+    conn = URLScanConnector(api_key="solo")
+    assert conn.api_key == "solo"
+    assert conn.headers["API-Key"] == "solo"
+    assert conn.default_auth is None
+
+
+def test_spycloud_key_pools_per_product():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["x-api-key"])
+        return httpx.Response(200, json={})
+
+    conn = SpycloudConnector(ato_key=["ato-1", "ato-2"], inv_key="inv")
+    conn.session = httpx.Client(transport=httpx.MockTransport(handler))
+    conn.ato_search("email", "bob@example.com")
+    conn.ato_search("email", "bob@example.com")
+    conn.investigations_search("email", "bob@example.com")
+
+    assert seen == ["ato-1", "ato-2", "inv"]
+
+
+@pytest.mark.asyncio
+async def test_ipqs_pool_signs_body_and_parks_on_quota_error():
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        if body["key"] == "q-1":
+            return httpx.Response(200, json={"success": False, "message": "You have exceeded your request quota."})
+        return httpx.Response(200, json={"success": True})
+
+    conn = AsyncIPQSConnector(api_key=CredentialPool(["q-1", "q-2"]))
+    conn.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    response = await conn.malicious_url("https://example.com", strictness=1)
+
+    assert response.json() == {"success": True}
+    assert [b["key"] for b in bodies] == ["q-1", "q-2"]
+    assert bodies[1] == {"url": "https://example.com", "strictness": 1, "key": "q-2"}
+    assert conn.api_key.stats()[0]["throttled"] == 1
+
+
+def test_ipqs_single_key_keeps_key_in_body():
+    conn = IPQSConnector(api_key="k")
+    assert conn._key_field() == {"key": "k"}
@@ -0,0 +1,153 @@
+import asyncio
+import time
+import httpx
+import pytest
+from tenacity import stop_after_attempt
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.circuit_breaker import CircuitBreaker
+from pyapiary.api_connectors.deadline import Deadline, DeadlineExceeded, current_deadline, with_deadline
+from pyapiary.api_connectors.rate_limit import RateLimiter
+
+
+def test_attempt_timeout_is_shortened_to_remaining_budget():
+    now = [0.0]
+    deadline = Deadline(2.0, clock=lambda: now[0])
+    now[0] = 1.5
+    timeout = deadline.attempt_timeout(httpx.Timeout(10, connect=0.2))
+    assert timeout.read == pytest.approx(0.5)
+    assert timeout.connect == pytest.approx(0.2)
+    now[0] = 2.0
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+
+
+def test_backoff_that_would_outlast_the_deadline_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request.extensions["timeout"]["read"])
+        return httpx.Response(503, headers={"Retry-After": "5"})
+
+    broker = Broker(base_url="https://testserver", enable_backoff=True, timeout=10, deadline=1.0)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    start = time.perf_counter()
+    with pytest.raises(DeadlineExceeded) as info:
+        broker.get("/search")
+    assert time.perf_counter() - start < 0.5
+    assert isinstance(info.value.__cause__, httpx.HTTPStatusError)
+    assert len(calls) == 1
+    assert calls[0] <= 1.0
+
+
+def test_per_call_deadline_bounds_retries_and_keeps_short_waits():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(503, headers={"Retry-After": "0.05"})
+
+    broker = Broker(base_url="https://testserver", enable_backoff=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/search", deadline=5.0)
+    assert len(attempts) == 3
+    assert attempts[0] <= 5.0 and attempts[0] > attempts[2]
+
+
+def test_last_attempt_failing_inside_deadline_raises_the_real_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    broker = Broker(base_url="https://testserver", enable_backoff=True, deadline=30.0)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+    waits = iter([0, 60])
+    retry_kwargs = {"stop": stop_after_attempt(2), "wait": lambda state: next(waits)}
+
+    with pytest.raises(httpx.HTTPStatusError) as info:
+        broker.get("/search", retry_kwargs=retry_kwargs)
+    assert info.value.response.status_code == 503
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_last_attempt_failing_inside_deadline_raises_the_real_error():
+    broker = AsyncBroker(base_url="https://testserver", enable_backoff=True, deadline=30.0)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(502)))
+    retry_kwargs = {"stop": stop_after_attempt(1), "wait": lambda state: 60}
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await broker.get("/search", retry_kwargs=retry_kwargs)
+
+
+def test_rate_limit_slot_is_given_back_when_the_deadline_rejects_the_wait():
+    limiter = RateLimiter(rate=1, burst=1, clock=lambda: 0.0)
+    broker = Broker(base_url="https://testserver", rate_limit=limiter)
+    broker.session = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+    broker.get("/first")
+    for _ in range(3):
+        with pytest.raises(DeadlineExceeded):
+            broker.get("/second", deadline=0.5)
+    assert limiter.reserve() == pytest.approx(1.0)  # only the first request's slot is spent
+
+
+def test_expired_scope_fails_before_sending():
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with with_deadline(0.05) as deadline:
+        assert current_deadline() is deadline
+        time.sleep(0.06)
+        with pytest.raises(DeadlineExceeded):
+            broker.get("/a")
+    assert current_deadline() is None
+
+    with pytest.raises(httpx.ReadTimeout):
+        broker.get("/a", deadline=5)
+
+
+def test_nested_scopes_only_shorten():
+    with with_deadline(0.5) as outer:
+        with with_deadline(10) as inner:
+            assert inner is outer
+        with with_deadline(0.1) as shorter:
+            assert shorter.expires_at < outer.expires_at
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_cancels_a_hung_attempt():
+    async def handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    broker = AsyncBroker(base_url="https://testserver", deadline=0.05)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    start = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        await broker.get("/slow")
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_hung_upstream_cut_off_by_deadline_opens_the_breaker():
+    async def handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    breaker = CircuitBreaker(failure_threshold=2)
+    broker = AsyncBroker(base_url="https://testserver", deadline=0.05, circuit_breaker=breaker)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    for _ in range(2):
+        with pytest.raises(DeadlineExceeded):
+            await broker.get("/slow")
+    assert breaker.state == "open"
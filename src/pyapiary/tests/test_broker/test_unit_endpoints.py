@@ -0,0 +1,158 @@
+import random
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.circuit_breaker import get_circuit_breaker, reset_shared_state
+from pyapiary.api_connectors.endpoints import EndpointPool
+from pyapiary.api_connectors.urlscan import URLScanConnector
+
+EU = "https://eu.example.com"
+US = "https://us.example.com"
+
+
+def test_latency_strategy_prefers_fastest_healthy_endpoint():
+    pool = EndpointPool([EU, US], explore=0)
+    assert pool.choose() == EU  # unmeasured endpoints are tried first
+    pool.record(EU, 0.30, failed=False)
+    assert pool.choose() == US
+    pool.record(US, 0.05, failed=False)
+    assert pool.choose() == US
+    assert pool.choose(exclude=[US]) == EU
+
+
+def test_weights_scale_latency_and_weighted_strategy():
+    pool = EndpointPool({EU: 1.0, US: 4.0}, explore=0)
+    pool.record(EU, 0.1, failed=False)
+    pool.record(US, 0.3, failed=False)
+    assert pool.choose() == US
+
+    weighted = EndpointPool({EU: 1.0, US: 9.0}, strategy="weighted", rng=random.Random(7))
+    picks = [weighted.choose() for _ in range(200)]
+    assert picks.count(US) > 150
+
+
+def test_failing_endpoint_is_taken_out_of_rotation_until_cooldown():
+    now = [0.0]
+    pool = EndpointPool([EU, US], strategy="ordered", failure_threshold=2, cooldown=30, clock=lambda: now[0])
+    pool.record(EU, 0.1, failed=True)
+    assert pool.choose() == EU
+    pool.record(EU, 0.1, failed=True)
+    assert pool.choose() == US
+    assert pool.stats()[0]["down_for"] == 30
+    now[0] = 31
+    assert pool.choose() == EU
+
+    pool.record(US, 0.1, failed=True)
+    pool.record(US, 0.1, failed=True)
+    now[0] = 32
+    pool.record(EU, 0.1, failed=True)
+    pool.record(EU, 0.1, failed=True)
+    assert pool.available() is False
+    assert pool.choose() == US  # comes back first
+
+
+def test_connect_error_fails_over_within_one_attempt():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.host)
+        if request.url.host == "eu.example.com":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    broker = Broker(base_url="https://api.example.com", base_urls=[EU, US])
+    broker.endpoint_pool.explore = 0
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert broker.get("/lookup").json() == {"host": "us.example.com"}
+    assert seen == ["eu.example.com", "us.example.com"]
+    assert broker.endpoint_pool.stats()[0]["error_rate"] > 0
+
+
+def test_retries_move_to_another_endpoint_after_5xx():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.host)
+        return httpx.Response(503 if request.url.host == "eu.example.com" else 200)
+
+    pool = EndpointPool([EU, US], strategy="ordered")
+    broker = Broker(base_url="https://api.example.com", base_urls=pool, enable_backoff=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    resp = broker.get("/lookup", retry_kwargs={"wait": lambda state: 0})
+    assert resp.status_code == 200
+    assert seen == ["eu.example.com", "us.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_async_broker_routes_through_pool():
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        if request.url.host == "eu.example.com":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    broker = AsyncBroker(base_url="https://api.example.com", base_urls=EndpointPool([EU, US], strategy="ordered"))
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await broker.get("/v1/item")
+    assert seen == [f"{EU}/v1/item", f"{US}/v1/item"]
+
+
+def _refuse_eu(request):
+    if request.url.host == "eu.example.com":
+        raise httpx.ConnectError("refused", request=request)
+    return httpx.Response(200, content=b"payload")
+
+
+def test_stream_fails_over_and_records_endpoint_health():
+    broker = Broker(base_url="https://api.example.com", base_urls=EndpointPool([EU, US], strategy="ordered"))
+    broker.session = httpx.Client(transport=httpx.MockTransport(_refuse_eu))
+    with broker.stream("GET", "/file") as resp:
+        assert resp.read() == b"payload"
+    assert resp.url.host == "us.example.com"
+    eu, us = broker.endpoint_pool.stats()
+    assert eu["error_rate"] > 0 and us["latency"] is not None
+
+
+@pytest.mark.asyncio
+async def test_async_stream_fails_over_and_records_endpoint_health():
+    broker = AsyncBroker(base_url="https://api.example.com", base_urls=EndpointPool([EU, US], strategy="ordered"))
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(_refuse_eu))
+    async with broker.stream("GET", "/file") as resp:
+        assert await resp.aread() == b"payload"
+    assert resp.url.host == "us.example.com"
+    assert broker.endpoint_pool.stats()[0]["error_rate"] > 0
+
+
+def test_circuit_breaker_is_kept_per_endpoint():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.host)
+        return httpx.Response(503 if request.url.host == "eu.example.com" else 200)
+
+    # The pool itself never benches EU, so only its breaker can steer traffic away
+    pool = EndpointPool([EU, US], strategy="ordered", failure_threshold=100, max_error_rate=1.0)
+    broker = Broker(base_url="https://api.example.com", base_urls=pool, circuit_breaker=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+    try:
+        assert broker.circuit_breaker is None
+        for _ in range(5):
+            with pytest.raises(httpx.HTTPStatusError):
+                broker.get("/lookup")
+        assert get_circuit_breaker(EU).state == "open"
+        assert get_circuit_breaker(US).state == "closed"
+
+        assert broker.get("/lookup").status_code == 200
+        assert seen[-1] == "us.example.com" and seen.count("eu.example.com") == 5
+    finally:
+        reset_shared_state()
+
+
+def test_vendor_connectors_accept_base_urls():
+    conn = URLScanConnector(api_key="k", base_urls=["https://urlscan.io", "https://urlscan-proxy.internal"])
+    assert conn.base_url == "https://urlscan.io"
+    assert conn.endpoint_pool.urls == ["https://urlscan.io", "https://urlscan-proxy.internal"]
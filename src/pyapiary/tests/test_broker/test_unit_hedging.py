@@ -0,0 +1,144 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.endpoints import EndpointPool
+from pyapiary.api_connectors.hedging import HedgePolicy, hedged_call
+from pyapiary.api_connectors.metrics import MetricsRegistry
+from pyapiary.api_connectors.urlscan import URLScanConnector
+
+
+def test_adaptive_delay_uses_endpoint_percentile():
+    policy = HedgePolicy(min_samples=10, percentile=0.9)
+    assert policy.hedge_delay("/result/0b9a3cde-1111-2222-3333-444455556666") is None
+    for i in range(10):
+        policy.record_latency(f"/result/{i:032x}", (i + 1) / 100)
+    assert policy.hedge_delay("/result/ffffffffffffffffffffffffffffffff") == pytest.approx(0.10)
+    assert policy.hedge_delay("/search") is None
+    assert HedgePolicy(delay=0.2).hedge_delay("/search") == 0.2
+
+
+def test_hedge_budget_caps_ratio():
+    now = [0.0]
+    policy = HedgePolicy(max_ratio=0.1, window=10, clock=lambda: now[0])
+    for _ in range(20):
+        policy.record_request()
+    assert policy.try_hedge() and policy.try_hedge()
+    assert not policy.try_hedge()
+    assert policy.rejected == 1
+    now[0] = 11
+    assert not policy.try_hedge()
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_wins_and_loser_is_cancelled():
+    state = {"calls": 0, "cancelled": 0}
+
+    async def handler(request):
+        state["calls"] += 1
+        try:
+            await asyncio.sleep(5 if state["calls"] == 1 else 0)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        return httpx.Response(200, json={"copy": state["calls"]})
+
+    policy = HedgePolicy(delay=0.01, max_ratio=1.0)
+    broker = AsyncBroker(base_url="https://testserver", hedging=policy)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    resp = await asyncio.wait_for(broker.get("/result/abc"), 1)
+    assert resp.json() == {"copy": 2}
+    assert state == {"calls": 2, "cancelled": 1}
+    assert policy.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_post_and_fast_responses_are_not_hedged():
+    calls = []
+    broker = AsyncBroker(base_url="https://testserver", hedging=0.05)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda r: calls.append(r.method) or httpx.Response(200)
+    ))
+    await broker.get("/fast")
+    await broker.post("/submit", json={"url": "x"})
+    assert calls == ["GET", "POST"]
+    assert broker.hedging.hedged == 0
+
+
+def test_sync_hedge_returns_first_response_and_respects_budget():
+    lock = threading.Lock()
+    calls = []
+
+    def handler(request):
+        with lock:
+            calls.append(request.url.path)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.3)
+        return httpx.Response(200, json={"slow": first})
+
+    policy = HedgePolicy(delay=0.02, max_ratio=0.5)
+    broker = Broker(base_url="https://testserver", hedging=policy)
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    start = time.perf_counter()
+    assert broker.get("/lookup").json() == {"slow": False}
+    assert time.perf_counter() - start < 0.25
+    assert policy.hedged == 1
+
+    # One hedge per two requests: the next slow-looking request is not hedged
+    assert not policy.try_hedge()
+    policy.close()
+
+
+def test_sync_hedge_delay_starts_when_primary_runs():
+    policy = HedgePolicy(delay=0.02, max_ratio=1.0, max_workers=1)
+    request_id = contextvars.ContextVar("request_id")
+    request_id.set("abc")
+    # The only pool thread is busy, so the primary waits in the queue longer than the delay
+    policy._pool().submit(time.sleep, 0.1)
+
+    assert hedged_call(policy, "/lookup", lambda: request_id.get(), lambda: "hedge") == "abc"
+    assert policy.hedged == 0
+    policy.close()
+
+
+def test_sync_hedge_copies_keep_their_own_timer_and_endpoint_exclusions():
+    lock = threading.Lock()
+    seen = []
+
+    def handler(request):
+        with lock:
+            seen.append((request.url.host, request.extensions["trace"].__self__))
+            first = len(seen) == 1
+        if first:
+            time.sleep(0.2)
+            return httpx.Response(200, json={"copy": "primary"})
+        if request.url.host == "eu.example.com":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    policy = HedgePolicy(delay=0.02, max_ratio=1.0)
+    broker = Broker(
+        base_url="https://api.example.com",
+        base_urls=EndpointPool(["https://eu.example.com", "https://us.example.com"], strategy="ordered"),
+        hedging=policy,
+        metrics=MetricsRegistry(),
+    )
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert broker.get("/lookup").json() == {"copy": "hedge"}
+    # The hedge failed over to US with its own timer, separate from the primary's
+    assert [host for host, _ in seen] == ["eu.example.com", "eu.example.com", "us.example.com"]
+    assert seen[0][1] is not seen[1][1] and seen[1][1] is seen[2][1]
+    policy.close()
+
+
+def test_connector_signature_exposes_hedging():
+    assert "hedging" in inspect.signature(URLScanConnector.__init__).parameters
+    assert isinstance(URLScanConnector(api_key="k", hedging=True).hedging, HedgePolicy)
@@ -0,0 +1,51 @@
+import inspect
+import httpx
+import pytest
+from pyapiary.api_connectors import broker as broker_module
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.urlscan import URLScanConnector
+
+
+def test_limits_and_granular_timeouts_passed_to_client(mocker):
+    client_mock = mocker.patch("httpx.Client")
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+    Broker(base_url="https://example.com", timeout=15, limits=limits, connect_timeout=2, pool_timeout=30).session
+
+    kwargs = client_mock.call_args.kwargs
+    assert kwargs["limits"] is limits
+    assert kwargs["timeout"] == httpx.Timeout(15, connect=2, pool=30)
+    assert "http2" not in kwargs
+
+
+def test_granular_timeouts_override_timeout_object(mocker):
+    client_mock = mocker.patch("httpx.AsyncClient")
+    AsyncBroker(base_url="https://example.com", timeout=httpx.Timeout(5, read=60), write_timeout=1).session
+
+    assert client_mock.call_args.kwargs["timeout"] == httpx.Timeout(5, read=60, write=1)
+
+
+def test_plain_timeout_unchanged(mocker):
+    client_mock = mocker.patch("httpx.Client")
+    Broker(base_url="https://example.com", timeout=7).session
+
+    assert client_mock.call_args.kwargs["timeout"] == 7
+
+
+def test_http2_enabled_when_h2_installed(mocker):
+    mocker.patch.object(broker_module, "_h2_available", return_value=True)
+    client_mock = mocker.patch("httpx.AsyncClient")
+    AsyncBroker(base_url="https://example.com", http2=True).session
+
+    assert client_mock.call_args.kwargs["http2"] is True
+
+
+def test_http2_without_h2_fails_at_construction(mocker):
+    mocker.patch.object(broker_module, "_h2_available", return_value=False)
+    with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+        Broker(base_url="https://example.com", http2=True)
+
+
+def test_options_in_bubbled_signature():
+    params = inspect.signature(URLScanConnector.__init__).parameters
+    for name in ("http2", "limits", "connect_timeout", "read_timeout", "write_timeout", "pool_timeout"):
+        assert name in params
@@ -0,0 +1,78 @@
+import json
+import httpx
+import pytest
+from pyapiary.api_connectors import json_codec
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.ipqs import IPQSConnector
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    monkeypatch.setattr(json_codec, "_fast_dumps", None)
+    monkeypatch.setattr(json_codec, "_fast_loads", None)
+
+
+def echo_handler(request):
+    return httpx.Response(200, content=request.content, headers={
+        "Content-Type": "application/json",
+        "X-Request-Content-Type": request.headers.get("content-type", ""),
+    })
+
+
+def test_dumps_and_loads_round_trip():
+    payload = {"query": "ünïcode", "size": 10, "nested": [1, 2.5, None, True]}
+    assert json_codec.loads(json_codec.dumps(payload)) == payload
+    assert json.loads(json_codec.dumps(payload).decode("utf-8")) == payload
+
+
+def test_dumps_falls_back_for_types_fast_codec_rejects():
+    assert json.loads(json_codec.dumps({1: "int key"})) == {"1": "int key"}
+
+
+def test_loads_raises_stdlib_error_on_invalid_json():
+    with pytest.raises(ValueError):
+        json_codec.loads(b"{not json")
+
+
+def test_response_json_matches_httpx(stdlib_only):
+    response = httpx.Response(200, json={"a": [1, 2]})
+    assert Broker.response_json(response) == response.json()
+
+
+def test_fast_backend_is_used_when_installed():
+    pytest.importorskip("orjson")
+    assert json_codec.backend == "orjson"
+    assert json_codec.has_fast_backend()
+
+
+def test_broker_encodes_json_body_and_sets_content_type():
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(echo_handler))
+
+    response = broker.post("/echo", json={"url": "https://example.com", "n": 1})
+
+    assert json.loads(response.content) == {"url": "https://example.com", "n": 1}
+    assert response.headers["X-Request-Content-Type"] == "application/json"
+
+
+def test_connector_content_type_is_preserved():
+    conn = IPQSConnector(api_key="k")
+    conn.session = httpx.Client(transport=httpx.MockTransport(echo_handler))
+    response = conn.malicious_url("https://example.com")
+    assert response.headers["X-Request-Content-Type"] == "application/json"
+    assert conn.response_json(response) == {"url": "https://example.com", "key": "k"}
+
+
+def test_fetch_json_stdlib_fallback(stdlib_only):
+    broker = Broker(base_url="https://testserver")
+    broker.session = httpx.Client(transport=httpx.MockTransport(echo_handler))
+    assert broker.fetch_json("/echo", method="POST", json={"x": 1}) == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_json():
+    broker = AsyncBroker(base_url="https://testserver")
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda r: httpx.Response(200, json={"total": 3, "results": []})
+    ))
+    assert await broker.fetch_json("/api/v1/search/", params={"q": "x"}) == {"total": 3, "results": []}
@@ -0,0 +1,79 @@
+import ssl
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.ssl_context import clear_shared_ssl_contexts, get_shared_ssl_context
+
+
+@pytest.fixture(autouse=True)
+def fresh_contexts():
+    clear_shared_ssl_contexts()
+    yield
+    clear_shared_ssl_contexts()
+
+
+def test_construction_does_not_build_client(mocker):
+    client_mock = mocker.patch("httpx.Client")
+    create_mock = mocker.patch("httpx.create_ssl_context")
+
+    broker = Broker(base_url="https://example.com", proxy="http://proxy:8080")
+
+    client_mock.assert_not_called()
+    create_mock.assert_not_called()
+    broker.session
+    broker.session
+    client_mock.assert_called_once()
+    assert client_mock.call_args.kwargs["proxy"] == "http://proxy:8080"
+
+
+def test_client_built_on_first_request():
+    broker = Broker(base_url="https://example.com")
+    assert broker._session is None
+
+    broker.session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    assert broker.get("/ping").status_code == 200
+
+
+def test_connectors_share_ssl_context(mocker):
+    client_mock = mocker.patch("httpx.Client")
+    Broker(base_url="https://a.example.com").session
+    Broker(base_url="https://b.example.com").session
+
+    first, second = (call.kwargs["verify"] for call in client_mock.call_args_list)
+    assert isinstance(first, ssl.SSLContext)
+    assert first is second
+
+
+def test_incompatible_tls_settings_get_separate_contexts(mocker):
+    mocker.patch("pyapiary.api_connectors.broker._h2_available", return_value=True)
+    client_mock = mocker.patch("httpx.Client")
+    Broker(base_url="https://a.example.com").session
+    Broker(base_url="https://b.example.com", verify=False).session
+    Broker(base_url="https://c.example.com", http2=True).session
+
+    contexts = [call.kwargs["verify"] for call in client_mock.call_args_list]
+    assert len({id(c) for c in contexts}) == 3
+    assert contexts[1].verify_mode == ssl.CERT_NONE
+
+
+def test_caller_context_passes_through(mocker):
+    client_mock = mocker.patch("httpx.AsyncClient")
+    context = ssl.create_default_context()
+    AsyncBroker(base_url="https://example.com", verify=context).session
+
+    assert client_mock.call_args.kwargs["verify"] is context
+
+
+def test_proxy_mount_transports_use_shared_context():
+    broker = AsyncBroker(base_url="https://example.com", mounts={"https://": "http://proxy:8080"})
+    transport = broker.mounts["https://"]
+
+    assert transport._pool._ssl_context is get_shared_ssl_context()
+
+
+@pytest.mark.asyncio
+async def test_exit_without_use_does_not_build_client(mocker):
+    client_mock = mocker.patch("httpx.AsyncClient")
+    async with AsyncBroker(base_url="https://example.com"):
+        pass
+    client_mock.assert_not_called()
@@ -0,0 +1,163 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.metrics import MetricsRegistry, OpenTelemetryForwarder, normalize_endpoint
+
+
+def counter(registry, name, **labels):
+    for series in registry.snapshot()["counters"].get(name, []):
+        if all(series["labels"].get(k) == v for k, v in labels.items()):
+            return series["value"]
+    return 0
+
+
+def histogram_count(registry, name):
+    return sum(series["count"] for series in registry.snapshot()["histograms"].get(name, []))
+
+
+@pytest.mark.parametrize("endpoint, expected", [
+    ("/api/v1/result/9f1c7d2e-1b2a-4c3d-8e9f-0a1b2c3d4e5f", "/api/v1/result/{id}"),
+    ("/sp-v2/breach/data/emails/bob@example.com", "/sp-v2/breach/data/emails/{id}"),
+    ("/sp-v2/breach/data/domains/example.com", "/sp-v2/breach/data/domains/{id}"),
+    ("/PhoneNumbers/+15558675309", "/PhoneNumbers/{id}"),
+    ("/sources/v2/media/12345", "/sources/v2/media/{id}"),
+    ("/api/v1/search/", "/api/v1/search/"),
+])
+def test_normalize_endpoint(endpoint, expected):
+    assert normalize_endpoint(endpoint) == expected
+
+
+def test_broker_records_latency_status_and_sizes():
+    registry = MetricsRegistry()
+    broker = Broker(base_url="https://testserver", metrics=registry)
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        # An iterator body is streamed like a real network response, so bytes are counted
+        lambda r: httpx.Response(404 if r.url.path.endswith("missing") else 200, content=iter([b"x" * 10]))
+    ))
+
+    broker.post("/api/v1/result/9f1c7d2e-1b2a-4c3d-8e9f-0a1b2c3d4e5f", json={"a": 1})
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/missing")
+
+    assert histogram_count(registry, "pyapiary_request_duration_seconds") == 2
+    assert counter(registry, "pyapiary_responses_total", status="200", endpoint="/api/v1/result/{id}") == 1
+    assert counter(registry, "pyapiary_responses_total", status="404", connector="Broker") == 1
+    assert counter(registry, "pyapiary_response_bytes_total", method="GET") == 10
+    assert counter(registry, "pyapiary_request_bytes_total", method="POST") > 0
+
+
+def test_broker_records_retries_and_transport_errors():
+    registry = MetricsRegistry()
+    broker = Broker(base_url="https://testserver", enable_backoff=True, metrics=registry)
+
+    def handler(request):
+        raise httpx.ConnectError("down", request=request)
+
+    broker.session = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(httpx.ConnectError):
+        broker.get("/x", retry_kwargs={"sleep": lambda s: None, "wait": lambda rs: 0.25})
+
+    assert counter(registry, "pyapiary_responses_total", status="ConnectError") == 3
+    assert counter(registry, "pyapiary_retries_total") == 2
+    assert counter(registry, "pyapiary_retry_sleep_seconds_total") == pytest.approx(0.5)
+
+
+def test_user_before_sleep_hook_still_called():
+    calls = []
+    broker = Broker(base_url="https://testserver", enable_backoff=True, metrics=MetricsRegistry())
+    broker.session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(503)))
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/x", retry_kwargs={"sleep": lambda s: None, "before_sleep": calls.append})
+    assert len(calls) == 2
+
+
+def test_prometheus_output():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.record_attempt("URLScanConnector", "get", "/api/v1/search/", 0.05,
+                            response=httpx.Response(200, request=httpx.Request("GET", "https://x")))
+    text = registry.to_prometheus()
+
+    assert "# TYPE pyapiary_request_duration_seconds histogram" in text
+    assert ('pyapiary_request_duration_seconds_bucket{connector="URLScanConnector",'
+            'endpoint="/api/v1/search/",le="0.1",method="GET"} 1') in text
+    assert 'le="+Inf"' in text
+    assert ('pyapiary_responses_total{connector="URLScanConnector",endpoint="/api/v1/search/",'
+            'method="GET",status="200"} 1') in text
+
+
+def test_opentelemetry_forwarder():
+    class Instrument:
+        def __init__(self):
+            self.calls = []
+
+        def record(self, value, attributes):
+            self.calls.append(("record", value, attributes))
+
+        def add(self, value, attributes):
+            self.calls.append(("add", value, attributes))
+
+    class Meter:
+        def __init__(self):
+            self.instruments = {}
+
+        def create_histogram(self, name, unit):
+            return self.instruments.setdefault(name, Instrument())
+
+        def create_counter(self, name, unit):
+            return self.instruments.setdefault(name, Instrument())
+
+    meter = Meter()
+    registry = MetricsRegistry()
+    registry.add_listener(OpenTelemetryForwarder(meter))
+    registry.record_retry("SpycloudConnector", "GET", "/sp-v2/breach/catalog", 1.5)
+
+    assert meter.instruments["pyapiary_retries_total"].calls[0][:2] == ("add", 1)
+    assert meter.instruments["pyapiary_retry_sleep_seconds_total"].calls[0][1] == 1.5
+
+
+def test_metrics_disabled_by_default():
+    broker = Broker(base_url="https://testserver")
+    assert broker.metrics is None
+    assert broker._attempt_timer() is None
+
+
+def test_connection_phases_recorded_against_real_socket():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        registry = MetricsRegistry()
+        with Broker(base_url=f"http://127.0.0.1:{server.server_port}", metrics=registry, trust_env=False) as broker:
+            broker.get("/ping")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for name in ("pyapiary_pool_wait_seconds", "pyapiary_connect_seconds", "pyapiary_server_seconds"):
+        assert histogram_count(registry, name) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_broker_records_metrics_and_retries():
+    registry = MetricsRegistry()
+    responses = iter([httpx.Response(500), httpx.Response(200)])
+    broker = AsyncBroker(base_url="https://testserver", enable_backoff=True, metrics=registry)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+
+    await broker.get("/x", retry_kwargs={"wait": lambda rs: 0})
+
+    assert counter(registry, "pyapiary_responses_total", status="500") == 1
+    assert counter(registry, "pyapiary_responses_total", status="200") == 1
+    assert counter(registry, "pyapiary_retries_total", connector="AsyncBroker") == 1
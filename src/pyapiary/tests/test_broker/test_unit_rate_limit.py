@@ -0,0 +1,68 @@
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.rate_limit import RateLimiter
+
+
+def test_rate_limiter_allows_burst_then_delays(clock):
+    limiter = RateLimiter(rate=2, per=1.0, clock=clock)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = RateLimiter(rate=1, per=1.0, burst=1, clock=clock)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0)
+    clock.now = 3.0
+    # Debt is repaid and the bucket is capped at its burst size
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_rate_limiter_rejects_invalid_config():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0.5)
+
+
+def test_broker_sleeps_when_rate_limited(mocker, clock):
+    limiter = RateLimiter(rate=1, per=2.0, burst=1, clock=clock)
+    sleep = mocker.patch("pyapiary.api_connectors.broker.time.sleep")
+
+    broker = Broker(base_url="https://testserver", rate_limit=limiter)
+    broker.session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    broker.get("/a")
+    broker.get("/b")
+
+    sleep.assert_called_once_with(pytest.approx(2.0))
+
+
+def test_endpoint_rate_limits_use_longest_prefix(clock):
+    search = RateLimiter(rate=1, per=1.0, burst=1, clock=clock)
+    other = RateLimiter(rate=100, clock=clock)
+    broker = Broker(
+        base_url="https://testserver",
+        endpoint_rate_limits={"/api": other, "/api/v1/search": search},
+    )
+
+    assert broker._rate_limit_delay("/api/v1/search/") == 0.0
+    assert broker._rate_limit_delay("/api/v1/search/") == pytest.approx(1.0)
+    assert broker._rate_limit_delay("/api/v1/result/abc") == 0.0
+    assert broker._rate_limit_delay("/dom/abc") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_async_broker_sleeps_when_rate_limited(mocker, clock):
+    limiter = RateLimiter(rate=1, per=1.0, burst=1, clock=clock)
+    sleep = mocker.patch("pyapiary.api_connectors.broker.asyncio.sleep", new_callable=mocker.AsyncMock)
+
+    broker = AsyncBroker(base_url="https://testserver", rate_limit=[limiter])
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    await broker.get("/a")
+    await broker.get("/b")
+
+    sleep.assert_awaited_once_with(pytest.approx(1.0))
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.registry import ConnectorRegistry
+
+
+def test_same_config_returns_same_instance():
+    registry = ConnectorRegistry()
+    first = registry.get(Broker, base_url="https://a.example.com", headers={"X-Key": "1"})
+    second = registry.get(Broker, base_url="https://a.example.com", headers={"X-Key": "1"})
+    other = registry.get(Broker, base_url="https://a.example.com", headers={"X-Key": "2"})
+
+    assert first is second
+    assert other is not first
+    assert len(registry) == 2
+
+
+
+def test_slow_construction_does_not_block_other_keys():
+    release = threading.Event()
+
+    class SlowBroker(Broker):
+        def __init__(self, *args, **kwargs):
+            if kwargs.get("base_url") == "https://slow.example.com":
+                assert release.wait(5)
+            super().__init__(*args, **kwargs)
+
+    registry = ConnectorRegistry()
+    results = {}
+    slow = threading.Thread(target=lambda: results.setdefault("slow", registry.get(SlowBroker, base_url="https://slow.example.com")))
+    slow.start()
+    try:
+        fast = registry.get(SlowBroker, base_url="https://fast.example.com")
+    finally:
+        release.set()
+        slow.join()
+
+    assert isinstance(fast, SlowBroker)
+    assert len(registry) == 2
+    registry.close()
+
+
+def test_racing_gets_for_one_key_share_the_first_connector():
+    built = []
+    both_building = threading.Barrier(2)
+
+    class RacingBroker(Broker):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            built.append(self)
+            both_building.wait(5)
+
+    registry = ConnectorRegistry()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get(RacingBroker, base_url="https://a.example.com")))
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 2
+    assert results[0] is results[1]
+    assert len(registry) == 1
+    registry.close()
+
+
+def test_pool_limits_applied_unless_overridden():
+    registry = ConnectorRegistry(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+    default = registry.get(Broker, base_url="https://a.example.com")
+    custom = registry.get(Broker, base_url="https://a.example.com", limits=httpx.Limits(max_connections=1))
+
+    pool = default.session._transport._pool
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (7, 3, 1.5)
+    assert custom.session._transport._pool._max_connections == 1
+
+
+def test_idle_connectors_are_evicted_and_closed(clock):
+    registry = ConnectorRegistry(idle_timeout=60, clock=clock)
+    stale = registry.get(Broker, base_url="https://a.example.com")
+    old_client = stale.session
+    clock.now = 30
+    fresh = registry.get(Broker, base_url="https://b.example.com")
+
+    clock.now = 70
+    assert registry.evict_idle() == 1
+    assert old_client.is_closed
+    assert registry.get(Broker, base_url="https://b.example.com") is fresh
+    assert registry.get(Broker, base_url="https://a.example.com") is not stale
+
+
+def test_evicted_connector_still_works_with_a_new_client(clock):
+    registry = ConnectorRegistry(idle_timeout=60, clock=clock)
+    transport = httpx.MockTransport(lambda r: httpx.Response(200))
+    held = registry.get(Broker, base_url="https://a.example.com", transport=transport)
+    old_client = held.session
+    assert held.get("/x").status_code == 200
+    clock.now = 70
+    assert registry.evict_idle() == 1
+    assert old_client.is_closed
+
+    assert held.get("/x").status_code == 200
+    assert held.session is not old_client
+
+
+@pytest.mark.asyncio
+async def test_async_eviction_clears_the_closed_client(clock):
+    registry = ConnectorRegistry(idle_timeout=60, clock=clock)
+    held = registry.get(AsyncBroker, base_url="https://a.example.com")
+    old_client = held.session
+    clock.now = 70
+    assert await registry.aevict_idle() == 1
+    assert old_client.is_closed
+    assert held.session is not old_client and not held.session.is_closed
+
+
+def test_close_closes_connectors_and_runs_hooks():
+    registry = ConnectorRegistry()
+    connector = registry.get(Broker, base_url="https://a.example.com")
+    client = connector.session
+    calls = []
+    registry.add_shutdown_hook(lambda: calls.append("hook"))
+
+    registry.close()
+
+    assert client.is_closed
+    assert calls == ["hook"]
+    assert len(registry) == 0
+
+
+def test_async_connectors_are_bound_to_their_loop():
+    registry = ConnectorRegistry()
+
+    async def fetch():
+        first = registry.get(AsyncBroker, base_url="https://a.example.com")
+        assert registry.get(AsyncBroker, base_url="https://a.example.com") is first
+        first.session
+        return first
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+
+    assert first is not second
+    assert len(registry) == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_awaits_async_clients():
+    registry = ConnectorRegistry()
+    connector = registry.get(AsyncBroker, base_url="https://a.example.com")
+    client = connector.session
+
+    await registry.aclose()
+
+    assert client.is_closed
@@ -0,0 +1,104 @@
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.ipqs import IPQSConnector
+from pyapiary.api_connectors.replay import CassetteMiss, RecordReplayTransport
+
+
+def origin(calls):
+    def handler(request):
+        calls.append(str(request.url))
+        if request.url.path == "/flaky":
+            status = 503 if sum(u.endswith("/flaky") for u in calls) == 1 else 200
+            return httpx.Response(status, json={"attempt": len(calls)})
+        if request.url.path == "/bin":
+            return httpx.Response(200, content=b"\xff\x00\xfe")
+        return httpx.Response(200, json={"path": request.url.path, "q": request.url.params.get("q")})
+    return httpx.MockTransport(handler)
+
+
+def test_record_then_replay_offline(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    calls = []
+    recorder = RecordReplayTransport(path, mode="record", transport=origin(calls))
+    broker = Broker(base_url="https://vendor.example")
+    broker.session = httpx.Client(transport=recorder)
+    broker.get("/search", params={"q": "a", "key": "secret-1"})
+    assert broker.get("/bin").content == b"\xff\x00\xfe"
+    recorder.save()
+    assert "secret-1" not in (tmp_path / "cassette.json").read_text()
+
+    replayer = RecordReplayTransport(path)
+    broker.session = httpx.Client(transport=replayer)
+    resp = broker.get("/search", params={"key": "secret-2", "q": "a"})
+    assert resp.json() == {"path": "/search", "q": "a"}
+    assert broker.get("/bin").content == b"\xff\x00\xfe"
+    assert len(calls) == 2
+    assert replayer.hits == 2
+
+    with pytest.raises(CassetteMiss):
+        broker.get("/search", params={"q": "unknown"})
+
+
+def test_repeated_responses_replay_in_order_and_last_repeats():
+    calls = []
+    transport = RecordReplayTransport(mode="once", transport=origin(calls))
+    broker = Broker(base_url="https://vendor.example")
+    broker.session = httpx.Client(transport=transport)
+    transport.mode = "record"
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/flaky")
+    assert broker.get("/flaky").status_code == 200
+
+    transport.mode = "replay"
+    transport.rewind()
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/flaky")
+    assert broker.get("/flaky").status_code == 200
+    assert broker.get("/flaky").status_code == 200
+    assert len(calls) == 2
+
+
+def test_json_body_credentials_are_ignored_when_matching():
+    calls = []
+    transport = RecordReplayTransport(mode="once", transport=origin(calls))
+    for key in ("key-a", "key-b"):
+        conn = IPQSConnector(api_key=key)
+        conn.session = httpx.Client(transport=transport)
+        conn.malicious_url("http://example.com")
+    assert len(calls) == 1
+    assert transport.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_and_replays():
+    calls = []
+    transport = RecordReplayTransport(mode="once", transport=origin(calls))
+    broker = AsyncBroker(base_url="https://vendor.example")
+    broker.session = httpx.AsyncClient(transport=transport)
+    first = await broker.get("/search", params={"q": "x"})
+    second = await broker.get("/search", params={"q": "x"})
+    assert first.json() == second.json()
+    assert len(calls) == 1
+
+
+def test_replay_mode_needs_no_transport_but_record_does():
+    RecordReplayTransport()
+    with pytest.raises(ValueError):
+        RecordReplayTransport(mode="record")
+    with pytest.raises(TypeError):
+        RecordReplayTransport(mode="record", transport=object())
+
+
+@pytest.mark.asyncio
+async def test_transport_of_the_wrong_kind_raises_type_error():
+    sync_only = RecordReplayTransport(mode="record", transport=httpx.HTTPTransport())
+    async with httpx.AsyncClient(transport=sync_only) as client:
+        with pytest.raises(TypeError, match="AsyncBaseTransport"):
+            await client.get("https://vendor.example/search")
+
+    async_only = RecordReplayTransport(mode="once", transport=httpx.AsyncHTTPTransport())
+    with httpx.Client(transport=async_only) as client:
+        with pytest.raises(TypeError, match="BaseTransport"):
+            client.get("https://vendor.example/search")
+    assert len(sync_only) == len(async_only) == 0
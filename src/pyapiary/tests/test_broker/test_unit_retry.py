@@ -0,0 +1,106 @@
+import httpx
+import pytest
+from email.utils import formatdate
+from tenacity import RetryCallState, Retrying, stop_after_attempt
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.retry import parse_retry_after, wait_decorrelated_jitter, wait_retry_after
+
+NOW = 1_700_000_000.0
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"Retry-After": "7"}, 7.0),
+    ({"Retry-After": formatdate(NOW + 30, usegmt=True)}, 30.0),
+    ({"X-Rate-Limit-Reset-After": "12"}, 12.0),
+    ({"X-Rate-Limit-Reset": "2023-11-14T22:14:05.000Z"}, 45.0),
+    ({"X-RateLimit-Reset": str(int(NOW + 90))}, 90.0),
+    ({"X-RateLimit-Reset": "15"}, 15.0),
+    ({"RateLimit-Reset": "3"}, 3.0),
+    ({"Retry-After": formatdate(NOW - 30, usegmt=True)}, 0.0),
+])
+def test_parse_retry_after(headers, expected):
+    assert parse_retry_after(httpx.Headers(headers), now=NOW) == pytest.approx(expected, abs=1)
+
+
+def test_parse_retry_after_ignores_garbage():
+    assert parse_retry_after(httpx.Headers({"Retry-After": "soon"}), now=NOW) is None
+    assert parse_retry_after(httpx.Headers({}), now=NOW) is None
+
+
+def make_state(exc):
+    state = RetryCallState(Retrying(), fn=None, args=(), kwargs={})
+    state.set_exception((type(exc), exc, None))
+    return state
+
+
+def status_error(status, headers=None):
+    request = httpx.Request("GET", "https://testserver/x")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("err", request=request, response=response)
+
+
+def test_wait_retry_after_uses_header_and_caps_it():
+    wait = wait_retry_after(max_wait=30)
+    assert wait(make_state(status_error(429, {"Retry-After": "1"}))) == 1.0
+    assert wait(make_state(status_error(429, {"Retry-After": "600"}))) == 30.0
+
+
+def test_wait_retry_after_falls_back_without_header():
+    wait = wait_retry_after(fallback=lambda rs: 4.2)
+    assert wait(make_state(status_error(503))) == 4.2
+    assert wait(make_state(httpx.ConnectError("down"))) == 4.2
+
+
+def test_decorrelated_jitter_grows_from_previous_sleep_and_is_capped():
+    bounds = []
+    wait = wait_decorrelated_jitter(base=1, cap=10, rng=lambda lo, hi: bounds.append((lo, hi)) or hi)
+    state = make_state(httpx.ConnectError("down"))
+    state.upcoming_sleep = 0
+    assert wait(state) == 3
+    state.upcoming_sleep = 3
+    assert wait(state) == 9
+    state.upcoming_sleep = 9
+    assert wait(state) == 10
+    assert bounds == [(1, 3), (1, 9), (1, 27)]
+
+
+def test_broker_backoff_honors_retry_after():
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    slept = []
+    broker = Broker(base_url="https://testserver", enable_backoff=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(lambda r: next(responses)))
+
+    response = broker.get("/x", retry_kwargs={"sleep": slept.append})
+
+    assert response.json() == {"ok": True}
+    assert slept == [1.0]
+
+
+def test_broker_backoff_respects_custom_stop():
+    slept = []
+    broker = Broker(base_url="https://testserver", enable_backoff=True)
+    broker.session = httpx.Client(transport=httpx.MockTransport(
+        lambda r: httpx.Response(429, headers={"Retry-After": "2"})
+    ))
+    with pytest.raises(httpx.HTTPStatusError):
+        broker.get("/x", retry_kwargs={"sleep": slept.append, "stop": stop_after_attempt(4)})
+    assert slept == [2.0, 2.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_async_broker_backoff_honors_retry_after(mocker):
+    sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    responses = iter([
+        httpx.Response(503, headers={"Retry-After": "5"}),
+        httpx.Response(200),
+    ])
+    broker = AsyncBroker(base_url="https://testserver", enable_backoff=True)
+    broker.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+
+    response = await broker.get("/x")
+
+    assert response.status_code == 200
+    sleep.assert_awaited_once_with(5.0)
@@ -0,0 +1,111 @@
+import httpx
+import pytest
+from pyapiary.api_connectors.ipqs import IPQSConnector, is_quota_exceeded
+from pyapiary.api_connectors.simulator import VendorProfile, VendorSimulator
+from pyapiary.api_connectors.spycloud import SpycloudConnector
+from pyapiary.api_connectors.twilio import AsyncTwilioConnector
+from pyapiary.api_connectors.urlscan import AsyncURLScanConnector, URLScanConnector
+
+INSTANT = dict(latency=0, latency_sigma=0)
+
+
+def test_search_pagination_matches_each_vendor():
+    sim = VendorSimulator({"urlscan": VendorProfile(total_results=25, page_size=10, **INSTANT),
+                           "spycloud": VendorProfile(total_results=7, **INSTANT)})
+    conn = URLScanConnector(api_key="k", transport=sim.transport())
+    ids, search_after = [], None
+    while True:
+        params = {"search_after": search_after} if search_after else {}
+        page = conn.search("domain:example.com", **params).json()
+        ids += [r["_id"] for r in page["results"]]
+        if not page["has_more"]:
+            break
+        search_after = ",".join(map(str, page["results"][-1]["sort"]))
+    assert len(ids) == len(set(ids)) == 25
+
+    spy = SpycloudConnector(ato_key="k", transport=sim.transport())
+    first = spy.ato_search("ip", "192.0.2.1", limit=5).json()
+    rest = spy.ato_search("ip", "192.0.2.1", cursor=first["cursor"]).json()
+    assert (first["hits"], rest["hits"], rest["cursor"]) == (5, 2, "")
+    assert sim.stats()["urlscan"]["ok"] == 3
+
+
+def test_per_key_rate_limit_answers_429_with_retry_after():
+    now = [0.0]
+    sim = VendorSimulator({"urlscan": VendorProfile(rate=1, burst=2, **INSTANT)}, clock=lambda: now[0])
+    client = httpx.Client(transport=sim.transport())
+    send = lambda key: client.get("https://urlscan.io/api/v1/search/", params={"q": "x"}, headers={"API-Key": key})
+
+    assert [send("a").status_code for _ in range(3)] == [200, 200, 429]
+    assert send("a").headers["Retry-After"] == "1"
+    assert send("b").status_code == 200  # quotas are per key
+    now[0] = 1.0
+    assert send("a").status_code == 200
+    assert sim.stats()["urlscan"] == {"requests": 6, "ok": 4, "throttled": 2, "errors": 0, "rejected": 0, "wasted": 2}
+    assert send("").status_code == 401
+
+
+def test_ipqs_quota_is_a_200_error_and_quota_window_resets():
+    now = [0.0]
+    sim = VendorSimulator({"ipqs": VendorProfile(quota=2, quota_window=60, **INSTANT)}, clock=lambda: now[0])
+    conn = IPQSConnector(api_key="k", transport=sim.transport())
+    responses = [conn.malicious_url("http://example.com") for _ in range(3)]
+    assert [r.json()["success"] for r in responses] == [True, True, False]
+    assert is_quota_exceeded(responses[-1])
+    now[0] = 60.0
+    assert conn.malicious_url("http://example.com").json()["success"] is True
+    assert sim.stats()["ipqs"]["throttled"] == 1
+
+
+def test_outage_bursts_and_backoff_through_random_errors():
+    now = [0.0]
+    sim = VendorSimulator({"twilio": VendorProfile(outage_every=10, outage_duration=2, **INSTANT)}, clock=lambda: now[0])
+    client = httpx.Client(transport=sim.transport(), auth=("sid", "secret"))
+    url = "https://lookups.twilio.com/v2/PhoneNumbers/+15555550100"
+    assert client.get(url).status_code == 200
+    now[0] = 8.5
+    assert client.get(url).status_code == 503
+    now[0] = 10.0
+    assert client.get(url).status_code == 200
+    now[0] = 29.0
+    assert client.get(url).status_code == 503
+
+    flaky = VendorSimulator({"urlscan": VendorProfile(error_rate=0.5, **INSTANT)}, seed=3)
+    conn = URLScanConnector(api_key="k", enable_backoff=True, transport=flaky.transport())
+    for _ in range(5):
+        conn.get("/api/v1/search/", params={"q": "x"}, retry_kwargs={"wait": lambda state: 0, "stop": lambda state: False})
+    stats = flaky.stats()["urlscan"]
+    assert stats["ok"] == 5 and stats["errors"] == stats["wasted"] > 0
+
+
+def test_backoff_honours_simulated_retry_after():
+    sim = VendorSimulator({"urlscan": VendorProfile(rate=1, burst=1, **INSTANT)}, speed=100)
+    conn = URLScanConnector(api_key="k", enable_backoff=True, transport=sim.transport())
+    assert conn.search("a").status_code == 200
+    assert conn.search("b").status_code == 200  # 429, waits ~10 ms, retried
+    assert sim.stats()["urlscan"]["throttled"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_async_connectors_over_asgi_transport():
+    sim = VendorSimulator({"twilio": VendorProfile(**INSTANT), "urlscan": VendorProfile(**INSTANT)})
+    async with AsyncTwilioConnector(api_sid="sid", api_secret="secret", transport=sim.async_transport()) as conn:
+        body = (await conn.lookup_phone("+15555550100", data_packages=["caller_name"])).json()
+    assert body["phone_number"] == "+15555550100" and "caller_name" in body
+    async with AsyncURLScanConnector(api_key="k", transport=sim.async_transport()) as conn:
+        with pytest.raises(httpx.HTTPStatusError) as exc:
+            await conn.get("/api/v1/nope")
+    assert exc.value.response.status_code == 404
+
+
+def test_local_server_stands_in_for_vendor_base_url():
+    sim = VendorSimulator({"urlscan": VendorProfile(**INSTANT)})
+    with sim.serve() as server:
+        base = server.base_url_for("https://urlscan.io")
+        assert base == f"{server.url}/urlscan.io"
+        with URLScanConnector(api_key="k", base_urls=[base]) as conn:
+            assert conn.results("abc").json()["task"]["uuid"] == "abc"
+        assert httpx.get(f"{server.url}/api/v1/search/", headers={"Host": "urlscan.io"}).status_code == 401
+        assert httpx.get(f"{server.url}/unknown").status_code == 404
+    with pytest.raises(ValueError):
+        VendorSimulator({"acme": VendorProfile()})
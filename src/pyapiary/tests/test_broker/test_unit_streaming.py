@@ -0,0 +1,130 @@
+import hashlib
+import io
+import time
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker
+from pyapiary.api_connectors.cache import MemoryCache
+from pyapiary.api_connectors.deadline import DeadlineExceeded
+from pyapiary.api_connectors.streaming import ResponseTooLargeError
+
+BODY = bytes(range(256)) * 1024
+
+
+def chunked_handler(request):
+    if request.url.path == "/missing":
+        return httpx.Response(404, content=b"not here")
+    return httpx.Response(200, content=iter([BODY[i:i + 4096] for i in range(0, len(BODY), 4096)]))
+
+
+def test_stream_yields_unbuffered_response(make_broker):
+    broker = make_broker(chunked_handler)
+    with broker.stream("GET", "/blob") as resp:
+        assert not resp.is_stream_consumed
+        data = b"".join(resp.iter_bytes())
+    assert data == BODY
+
+
+def test_stream_raises_for_error_status_with_readable_body(make_broker):
+    broker = make_broker(chunked_handler)
+    with pytest.raises(httpx.HTTPStatusError) as info:
+        with broker.stream("GET", "/missing"):
+            pass
+    assert info.value.response.content == b"not here"
+
+
+def test_download_to_spooled_file_by_default(make_broker):
+    result = make_broker(chunked_handler).download_to("/blob")
+    assert result.bytes_written == len(BODY)
+    assert result.digest == hashlib.sha256(BODY).hexdigest()
+    with result.destination:
+        assert result.destination.read() == BODY
+
+
+def test_download_to_file_object_and_custom_hash(make_broker):
+    buffer = io.BytesIO()
+    result = make_broker(chunked_handler).download_to("/blob", destination=buffer, hash_algorithm="md5")
+    assert buffer.getvalue() == BODY
+    assert result.destination is buffer
+    assert result.digest == hashlib.md5(BODY).hexdigest()
+
+
+def test_download_to_enforces_max_bytes_and_removes_partial_file(tmp_path, make_broker):
+    target = tmp_path / "out.bin"
+    with pytest.raises(ResponseTooLargeError):
+        make_broker(chunked_handler).download_to("/blob", destination=target, max_bytes=10_000)
+    assert not target.exists()
+
+
+def test_download_to_rejects_declared_oversize_before_reading(make_broker):
+    broker = make_broker(lambda r: httpx.Response(200, content=b"x" * 50))
+    with pytest.raises(ResponseTooLargeError):
+        broker.download_to("/blob", max_bytes=10)
+
+
+def test_stream_bypasses_cache(make_broker):
+    cache = MemoryCache()
+    broker = make_broker(chunked_handler, cache=cache)
+    broker.download_to("/blob").destination.close()
+    assert len(cache) == 0
+
+
+
+def test_download_deadline_bounds_headers_and_body(tmp_path, make_broker):
+    timeouts = []
+
+    def slow_body(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+
+        def chunks():
+            for _ in range(20):
+                time.sleep(0.02)
+                yield b"x" * 1024
+        return httpx.Response(200, content=chunks())
+
+    target = tmp_path / "out.bin"
+    broker = make_broker(slow_body, timeout=10)
+    with pytest.raises(DeadlineExceeded):
+        broker.download_to("/blob", destination=target, deadline=0.1)
+    assert timeouts[0] <= 0.1
+    assert not target.exists()
+
+
+@pytest.mark.asyncio
+async def test_async_download_to_path(tmp_path, make_broker):
+    async def handler(request):
+        return httpx.Response(200, content=BODY, headers={"Content-Type": "application/octet-stream"})
+
+    broker = make_broker(handler, broker_cls=AsyncBroker)
+
+    target = tmp_path / "out.bin"
+    result = await broker.download_to("/blob", destination=str(target))
+
+    assert target.read_bytes() == BODY
+    assert result.destination == str(target)
+    assert result.content_type == "application/octet-stream"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_error_status(make_broker):
+    broker = make_broker(lambda r: httpx.Response(500, content=b"boom"), broker_cls=AsyncBroker)
+    with pytest.raises(httpx.HTTPStatusError) as info:
+        async with broker.stream("GET", "/x"):
+            pass
+    assert info.value.response.content == b"boom"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_deadline_shortens_the_attempt_timeout(make_broker):
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, content=BODY)
+
+    broker = make_broker(handler, broker_cls=AsyncBroker, timeout=10)
+    result = await broker.download_to("/blob", deadline=5)
+    result.destination.close()
+    async with broker.stream("GET", "/blob", deadline=2) as resp:
+        await resp.aread()
+    assert 4 < timeouts[0] <= 5 and 1 < timeouts[1] <= 2
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import httpx
+import pytest
+from pyapiary.api_connectors.broker import AsyncBroker
+from pyapiary.api_connectors.sync_bridge import SyncBridge
+from pyapiary.api_connectors.urlscan import AsyncURLScanConnector
+
+
+def tracking_handler(state, delay=0.02):
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        if request.url.path.endswith("/bad"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"path": request.url.path})
+    return handler
+
+
+def test_submit_runs_calls_concurrently_and_returns_futures(make_broker):
+    state = {"active": 0, "peak": 0}
+    broker = make_broker(tracking_handler(state), broker_cls=AsyncBroker)
+    with SyncBridge(broker, concurrency=4) as bridge:
+        futures = bridge.submit_many("get", [f"/item/{i}" for i in range(12)])
+        results = [f.result(timeout=5) for f in futures]
+
+    assert [r.json()["path"] for r in results] == [f"/item/{i}" for i in range(12)]
+    assert state["peak"] == 4
+    assert broker.session.is_closed and bridge._loop.is_closed()
+
+
+def test_map_streams_ordered_results_and_captures_errors(make_broker):
+    state = {"active": 0, "peak": 0}
+    with SyncBridge(make_broker(tracking_handler(state), broker_cls=AsyncBroker)) as bridge:
+        results = list(bridge.map("get", ["/a", "/bad", "/c"], concurrency=3))
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].response.json() == {"path": "/a"}
+    assert isinstance(results[1].error, httpx.HTTPStatusError)
+    assert state["peak"] == 3
+
+
+def test_map_stopped_early_cancels_outstanding_calls(make_broker):
+    state = {"started": 0, "active": 0, "cancelled": 0}
+
+    async def handler(request):
+        state["started"] += 1
+        state["active"] += 1
+        try:
+            await asyncio.sleep(0 if request.url.path == "/item/0" else 5)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        finally:
+            state["active"] -= 1
+        return httpx.Response(200)
+
+    broker = make_broker(handler, broker_cls=AsyncBroker)
+    with SyncBridge(broker) as bridge:
+        results = bridge.map("get", (f"/item/{i}" for i in range(100)), concurrency=5)
+        first = next(results)
+        results.close()
+        assert first.ok
+        assert state["active"] == 0
+        assert state["cancelled"] == 4
+        assert state["started"] == 5
+
+
+def test_connector_methods_block_on_the_bridge():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.params["q"], threading.current_thread().name))
+        return httpx.Response(200, json={"results": []})
+
+    conn = AsyncURLScanConnector(api_key="k")
+    conn.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with SyncBridge(conn) as bridge:
+        response = bridge.search("domain:example.com")
+        assert bridge.base_url == conn.base_url
+
+    assert response.json() == {"results": []}
+    assert seen[0][0] == "domain:example.com"
+    assert seen[0][1].startswith("pyapiary-bridge-")
+
+
+def test_close_closes_client_and_rejects_new_calls(make_broker):
+    broker = make_broker(tracking_handler({"active": 0, "peak": 0}), broker_cls=AsyncBroker)
+    bridge = SyncBridge(broker)
+    bridge.call("get", "/x")
+    bridge.close()
+
+    assert broker.session.is_closed
+    assert not bridge._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        bridge.submit("get", "/y")
+    bridge.close()
@@ -0,0 +1,103 @@
+import logging
+import httpx
+import pytest
+from pyapiary.api_connectors import tracing
+from pyapiary.api_connectors.broker import AsyncBroker, Broker
+from pyapiary.api_connectors.tracing import log_method_call
+
+
+class Traced(Broker):
+    @log_method_call
+    def search(self, query: str, limit: int = 10, **kwargs):
+        return self.get("/search", params={"q": query})
+
+    @log_method_call
+    def lookup(self, phone_number: str = "+1555", **kwargs):
+        raise ValueError("bad number")
+
+
+class AsyncTraced(AsyncBroker):
+    @log_method_call
+    async def search(self, query: str, **kwargs):
+        return await self.get("/search", params={"q": query})
+
+
+def mock_client(cls=httpx.Client):
+    return cls(transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})))
+
+
+def test_untraced_call_skips_all_work(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("tracing work done while tracing is off")
+
+    # The signature is resolved at decoration time, never per call
+    monkeypatch.setattr(tracing, "_query_locator", fail)
+    monkeypatch.setattr(tracing, "_emit", fail)
+    broker = Traced(base_url="https://testserver")
+    broker.session = mock_client()
+
+    assert broker.search("example.com").status_code == 200
+
+
+def test_tracer_receives_structured_record():
+    records = []
+    broker = Traced(base_url="https://testserver", call_tracer=records.append)
+    broker.session = mock_client()
+
+    broker.search("example.com")
+    broker.search(query="kw.example.com", limit=5)
+
+    assert [(r.connector, r.method, r.query, r.outcome, r.status_code) for r in records] == [
+        ("Traced", "search", "example.com", "ok", 200),
+        ("Traced", "search", "kw.example.com", "ok", 200),
+    ]
+    assert all(r.duration >= 0 for r in records)
+
+
+def test_tracer_records_failures_and_falls_back_to_first_argument():
+    records = []
+    broker = Traced(base_url="https://testserver", call_tracer=records.append)
+
+    with pytest.raises(ValueError):
+        broker.lookup()
+
+    assert records[0].query == "+1555"
+    assert records[0].outcome == "ValueError"
+    assert records[0].status_code is None
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_logger_receives_record_as_extra():
+    broker = Traced(base_url="https://testserver", enable_logging=True)
+    broker.session = mock_client()
+    handler = ListHandler()
+    broker.logger.addHandler(handler)
+    try:
+        broker.search("example.com")
+    finally:
+        broker.logger.removeHandler(handler)
+
+    record = next(r for r in handler.records if hasattr(r, "call_trace"))
+    assert record.call_trace.query == "example.com"
+    assert "search called with query: example.com" in record.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_async_method_duration_covers_await():
+    records = []
+    broker = AsyncTraced(base_url="https://testserver", call_tracer=records.append)
+    broker.session = mock_client(httpx.AsyncClient)
+
+    response = await broker.search("example.com")
+
+    assert response.status_code == 200
+    assert records[0].method == "search"
+    assert records[0].status_code == 200
@@ -1,7 +1,7 @@
 import httpx
 import pytest
 from unittest.mock import patch, MagicMock
-from pyapiary.api_connectors.flashpoint import FlashpointConnector
+from pyapiary.api_connectors.flashpoint import AsyncFlashpointConnector, FlashpointConnector
 
 def test_init_with_api_key():
     connector = FlashpointConnector(api_key="test_token")
@@ -42,4 +42,47 @@ def test_search_fraud(mock_post):
 
     assert isinstance(result, httpx.Response)
     assert result.json() == payload
-    mock_post.assert_called_once()
\ No newline at end of file
+    mock_post.assert_called_once()
+
+def test_download_media_image_uses_bearer_only_headers():
+    def handler(request):
+        assert request.url.params["asset_id"] == "asset-1"
+        assert request.headers["Authorization"] == "Bearer mock_token"
+        assert "content-type" not in request.headers
+        return httpx.Response(200, content=b"\x89PNG...", headers={"Content-Type": "image/png"})
+
+    connector = FlashpointConnector(api_key="mock_token")
+    connector.session = httpx.Client(transport=httpx.MockTransport(handler))
+    result = connector.download_media_image("asset-1")
+
+    with result.destination:
+        assert result.destination.read() == b"\x89PNG..."
+    assert result.content_type == "image/png"
+
+
+def test_download_media_image_forwards_request_options():
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, content=b"img")
+
+    connector = FlashpointConnector(api_key="mock_token")
+    connector.session = httpx.Client(transport=httpx.MockTransport(handler))
+    connector.download_media_image("asset-1", timeout=3.5, hash_algorithm=None).destination.close()
+    assert seen == [3.5]
+
+
+@pytest.mark.asyncio
+async def test_async_download_media_image_forwards_request_options():
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, content=b"img")
+
+    connector = AsyncFlashpointConnector(api_key="mock_token")
+    connector.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = await connector.download_media_image("asset-1", timeout=2.0)
+    result.destination.close()
+    assert seen == [2.0] and result.bytes_written == 3
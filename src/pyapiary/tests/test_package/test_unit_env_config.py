@@ -0,0 +1,67 @@
+import os
+import pytest
+from pyapiary import helpers
+from pyapiary.helpers import EnvConfig, clear_env_config_cache, combine_env_configs
+
+
+@pytest.fixture
+def dotenv_dir(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("PYAPIARY_TEST_KEY=from-dotenv\nPYAPIARY_SHADOWED=from-dotenv\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(helpers, "ENV_RECHECK_INTERVAL", 0.0)
+    clear_env_config_cache()
+    yield tmp_path
+    clear_env_config_cache()
+
+
+def test_env_config_overlays_environment(monkeypatch):
+    monkeypatch.setenv("PYAPIARY_SHADOWED", "from-env")
+    config = EnvConfig({"PYAPIARY_TEST_KEY": "from-dotenv", "PYAPIARY_SHADOWED": "from-dotenv"})
+
+    assert config["PYAPIARY_TEST_KEY"] == "from-dotenv"
+    assert config["PYAPIARY_SHADOWED"] == "from-env"
+    assert config.get("PYAPIARY_MISSING") is None
+    assert "PYAPIARY_TEST_KEY" in set(config)
+    monkeypatch.setenv("PYAPIARY_LATE", "1")
+    assert config["PYAPIARY_LATE"] == "1"
+    with pytest.raises(TypeError):
+        config["PYAPIARY_TEST_KEY"] = "x"
+
+
+def test_dotenv_parsed_once_and_shared(dotenv_dir, mocker):
+    stat = mocker.spy(helpers, "_dotenv_mtime")
+    parse = mocker.patch("dotenv.dotenv_values", wraps=__import__("dotenv").dotenv_values)
+
+    first = combine_env_configs()
+    second = combine_env_configs()
+
+    assert first is second
+    assert first["PYAPIARY_TEST_KEY"] == "from-dotenv"
+    assert parse.call_count == 1
+    assert stat.call_count == 2
+
+
+def test_dotenv_reparsed_when_mtime_changes(dotenv_dir):
+    first = combine_env_configs()
+    env_file = dotenv_dir / ".env"
+    env_file.write_text("PYAPIARY_TEST_KEY=changed\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = combine_env_configs()
+
+    assert second is not first
+    assert second["PYAPIARY_TEST_KEY"] == "changed"
+
+
+def test_dotenv_located_per_working_directory(dotenv_dir, monkeypatch):
+    other = dotenv_dir / "other"
+    other.mkdir()
+    (other / ".env").write_text("PYAPIARY_TEST_KEY=from-other\n")
+
+    first = combine_env_configs()
+    monkeypatch.chdir(other)
+    second = combine_env_configs()
+
+    assert first["PYAPIARY_TEST_KEY"] == "from-dotenv"
+    assert second["PYAPIARY_TEST_KEY"] == "from-other"
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+import pyapiary
+
+HEAVY = ("httpx", "tenacity", "dotenv", "elasticsearch", "pymongo")
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(pyapiary.__file__)))
+
+
+def loaded_after(statement):
+    probe = (
+        f"import sys\n{statement}\n"
+        f"import json; print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+    env = {**os.environ, "PYTHONPATH": SRC}
+    out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout))
+
+
+def test_package_import_loads_no_heavy_modules():
+    assert loaded_after("import pyapiary") == set()
+
+
+@pytest.mark.parametrize("statement, allowed", [
+    ("from pyapiary import ipqs", {"httpx", "tenacity", "dotenv"}),
+    ("from pyapiary import mongo", set()),
+    ("from pyapiary import elasticsearch", set()),
+    ("from pyapiary import splunk", set()),
+    ("from pyapiary import odbc", set()),
+])
+def test_submodule_imports_only_what_it_needs(statement, allowed):
+    loaded = loaded_after(statement)
+    assert loaded <= allowed
+    assert "pymongo" not in loaded and "elasticsearch" not in loaded
+
+
+def test_lazy_attributes_resolve():
+    assert pyapiary.ipqs.__name__ == "pyapiary.api_connectors.ipqs"
+    assert "mongo" in dir(pyapiary)
+    with pytest.raises(AttributeError):
+        pyapiary.not_a_connector
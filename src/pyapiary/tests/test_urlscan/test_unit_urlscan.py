@@ -36,4 +36,21 @@ def test_results(mock_get):
     result = connector.results("abc123")
 
     assert isinstance(result, httpx.Response)
-    assert result.json() == payload
\ No newline at end of file
+    assert result.json() == payload
+
+def test_download_dom_streams_to_path(tmp_path):
+    import hashlib
+
+    body = b"<html>" + b"x" * 100_000 + b"</html>"
+
+    def handler(request):
+        assert request.url.path == "/dom/abc123"
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/html"})
+
+    connector = URLScanConnector(api_key="test_key")
+    connector.session = httpx.Client(transport=httpx.MockTransport(handler))
+    result = connector.download_dom("abc123", destination=tmp_path / "dom.html")
+
+    assert (tmp_path / "dom.html").read_bytes() == body
+    assert result.bytes_written == len(body)
+    assert result.digest == hashlib.sha256(body).hexdigest()